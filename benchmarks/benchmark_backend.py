@@ -0,0 +1,58 @@
+"""
+Benchmark of the gmpy2 arithmetic backend against the pure Python backend for large moduli.
+
+Run with ``python benchmarks/benchmark_backend.py``; requires the gmpy extra.
+"""
+
+from __future__ import annotations
+
+import secrets
+
+import sympy
+from timing import measure
+
+from tno.mpc.encryption_schemes.shamir import ShamirSecretSharingScheme
+from tno.mpc.encryption_schemes.shamir.backend import GMPY2_BACKEND, PYTHON_BACKEND
+
+BIT_LENGTHS = [256, 512, 1024, 2048, 4096]
+NUMBER_OF_PARTIES = 10
+POLYNOMIAL_DEGREE = 4
+NUMBER_OF_SECRETS = 1_000
+
+
+def benchmark(bit_length: int) -> None:
+    """
+    Time sharing, multiplication and reconstruction of NUMBER_OF_SECRETS secrets with both
+    backends and print the speedup of gmpy2.
+
+    :param bit_length: bit length of the prime modulus of the scheme
+    """
+    modulus = sympy.nextprime(2 ** (bit_length - 1))
+    values = [secrets.randbelow(modulus) for _ in range(NUMBER_OF_SECRETS)]
+    timings = []
+    for backend in (PYTHON_BACKEND, GMPY2_BACKEND):
+        scheme = ShamirSecretSharingScheme(
+            modulus, NUMBER_OF_PARTIES, POLYNOMIAL_DEGREE, backend=backend
+        )
+        sharings = [scheme.share_secret(value) for value in values]
+        timings.append(
+            [
+                measure(lambda: [scheme.share_secret(value) for value in values]),
+                measure(lambda: [sharing * sharing for sharing in sharings]),
+                measure(lambda: [sharing.reconstruct_secret() for sharing in sharings]),
+            ]
+        )
+    share_time, mul_time, reconstruct_time = (
+        python / gmpy2 for python, gmpy2 in zip(*timings)
+    )
+    print(
+        f"{bit_length:>5} bits: gmpy2 speedup share_secret {share_time:.2f}x, "
+        f"__mul__ {mul_time:.2f}x, reconstruct_secret {reconstruct_time:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    if GMPY2_BACKEND is None:
+        raise SystemExit("gmpy2 is not installed, install the gmpy extra.")
+    for length in BIT_LENGTHS:
+        benchmark(length)
@@ -0,0 +1,71 @@
+"""
+Benchmark of the element-wise multiplication of Shamir shares with shares over the integers:
+multiplying the sharings one by one against multiplying vectors, which reduce the integer
+shares column-wise and compute the inverse of the scaling once per vector.
+
+Run with ``python benchmarks/benchmark_integer_conversion.py``.
+"""
+
+from __future__ import annotations
+
+import secrets
+import warnings
+
+import sympy
+from timing import measure
+
+from tno.mpc.encryption_schemes.shamir import (
+    IntegerSharesVector,
+    ShamirSecretSharingIntegers,
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+)
+
+PARAMETERS = [
+    # (bit length of the modulus, number of parties, polynomial degree)
+    (64, 5, 2),
+    (256, 10, 4),
+    (2048, 10, 4),
+]
+NUMBER_OF_SECRETS = 5_000
+
+
+def benchmark(bit_length: int, number_of_parties: int, polynomial_degree: int) -> None:
+    """
+    Time the element-wise product of NUMBER_OF_SECRETS Shamir sharings and integer sharings,
+    per pair of sharings and as vectors.
+
+    :param bit_length: bit length of the prime modulus of the scheme
+    :param number_of_parties: number of parties of both schemes
+    :param polynomial_degree: polynomial degree of both schemes
+    """
+    modulus = sympy.nextprime(2 ** (bit_length - 1))
+    scheme = ShamirSecretSharingScheme(modulus, number_of_parties, polynomial_degree)
+    integer_scheme = ShamirSecretSharingIntegers(
+        max_int=modulus,
+        number_of_parties=number_of_parties,
+        polynomial_degree=polynomial_degree,
+    )
+    values = [secrets.randbelow(modulus) for _ in range(NUMBER_OF_SECRETS)]
+    vector = ShamirSharesVector(scheme, scheme.share_secrets(values))
+    integer_vector = IntegerSharesVector(
+        integer_scheme, integer_scheme.share_secrets(values)
+    )
+    sharings = vector.to_shares()
+    integer_sharings = integer_vector.to_shares()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        loop_time = measure(lambda: [a * b for a, b in zip(integer_sharings, sharings)])
+        batch_time = measure(lambda: integer_vector * vector)
+    print(
+        f"{bit_length:>5} bits, n={number_of_parties:>2}, t={polynomial_degree}: "
+        f"loop {NUMBER_OF_SECRETS / loop_time:>8.0f} products/s, "
+        f"batch {NUMBER_OF_SECRETS / batch_time:>8.0f} products/s, "
+        f"speedup {loop_time / batch_time:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    for parameters in PARAMETERS:
+        benchmark(*parameters)
@@ -0,0 +1,66 @@
+"""
+Benchmark of the reconstruction of many sharings over the integers, e.g. of values bounded by a
+Paillier modulus: reconstructing the sharings one by one against a single batched
+reconstruct_many, over the integers and modulo a 2048-bit modulus.
+
+Run with ``python benchmarks/benchmark_integer_reconstruction.py``.
+"""
+
+from __future__ import annotations
+
+import secrets
+from functools import partial
+
+import sympy
+from timing import measure
+
+from tno.mpc.encryption_schemes.shamir import (
+    IntegerSharesVector,
+    ShamirSecretSharingIntegers,
+)
+
+PARAMETERS = [
+    # (number of parties, polynomial degree)
+    (5, 2),
+    (10, 4),
+    (30, 14),
+]
+MAX_INT = 2**2048
+MODULUS = sympy.nextprime(2**2047)
+NUMBER_OF_SECRETS = 2_000
+
+
+def benchmark(number_of_parties: int, polynomial_degree: int) -> None:
+    """
+    Time the reconstruction of NUMBER_OF_SECRETS sharings with reconstruct_secret in a loop and
+    with reconstruct_many in a single batch, over the integers and modulo MODULUS.
+
+    :param number_of_parties: number of parties of the scheme
+    :param polynomial_degree: polynomial degree of the scheme
+    """
+    scheme = ShamirSecretSharingIntegers(
+        max_int=MAX_INT,
+        number_of_parties=number_of_parties,
+        polynomial_degree=polynomial_degree,
+    )
+    values = [secrets.randbelow(MAX_INT) for _ in range(NUMBER_OF_SECRETS)]
+    shares = scheme.share_secrets(values)
+    sharings = IntegerSharesVector(scheme, shares).to_shares()
+
+    def reconstruct_one_by_one(modulus: int) -> list[int]:
+        return [sharing.reconstruct_secret(modulus) for sharing in sharings]
+
+    for modulus, label in ((0, "integers"), (MODULUS, "modulo  ")):
+        loop_time = measure(partial(reconstruct_one_by_one, modulus))
+        batch_time = measure(partial(scheme.reconstruct_many, shares, modulus=modulus))
+        print(
+            f"n={number_of_parties:>2}, t={polynomial_degree:>2}, {label}: "
+            f"loop {NUMBER_OF_SECRETS / loop_time:>8.0f} secrets/s, "
+            f"batch {NUMBER_OF_SECRETS / batch_time:>8.0f} secrets/s, "
+            f"speedup {loop_time / batch_time:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    for parameters in PARAMETERS:
+        benchmark(*parameters)
@@ -0,0 +1,70 @@
+"""
+Benchmark of the size of shares over the integers, and the time of multiplying and reconstructing
+them, against the number of parties and the multiplication depth, for the default randomness
+interval and the tight randomness interval.
+
+Run with ``python benchmarks/benchmark_integer_share_sizes.py``.
+"""
+
+from __future__ import annotations
+
+import secrets
+from functools import partial
+from operator import mul
+
+from timing import measure
+
+from tno.mpc.encryption_schemes.shamir import (
+    IntegerSharesVector,
+    ShamirSecretSharingIntegers,
+)
+
+NUMBER_OF_PARTIES = [5, 10, 20, 30]
+MAX_DEPTH = 3
+MAX_INT = 2**64
+NUMBER_OF_SECRETS = 200
+
+
+def benchmark(number_of_parties: int, tight_interval: bool) -> None:
+    """
+    Report the worst-case and actual share size and the scaling of products of up to
+    MAX_DEPTH + 1 vectors of NUMBER_OF_SECRETS sharings, and time the multiplication and the
+    reconstruction at every depth. The polynomial degree is chosen such that the product of
+    MAX_DEPTH + 1 sharings can still be reconstructed.
+
+    :param number_of_parties: number of parties of the scheme
+    :param tight_interval: whether the scheme samples from the tight randomness interval
+    """
+    degree = max((number_of_parties - 1) // (MAX_DEPTH + 1), 1)
+    scheme = ShamirSecretSharingIntegers(
+        max_int=MAX_INT,
+        number_of_parties=number_of_parties,
+        polynomial_degree=degree,
+        tight_interval=tight_interval,
+    )
+    values = [secrets.randbelow(MAX_INT) for _ in range(NUMBER_OF_SECRETS)]
+    fresh = IntegerSharesVector(scheme, scheme.share_secrets(values))
+
+    mode = "tight  " if tight_interval else "default"
+    vector = fresh
+    for depth in range(MAX_DEPTH + 1):
+        if depth:
+            multiplication_time = measure(partial(mul, vector, fresh))
+            vector = vector * fresh
+        else:
+            multiplication_time = 0.0
+        reconstruction_time = measure(vector.reconstruct_secrets)
+        print(
+            f"n={number_of_parties:>2}, t={degree}, {mode}, depth {depth}: "
+            f"worst case {vector.worst_case_bit_length:>6} bits, "
+            f"actual {vector.bit_length:>6} bits, "
+            f"scaling {vector.scaling_bit_length:>5} bits, "
+            f"multiply {multiplication_time * 1000:>8.2f} ms, "
+            f"reconstruct {reconstruction_time * 1000:>8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    for parties in NUMBER_OF_PARTIES:
+        for tight in (False, True):
+            benchmark(parties, tight)
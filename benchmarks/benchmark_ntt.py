@@ -0,0 +1,66 @@
+"""
+Benchmark of schemes with roots of unity as evaluation points against the default evaluation
+points for large numbers of parties: sharing with transforms against the Vandermonde matrix,
+and the computation of the Lagrange coefficients of a reconstruction set of t + 1 consecutive
+parties (without caching).
+
+Run with ``python benchmarks/benchmark_ntt.py``.
+"""
+
+from __future__ import annotations
+
+import secrets
+from functools import partial
+
+from timing import measure
+
+from tno.mpc.encryption_schemes.shamir import (
+    NTTShamirSecretSharingScheme,
+    ShamirSecretSharingScheme,
+)
+from tno.mpc.encryption_schemes.shamir.ntt import consecutive_weights, ntt_prime
+from tno.mpc.encryption_schemes.shamir.utils import compute_lagrange_coefficients
+
+BIT_LENGTH = 256
+NUMBER_OF_PARTIES = [16, 64, 256, 1024]
+NUMBER_OF_SECRETS = 50
+
+
+def benchmark(number_of_parties: int) -> None:
+    """
+    Time the sharing of NUMBER_OF_SECRETS secrets and the computation of the Lagrange
+    coefficients of the first t + 1 parties, for t = (n - 1) // 2.
+
+    :param number_of_parties: number of parties n
+    """
+    modulus = ntt_prime(BIT_LENGTH, max(NUMBER_OF_PARTIES))
+    degree = (number_of_parties - 1) // 2
+    scheme = ShamirSecretSharingScheme(modulus, number_of_parties, degree)
+    ntt_scheme = NTTShamirSecretSharingScheme(modulus, number_of_parties, degree)
+    values = [secrets.randbelow(modulus) for _ in range(NUMBER_OF_SECRETS)]
+    points = tuple(range(1, degree + 2))
+
+    sharing = [
+        measure(partial(sharing_scheme.share_secrets, values))
+        for sharing_scheme in (scheme, ntt_scheme)
+    ]
+    weights = [
+        measure(lambda: compute_lagrange_coefficients(modulus, points)),
+        measure(
+            lambda: consecutive_weights.__wrapped__(
+                modulus, ntt_scheme.root, degree + 1
+            )
+        ),
+    ]
+    print(
+        f"n = {number_of_parties:>4}, t = {degree:>3}: "
+        f"share_secrets {sharing[0] / sharing[1]:.2f}x faster "
+        f"({sharing[0]:.3f}s -> {sharing[1]:.3f}s), "
+        f"Lagrange coefficients {weights[0] / weights[1]:.2f}x faster "
+        f"({weights[0]:.4f}s -> {weights[1]:.4f}s)"
+    )
+
+
+if __name__ == "__main__":
+    for parties in NUMBER_OF_PARTIES:
+        benchmark(parties)
@@ -0,0 +1,66 @@
+"""
+Benchmark of the parallel sharing and reconstruction of large batches over worker processes
+against the batched operations of the scheme in a single process.
+
+Run with ``python benchmarks/benchmark_parallel.py``; the speedup depends on the number of
+available processors.
+"""
+
+from __future__ import annotations
+
+import os
+import secrets
+
+import sympy
+from timing import measure
+
+from tno.mpc.encryption_schemes.shamir import ShamirSecretSharingScheme
+from tno.mpc.encryption_schemes.shamir.parallel import ParallelShamirEngine
+
+PARAMETERS = [
+    # (bit length of the modulus, number of parties, polynomial degree)
+    (256, 10, 4),
+    (2048, 10, 4),
+    (4096, 20, 9),
+]
+NUMBER_OF_SECRETS = 20_000
+CHUNK_SIZE = 1_000
+
+
+def benchmark(bit_length: int, number_of_parties: int, polynomial_degree: int) -> None:
+    """
+    Time the sharing and reconstruction of NUMBER_OF_SECRETS secrets in a single process and
+    with a ParallelShamirEngine, and print the speedup of the engine.
+
+    :param bit_length: bit length of the prime modulus of the scheme
+    :param number_of_parties: number of parties of the scheme
+    :param polynomial_degree: polynomial degree of the scheme
+    """
+    modulus = sympy.nextprime(2 ** (bit_length - 1))
+    scheme = ShamirSecretSharingScheme(modulus, number_of_parties, polynomial_degree)
+    values = [secrets.randbelow(modulus) for _ in range(NUMBER_OF_SECRETS)]
+    shares = scheme.share_secrets(values)
+    with ParallelShamirEngine(scheme, chunk_size=CHUNK_SIZE) as engine:
+        # start the worker processes before timing
+        engine.share_secrets(values[: 2 * CHUNK_SIZE])
+        sharing = [
+            measure(lambda: scheme.share_secrets(values)),
+            measure(lambda: engine.share_secrets(values)),
+        ]
+        reconstruction = [
+            measure(lambda: scheme.reconstruct_many(shares)),
+            measure(lambda: engine.reconstruct_many(shares)),
+        ]
+    print(
+        f"{bit_length:>5} bits, n={number_of_parties:>2}, t={polynomial_degree}: "
+        f"sharing {sharing[0] / sharing[1]:.2f}x faster "
+        f"({sharing[0]:.3f}s -> {sharing[1]:.3f}s), "
+        f"reconstruction {reconstruction[0] / reconstruction[1]:.2f}x faster "
+        f"({reconstruction[0]:.3f}s -> {reconstruction[1]:.3f}s)"
+    )
+
+
+if __name__ == "__main__":
+    print(f"{os.cpu_count()} processors")
+    for parameters in PARAMETERS:
+        benchmark(*parameters)
@@ -0,0 +1,73 @@
+"""
+Benchmark of the batched sharing of many secrets with coefficients sampled by secrets.randbelow
+against coefficients sampled from a seeded SHAKE-256 stream.
+
+Run with ``python benchmarks/benchmark_randomness.py``.
+"""
+
+from __future__ import annotations
+
+import secrets
+from functools import partial
+
+import sympy
+from timing import measure
+
+from tno.mpc.encryption_schemes.shamir import ShamirSecretSharingScheme
+from tno.mpc.encryption_schemes.shamir.randomness import StreamRandomness
+
+PARAMETERS = [
+    # (bit length of the modulus, number of parties, polynomial degree)
+    (16, 5, 2),
+    (128, 5, 2),
+    (256, 10, 4),
+    (2048, 10, 4),
+]
+NUMBER_OF_SECRETS = 10_000
+
+
+def benchmark(bit_length: int, number_of_parties: int, polynomial_degree: int) -> None:
+    """
+    Time the sampling of the random coefficients for NUMBER_OF_SECRETS sharings, and the
+    sharing of NUMBER_OF_SECRETS secrets with share_secrets, for both randomness sources.
+
+    :param bit_length: bit length of the prime modulus of the scheme
+    :param number_of_parties: number of parties of the scheme
+    :param polynomial_degree: polynomial degree of the scheme
+    """
+    modulus = sympy.nextprime(2 ** (bit_length - 1))
+    default_scheme = ShamirSecretSharingScheme(
+        modulus, number_of_parties, polynomial_degree
+    )
+    stream_scheme = ShamirSecretSharingScheme(
+        modulus, number_of_parties, polynomial_degree, StreamRandomness()
+    )
+    values = [secrets.randbelow(modulus) for _ in range(NUMBER_OF_SECRETS)]
+
+    sampling = [
+        measure(
+            partial(
+                scheme.randomness.sample_matrix,
+                modulus,
+                polynomial_degree,
+                NUMBER_OF_SECRETS,
+            )
+        )
+        for scheme in (default_scheme, stream_scheme)
+    ]
+    sharing = [
+        measure(partial(scheme.share_secrets, values))
+        for scheme in (default_scheme, stream_scheme)
+    ]
+    print(
+        f"{bit_length:>5} bits, n={number_of_parties:>2}, t={polynomial_degree}: "
+        f"sampling {sampling[0] / sampling[1]:.2f}x faster "
+        f"({sampling[0]:.3f}s -> {sampling[1]:.3f}s), "
+        f"share_secrets {sharing[0] / sharing[1]:.2f}x faster "
+        f"({sharing[0]:.3f}s -> {sharing[1]:.3f}s)"
+    )
+
+
+if __name__ == "__main__":
+    for parameters in PARAMETERS:
+        benchmark(*parameters)
@@ -0,0 +1,86 @@
+"""
+Benchmark of the modular reductions for different sizes of the modulus: eager reduction after
+every operation against lazy reduction once per accumulated dot product, and the built-in
+reduction against Barrett reduction with a precomputed constant.
+
+Run with ``python benchmarks/benchmark_reduction.py``.
+"""
+
+from __future__ import annotations
+
+import secrets
+from functools import partial, reduce
+
+import sympy
+from timing import measure
+
+from tno.mpc.encryption_schemes.shamir import (
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+)
+from tno.mpc.encryption_schemes.shamir.backend import PYTHON_BACKEND, BarrettBackend
+
+BIT_LENGTHS = [64, 256, 1024, 2048, 4096, 8192]
+NUMBER_OF_PARTIES = 5
+POLYNOMIAL_DEGREE = 2
+NUMBER_OF_SECRETS = 1_000
+NUMBER_OF_VECTORS = 8
+
+
+def benchmark(bit_length: int) -> None:
+    """
+    Time a linear combination of NUMBER_OF_VECTORS vectors and an inner product of two vectors
+    of NUMBER_OF_SECRETS elements, with eager and lazy reduction, and the sharing of
+    NUMBER_OF_SECRETS secrets with the built-in and with Barrett reduction. All timings use
+    Python integers, such that only the reductions differ.
+
+    :param bit_length: bit length of the prime modulus of the scheme
+    """
+    modulus = sympy.nextprime(2 ** (bit_length - 1))
+    scheme = ShamirSecretSharingScheme(
+        modulus, NUMBER_OF_PARTIES, POLYNOMIAL_DEGREE, backend=PYTHON_BACKEND
+    )
+    barrett_scheme = ShamirSecretSharingScheme(
+        modulus,
+        NUMBER_OF_PARTIES,
+        POLYNOMIAL_DEGREE,
+        backend=BarrettBackend(modulus),
+    )
+    values = [secrets.randbelow(modulus) for _ in range(NUMBER_OF_SECRETS)]
+    vectors = [
+        ShamirSharesVector(scheme, scheme.share_secrets(values))
+        for _ in range(NUMBER_OF_VECTORS)
+    ]
+    coefficients = [secrets.randbelow(modulus) for _ in range(NUMBER_OF_VECTORS)]
+
+    combination = [
+        measure(
+            lambda: reduce(
+                lambda total, term: total + term,
+                (c * vector for c, vector in zip(coefficients, vectors)),
+            )
+        ),
+        measure(lambda: ShamirSharesVector.linear_combination(coefficients, vectors)),
+    ]
+    inner_product = [
+        measure(lambda: (vectors[0] * vectors[1]).sum()),
+        measure(lambda: vectors[0].dot(vectors[1])),
+    ]
+    sharing = [
+        measure(partial(sharing_scheme.share_secrets, values))
+        for sharing_scheme in (scheme, barrett_scheme)
+    ]
+    print(
+        f"{bit_length:>5} bits: "
+        f"linear combination {combination[0] / combination[1]:.2f}x faster "
+        f"({combination[0]:.3f}s -> {combination[1]:.3f}s), "
+        f"inner product {inner_product[0] / inner_product[1]:.2f}x faster "
+        f"({inner_product[0]:.3f}s -> {inner_product[1]:.3f}s), "
+        f"Barrett share_secrets {sharing[0] / sharing[1]:.2f}x faster "
+        f"({sharing[0]:.3f}s -> {sharing[1]:.3f}s)"
+    )
+
+
+if __name__ == "__main__":
+    for length in BIT_LENGTHS:
+        benchmark(length)
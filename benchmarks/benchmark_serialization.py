@@ -0,0 +1,90 @@
+"""
+Benchmark of the compact binary wire format against the dictionary-based serialization, in
+message size and in encoding and decoding throughput.
+
+Run with ``python benchmarks/benchmark_serialization.py``.
+"""
+
+from __future__ import annotations
+
+import secrets
+import timeit
+
+import ormsgpack
+import sympy
+
+from tno.mpc.communication import Serialization
+from tno.mpc.communication.serialization import DEFAULT_PACK_OPTION
+
+from tno.mpc.encryption_schemes.shamir import (
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+)
+from tno.mpc.encryption_schemes.shamir.binary_serialization import decode, encode
+
+PARAMETERS = [
+    # (bit length of the modulus, number of parties, polynomial degree)
+    (16, 5, 2),
+    (128, 5, 2),
+    (2048, 10, 4),
+]
+NUMBER_OF_SECRETS = 1_000
+REPETITIONS = 3
+# the shares are keyed by party id
+PACK_OPTION = DEFAULT_PACK_OPTION | ormsgpack.OPT_NON_STR_KEYS
+
+
+def benchmark(bit_length: int, number_of_parties: int, polynomial_degree: int) -> None:
+    """
+    Compare the size and the throughput of the encoding of NUMBER_OF_SECRETS sharings as
+    (packed) dictionaries with that of their encoding as a single columnar vector.
+
+    :param bit_length: bit length of the prime modulus of the scheme
+    :param number_of_parties: number of parties of the scheme
+    :param polynomial_degree: polynomial degree of the scheme
+    """
+    modulus = sympy.nextprime(2 ** (bit_length - 1))
+    scheme = ShamirSecretSharingScheme(modulus, number_of_parties, polynomial_degree)
+    values = [secrets.randbelow(modulus) for _ in range(NUMBER_OF_SECRETS)]
+    vector = ShamirSharesVector(scheme, scheme.share_secrets(values))
+    sharings = vector.to_shares()
+
+    def pack_dicts() -> list[bytes]:
+        return [
+            Serialization.pack(
+                sharing.serialize(),
+                "bench",
+                use_pickle=False,
+                option=PACK_OPTION,
+            )
+            for sharing in sharings
+        ]
+
+    packed = pack_dicts()
+    encoded = encode(vector)
+    dict_size = sum(len(message) for message in packed)
+
+    dict_time = min(timeit.repeat(pack_dicts, number=1, repeat=REPETITIONS)) + min(
+        timeit.repeat(
+            lambda: [
+                Serialization.unpack(message, option=ormsgpack.OPT_NON_STR_KEYS)
+                for message in packed
+            ],
+            number=1,
+            repeat=REPETITIONS,
+        )
+    )
+    binary_time = min(
+        timeit.repeat(lambda: encode(vector), number=1, repeat=REPETITIONS)
+    ) + min(timeit.repeat(lambda: decode(encoded), number=1, repeat=REPETITIONS))
+    print(
+        f"{bit_length:>5} bits, n={number_of_parties:>2}, t={polynomial_degree}: "
+        f"dict {dict_size:>10} bytes, {NUMBER_OF_SECRETS / dict_time:>9.0f} sharings/s; "
+        f"binary {len(encoded):>9} bytes, {NUMBER_OF_SECRETS / binary_time:>9.0f} sharings/s; "
+        f"size {dict_size / len(encoded):.1f}x smaller, {dict_time / binary_time:.1f}x faster"
+    )
+
+
+if __name__ == "__main__":
+    for parameters in PARAMETERS:
+        benchmark(*parameters)
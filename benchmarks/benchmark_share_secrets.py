@@ -0,0 +1,112 @@
+"""
+Benchmark of the batched sharing of many secrets against sharing them one at a time, both in a
+prime field and over the integers.
+
+Run with ``python benchmarks/benchmark_share_secrets.py``.
+"""
+
+from __future__ import annotations
+
+import secrets
+import timeit
+
+import sympy
+
+from tno.mpc.encryption_schemes.shamir import (
+    ShamirSecretSharingIntegers,
+    ShamirSecretSharingScheme,
+)
+
+PARAMETERS = [
+    # (bit length of the modulus, number of parties, polynomial degree)
+    (16, 5, 2),
+    (128, 5, 2),
+    (256, 10, 4),
+    (2048, 10, 4),
+]
+INTEGER_PARAMETERS = [
+    # (number of parties, polynomial degree), with a 2048-bit max_int
+    (5, 2),
+    (10, 4),
+    (30, 14),
+]
+INTEGER_MAX_INT = 2**2048
+NUMBER_OF_SECRETS = 10_000
+REPETITIONS = 3
+
+
+def benchmark(bit_length: int, number_of_parties: int, polynomial_degree: int) -> None:
+    """
+    Time the sharing of NUMBER_OF_SECRETS secrets with share_secret in a loop and with
+    share_secrets in a single batch and print the throughput of both.
+
+    :param bit_length: bit length of the prime modulus of the scheme
+    :param number_of_parties: number of parties of the scheme
+    :param polynomial_degree: polynomial degree of the scheme
+    """
+    modulus = sympy.nextprime(2 ** (bit_length - 1))
+    scheme = ShamirSecretSharingScheme(modulus, number_of_parties, polynomial_degree)
+    values = [secrets.randbelow(modulus) for _ in range(NUMBER_OF_SECRETS)]
+    _ = scheme.van_der_monde
+
+    loop_time = min(
+        timeit.repeat(
+            lambda: [scheme.share_secret(value) for value in values],
+            number=1,
+            repeat=REPETITIONS,
+        )
+    )
+    batch_time = min(
+        timeit.repeat(
+            lambda: scheme.share_secrets(values), number=1, repeat=REPETITIONS
+        )
+    )
+    print(
+        f"{bit_length:>5} bits, n={number_of_parties:>2}, t={polynomial_degree}: "
+        f"loop {NUMBER_OF_SECRETS / loop_time:>10.0f} secrets/s, "
+        f"batch {NUMBER_OF_SECRETS / batch_time:>10.0f} secrets/s, "
+        f"speedup {loop_time / batch_time:.2f}x"
+    )
+
+
+def benchmark_integers(number_of_parties: int, polynomial_degree: int) -> None:
+    """
+    Time the sharing of NUMBER_OF_SECRETS secrets over the integers with share_secret in a loop
+    and with share_secrets in a single batch and print the throughput of both.
+
+    :param number_of_parties: number of parties of the scheme
+    :param polynomial_degree: polynomial degree of the scheme
+    """
+    scheme = ShamirSecretSharingIntegers(
+        max_int=INTEGER_MAX_INT,
+        number_of_parties=number_of_parties,
+        polynomial_degree=polynomial_degree,
+    )
+    values = [secrets.randbelow(INTEGER_MAX_INT) for _ in range(NUMBER_OF_SECRETS)]
+    _ = scheme.van_der_monde
+
+    loop_time = min(
+        timeit.repeat(
+            lambda: [scheme.share_secret(value) for value in values],
+            number=1,
+            repeat=REPETITIONS,
+        )
+    )
+    batch_time = min(
+        timeit.repeat(
+            lambda: scheme.share_secrets(values), number=1, repeat=REPETITIONS
+        )
+    )
+    print(
+        f"integers, n={number_of_parties:>2}, t={polynomial_degree:>2}: "
+        f"loop {NUMBER_OF_SECRETS / loop_time:>10.0f} secrets/s, "
+        f"batch {NUMBER_OF_SECRETS / batch_time:>10.0f} secrets/s, "
+        f"speedup {loop_time / batch_time:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    for parameters in PARAMETERS:
+        benchmark(*parameters)
+    for integer_parameters in INTEGER_PARAMETERS:
+        benchmark_integers(*integer_parameters)
@@ -0,0 +1,64 @@
+"""
+Benchmark of the NumPy backend against the pure Python backend for vectors of shares over a
+small prime field.
+
+Run with ``python benchmarks/benchmark_small_field.py``; requires the numpy extra.
+"""
+
+from __future__ import annotations
+
+import secrets
+
+from timing import measure
+
+from tno.mpc.encryption_schemes.shamir import (
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+)
+from tno.mpc.encryption_schemes.shamir.backend import NUMPY_BACKEND, PYTHON_BACKEND
+
+MODULI = [10657, 2**31 - 1]
+NUMBER_OF_PARTIES = 5
+POLYNOMIAL_DEGREE = 2
+VECTOR_LENGTH = 100_000
+
+
+def benchmark(modulus: int) -> None:
+    """
+    Time the sharing, addition, multiplication and reconstruction of vectors of VECTOR_LENGTH
+    elements with both backends and print the speedup of NumPy.
+
+    :param modulus: prime modulus of the scheme
+    """
+    values = [secrets.randbelow(modulus) for _ in range(VECTOR_LENGTH)]
+    timings = []
+    for backend in (PYTHON_BACKEND, NUMPY_BACKEND):
+        scheme = ShamirSecretSharingScheme(
+            modulus, NUMBER_OF_PARTIES, POLYNOMIAL_DEGREE, backend=backend
+        )
+        vector = ShamirSharesVector(scheme, scheme.share_secrets(values))
+        product = vector * vector
+        timings.append(
+            [
+                measure(lambda: scheme.share_secrets(values)),
+                measure(lambda: vector + vector),
+                measure(lambda: vector * vector),
+                measure(product.reconstruct_secrets),
+            ]
+        )
+    print(
+        f"modulus {modulus:>10}: NumPy speedup "
+        + ", ".join(
+            f"{name} {python / numpy:.1f}x"
+            for name, python, numpy in zip(
+                ("share_secrets", "add", "mul", "reconstruct"), *timings
+            )
+        )
+    )
+
+
+if __name__ == "__main__":
+    if NUMPY_BACKEND is None:
+        raise SystemExit("numpy is not installed, install the numpy extra.")
+    for modulus_ in MODULI:
+        benchmark(modulus_)
@@ -0,0 +1,72 @@
+"""
+Benchmark of the verification of verifiable secret sharings: the amortized cost per share of
+checking the shares of a party one by one against a single batched verification (a random
+linear combination and one multi-exponentiation), for Feldman and Pedersen commitments in a
+2048-bit group of a 256-bit prime order.
+
+Run with ``python benchmarks/benchmark_vss.py``.
+"""
+
+from __future__ import annotations
+
+import secrets
+
+import sympy
+from timing import measure
+
+from tno.mpc.encryption_schemes.shamir import ShamirSecretSharingScheme
+from tno.mpc.encryption_schemes.shamir.vss import VerifiableSecretSharing
+
+MODULUS = sympy.nextprime(2**255)
+NUMBER_OF_PARTIES = 10
+POLYNOMIAL_DEGREE = 4
+NUMBER_OF_SHARINGS = [1, 10, 100, 1000]
+
+
+def benchmark(number_of_sharings: int, pedersen: bool) -> None:
+    """
+    Time the verification of the shares of the last party of number_of_sharings sharings, one by
+    one and batched, and the batched verification of the shares of all parties.
+
+    :param number_of_sharings: number of sharings
+    :param pedersen: whether to use Pedersen commitments instead of Feldman commitments
+    """
+    scheme = ShamirSecretSharingScheme(MODULUS, NUMBER_OF_PARTIES, POLYNOMIAL_DEGREE)
+    vss = VerifiableSecretSharing(scheme, pedersen)
+    values = [secrets.randbelow(MODULUS) for _ in range(number_of_sharings)]
+    shares, blinding_shares, commitments = vss.share_secrets(values)
+    party = NUMBER_OF_PARTIES
+    blinding_column = None if blinding_shares is None else blinding_shares[party]
+
+    loop_time = measure(
+        lambda: [
+            vss.verify_share(
+                party,
+                share,
+                commitment,
+                None if blinding_column is None else blinding_column[j],
+            )
+            for j, (share, commitment) in enumerate(zip(shares[party], commitments))
+        ]
+    )
+    batch_time = measure(
+        lambda: vss.verify_shares(party, shares[party], commitments, blinding_column)
+    )
+    all_time = measure(
+        lambda: vss.verify_sharings(shares, commitments, blinding_shares)
+    )
+    kind = "Pedersen" if pedersen else "Feldman "
+    print(
+        f"{kind}, {number_of_sharings:>4} sharings: "
+        f"one by one {loop_time / number_of_sharings * 1000:>6.3f} ms/share, "
+        f"batched {batch_time / number_of_sharings * 1000:>6.3f} ms/share "
+        f"(speedup {loop_time / batch_time:>5.2f}x), "
+        f"all {NUMBER_OF_PARTIES} parties batched "
+        f"{all_time / (number_of_sharings * NUMBER_OF_PARTIES) * 1000:>6.3f} ms/share"
+    )
+
+
+if __name__ == "__main__":
+    for pedersen_commitments in (False, True):
+        for sharings in NUMBER_OF_SHARINGS:
+            benchmark(sharings, pedersen_commitments)
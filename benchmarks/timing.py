@@ -0,0 +1,21 @@
+"""
+Timing helper shared by the benchmarks.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+
+REPETITIONS = 3
+
+
+def measure(function: Callable[[], object], repetitions: int = REPETITIONS) -> float:
+    """
+    Best time of a number of repetitions of a function.
+
+    :param function: function to be timed
+    :param repetitions: number of times the function is timed
+    :return: the best time in seconds
+    """
+    return min(timeit.repeat(function, number=1, repeat=repetitions))
@@ -5,6 +5,18 @@ Root imports for the tno.mpc.encryption_schemes.shamir package.
 # Explicit re-export of all functionalities, such that they can be imported properly. Following
 # https://www.python.org/dev/peps/pep-0484/#stub-files and
 # https://mypy.readthedocs.io/en/stable/command_line.html#cmdoption-mypy-no-implicit-reexport
+from tno.mpc.encryption_schemes.shamir.integer_shares_vector import (
+    IntegerSharesVector as IntegerSharesVector,
+)
+from tno.mpc.encryption_schemes.shamir.ntt import (
+    NTTShamirSecretSharingScheme as NTTShamirSecretSharingScheme,
+)
+from tno.mpc.encryption_schemes.shamir.packed_shamir import (
+    PackedShamirSecretSharingScheme as PackedShamirSecretSharingScheme,
+)
+from tno.mpc.encryption_schemes.shamir.packed_shamir import (
+    PackedShamirShares as PackedShamirShares,
+)
 from tno.mpc.encryption_schemes.shamir.shamir import (
     ShamirSecretSharingScheme as ShamirSecretSharingScheme,
 )
@@ -15,5 +27,8 @@ from tno.mpc.encryption_schemes.shamir.shamir_secret_sharing_integers import (
 from tno.mpc.encryption_schemes.shamir.shamir_secret_sharing_integers import (
     ShamirSecretSharingIntegers as ShamirSecretSharingIntegers,
 )
+from tno.mpc.encryption_schemes.shamir.shamir_shares_vector import (
+    ShamirSharesVector as ShamirSharesVector,
+)
 
 __version__ = "1.3.2"
@@ -0,0 +1,476 @@
+"""
+Backends for the modular arithmetic of Shamir secret sharing.
+
+The pure Python backend works with Python integers. When gmpy2 is installed (the gmpy extra),
+the gmpy2 backend converts the operands that are reused by a scheme (such as the Vandermonde
+matrix, the Lagrange coefficients and the modulus) to gmpy2.mpz, such that the products and
+modular reductions are computed by GMP. This pays off for large moduli; for small moduli the
+conversions outweigh the gain, so by default gmpy2 is only used from GMPY2_MIN_BITS bits on.
+When NumPy is installed (the numpy extra), moduli below NUMPY_MAX_MODULUS use the NumPy
+backend instead, which performs the batched operations (the evaluation of many sharing
+polynomials, batched reconstruction and element-wise arithmetic on vectors of shares) as
+vectorized int64 operations. All products of two residues then fit in 62 bits, so every term
+is reduced before it can overflow.
+
+The Barrett backend is bound to a single modulus, for which it precomputes the Barrett constant
+once, such that every reduction costs two multiplications and some shifts instead of a division.
+In CPython the built-in reduction is faster up to several thousands of bits, so it is only
+selected, in absence of gmpy2, from BARRETT_MIN_BITS bits on.
+
+All backends reduce lazily: products are accumulated over a full dot product (for example the
+evaluation of a sharing polynomial or an interpolation sum) and reduced once.
+
+All results are returned as Python integers, hence shares remain Python integers in all
+backends.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from operator import add, mul, sub
+
+from tno.mpc.encryption_schemes.utils import USE_GMPY2
+
+if USE_GMPY2:
+    import gmpy2
+
+# Check to see if numpy is available
+try:
+    import numpy as np
+    import numpy.typing as npt
+
+    NUMPY_INSTALLED = True
+except ModuleNotFoundError:
+    NUMPY_INSTALLED = False
+
+GMPY2_MIN_BITS = 1024
+BARRETT_MIN_BITS = 8192
+# Extra bits of precision of the Barrett constant, such that sums of up to 2**BARRETT_SLACK_BITS
+# products of two residues are reduced correctly
+BARRETT_SLACK_BITS = 64
+NUMPY_MAX_MODULUS = 2**31
+# Batches with fewer elements are handled in pure Python, as the conversion from and to NumPy
+# arrays outweighs the gain
+NUMPY_MIN_SIZE = 32
+
+
+class PythonBackend:
+    """
+    Modular arithmetic with Python integers.
+    """
+
+    name = "python"
+
+    def convert(self, value: int) -> int:
+        """
+        Convert an integer to the representation of this backend, for operands that are reused
+        in many operations.
+
+        :param value: integer to be converted
+        :return: the integer in the representation of this backend
+        """
+        return value
+
+    def matrix_mod(
+        self,
+        rows: Sequence[Sequence[int]],
+        columns: Iterable[Sequence[int]],
+        modulus: int,
+    ) -> list[list[int]]:
+        """
+        Compute the product of a matrix, given by its rows, with a matrix, given by its columns,
+        with a single modular reduction per entry. For example, the evaluation of many
+        polynomials (the columns) in the points of a Vandermonde matrix (the rows).
+
+        :param rows: rows of the first matrix, preferably converted to this backend
+        :param columns: columns of the second matrix
+        :param modulus: modulus of the result, preferably converted to this backend
+        :return: the rows of the product modulo the modulus
+        """
+        columns = list(columns)
+        return [
+            [sum(map(mul, row, column)) % modulus for column in columns] for row in rows
+        ]
+
+    def elementwise_mod(
+        self,
+        left: Sequence[int],
+        right: Sequence[int] | int,
+        operator: Callable[[int, int], int],
+        modulus: int,
+    ) -> list[int]:
+        """
+        Apply an operation element-wise to two vectors, or to a vector and an integer, and
+        reduce the results modulo the modulus.
+
+        :param left: first vector
+        :param right: second vector of the same length, or an integer
+        :param operator: element-wise operation, e.g. operator.add
+        :param modulus: modulus of the result, preferably converted to this backend
+        :return: the results modulo the modulus
+        """
+        if isinstance(right, int):
+            return [operator(value, right) % modulus for value in left]
+        return [operator(value, other) % modulus for value, other in zip(left, right)]
+
+    def dot_mod(self, left: Iterable[int], right: Iterable[int], modulus: int) -> int:
+        """
+        Compute the dot product of two vectors with a single modular reduction at the end.
+
+        :param left: first vector
+        :param right: second vector
+        :param modulus: modulus of the result, preferably converted to this backend
+        :return: the dot product modulo the modulus
+        """
+        return int(sum(map(mul, left, right)) % modulus)
+
+    def mul_mod(self, left: int, right: int, modulus: int) -> int:
+        """
+        Compute the product of two integers modulo the modulus.
+
+        :param left: first factor
+        :param right: second factor
+        :param modulus: modulus of the result, preferably converted to this backend
+        :return: the product modulo the modulus
+        """
+        return int(left * right % modulus)
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        """
+        Compute base ** exponent modulo the modulus.
+
+        :param base: base
+        :param exponent: exponent
+        :param modulus: modulus
+        :return: the modular exponentiation
+        """
+        return pow(base, exponent, modulus)
+
+    def invert(self, value: int, modulus: int) -> int:
+        """
+        Compute the inverse of a value modulo the modulus.
+
+        :param value: value to be inverted, coprime to the modulus
+        :param modulus: modulus
+        :return: the modular inverse of the value
+        """
+        return pow(value, -1, modulus)
+
+
+class Gmpy2Backend(PythonBackend):
+    """
+    Modular arithmetic with gmpy2.mpz, for use with large moduli.
+    """
+
+    name = "gmpy2"
+
+    def convert(self, value: int) -> int:
+        """
+        Convert an integer to the representation of this backend, for operands that are reused
+        in many operations.
+
+        :param value: integer to be converted
+        :return: the integer as gmpy2.mpz
+        """
+        return gmpy2.mpz(value)
+
+    def matrix_mod(
+        self,
+        rows: Sequence[Sequence[int]],
+        columns: Iterable[Sequence[int]],
+        modulus: int,
+    ) -> list[list[int]]:
+        """
+        Compute the product of a matrix, given by its rows, with a matrix, given by its columns,
+        with a single modular reduction per entry. The columns are converted to gmpy2.mpz once,
+        as every column is multiplied with all rows.
+
+        :param rows: rows of the first matrix, preferably converted to this backend
+        :param columns: columns of the second matrix
+        :param modulus: modulus of the result, preferably converted to this backend
+        :return: the rows of the product modulo the modulus
+        """
+        converted = [list(map(gmpy2.mpz, column)) for column in columns]
+        return [
+            [int(sum(map(mul, row, column)) % modulus) for column in converted]
+            for row in rows
+        ]
+
+    def elementwise_mod(
+        self,
+        left: Sequence[int],
+        right: Sequence[int] | int,
+        operator: Callable[[int, int], int],
+        modulus: int,
+    ) -> list[int]:
+        """
+        Apply an operation element-wise to two vectors, or to a vector and an integer, and
+        reduce the results modulo the modulus. The results are converted back to Python
+        integers.
+
+        :param left: first vector
+        :param right: second vector of the same length, or an integer
+        :param operator: element-wise operation, e.g. operator.add
+        :param modulus: modulus of the result, preferably converted to this backend
+        :return: the results modulo the modulus
+        """
+        if isinstance(right, int):
+            return [int(operator(value, right) % modulus) for value in left]
+        return [
+            int(operator(value, other) % modulus) for value, other in zip(left, right)
+        ]
+
+    def mul_mod(self, left: int, right: int, modulus: int) -> int:
+        """
+        Compute the product of two integers modulo the modulus.
+
+        :param left: first factor
+        :param right: second factor
+        :param modulus: modulus of the result, preferably converted to this backend
+        :return: the product modulo the modulus
+        """
+        return int(gmpy2.mpz(left) * right % modulus)
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        """
+        Compute base ** exponent modulo the modulus.
+
+        :param base: base
+        :param exponent: exponent
+        :param modulus: modulus
+        :return: the modular exponentiation
+        """
+        return int(gmpy2.powmod(base, exponent, modulus))
+
+    def invert(self, value: int, modulus: int) -> int:
+        """
+        Compute the inverse of a value modulo the modulus.
+
+        :param value: value to be inverted, coprime to the modulus
+        :param modulus: modulus
+        :return: the modular inverse of the value
+        """
+        return int(gmpy2.invert(value, modulus))
+
+
+class NumpyBackend(PythonBackend):
+    """
+    Modular arithmetic with vectorized NumPy int64 operations, for moduli below
+    NUMPY_MAX_MODULUS.
+    """
+
+    name = "numpy"
+
+    _ufuncs: dict[Callable[[int, int], int], Callable[..., npt.NDArray[np.int64]]] = (
+        {add: np.add, sub: np.subtract, mul: np.multiply} if NUMPY_INSTALLED else {}
+    )
+
+    @staticmethod
+    def _to_array(values: Sequence[int], modulus: int) -> npt.NDArray[np.int64]:
+        """
+        Convert integers to an array of their residues modulo the modulus.
+
+        :param values: integers to be converted
+        :param modulus: modulus, below NUMPY_MAX_MODULUS
+        :return: array with the residues of the integers
+        """
+        try:
+            array = np.array(values, dtype=np.int64)
+        except OverflowError:
+            array = np.array([value % modulus for value in values], dtype=np.int64)
+        return np.remainder(array, modulus)
+
+    def matrix_mod(
+        self,
+        rows: Sequence[Sequence[int]],
+        columns: Iterable[Sequence[int]],
+        modulus: int,
+    ) -> list[list[int]]:
+        """
+        Compute the product of a matrix, given by its rows, with a matrix, given by its columns,
+        with a single modular reduction per entry. The entries of the product are accumulated in
+        a vectorized manner over all columns at once.
+
+        :param rows: rows of the first matrix
+        :param columns: columns of the second matrix
+        :param modulus: modulus of the result, below NUMPY_MAX_MODULUS
+        :return: the rows of the product modulo the modulus
+        """
+        columns = list(columns)
+        if len(columns) < NUMPY_MIN_SIZE or not rows:
+            return super().matrix_mod(rows, columns, modulus)
+        left = self._to_array([value for row in rows for value in row], modulus)
+        left = left.reshape(len(rows), -1)
+        right = self._to_array(
+            [value for column in columns for value in column], modulus
+        ).reshape(len(columns), -1)
+        result = np.zeros((len(rows), len(columns)), dtype=np.int64)
+        for j in range(left.shape[1]):
+            # both factors are residues, so every product fits in 62 bits
+            result += np.outer(left[:, j], right[:, j])
+            np.remainder(result, modulus, out=result)
+        return result.tolist()
+
+    def elementwise_mod(
+        self,
+        left: Sequence[int],
+        right: Sequence[int] | int,
+        operator: Callable[[int, int], int],
+        modulus: int,
+    ) -> list[int]:
+        """
+        Apply an operation element-wise to two vectors, or to a vector and an integer, and
+        reduce the results modulo the modulus. Additions, subtractions and multiplications of
+        large vectors are vectorized.
+
+        :param left: first vector
+        :param right: second vector of the same length, or an integer
+        :param operator: element-wise operation, e.g. operator.add
+        :param modulus: modulus of the result, below NUMPY_MAX_MODULUS
+        :return: the results modulo the modulus
+        """
+        if operator not in self._ufuncs or len(left) < NUMPY_MIN_SIZE:
+            return super().elementwise_mod(left, right, operator, modulus)
+        other = (
+            right % modulus
+            if isinstance(right, int)
+            else self._to_array(right, modulus)
+        )
+        result = self._ufuncs[operator](self._to_array(left, modulus), other)
+        return np.remainder(result, modulus).tolist()  # type: ignore[no-any-return]
+
+
+class BarrettBackend(PythonBackend):
+    """
+    Modular arithmetic with Python integers and Barrett reduction modulo a fixed modulus. Values
+    modulo other moduli, or outside of the range of the precomputed constant, are reduced with
+    the built-in reduction.
+    """
+
+    name = "barrett"
+
+    def __init__(self, modulus: int) -> None:
+        """
+        Precompute the Barrett constant of the modulus.
+
+        :param modulus: modulus of the arithmetic, at least 2
+        :raise ValueError: In case the modulus is smaller than 2.
+        """
+        if modulus < 2:
+            raise ValueError("The modulus should be at least 2.")
+        self.modulus = modulus
+        self._shift = modulus.bit_length()
+        self._bound = 1 << (2 * self._shift + BARRETT_SLACK_BITS)
+        self._mu = self._bound // modulus
+
+    def reduce(self, value: int, modulus: int) -> int:
+        """
+        Reduce a value modulo the modulus, with Barrett reduction if the modulus is the modulus
+        of this backend.
+
+        :param value: value to be reduced
+        :param modulus: modulus of the result
+        :return: the value modulo the modulus
+        """
+        if modulus != self.modulus or not 0 <= value < self._bound:
+            return value % modulus
+        # The estimated quotient is at most two smaller than the actual quotient
+        quotient = ((value >> (self._shift - 1)) * self._mu) >> (
+            self._shift + BARRETT_SLACK_BITS + 1
+        )
+        value -= quotient * modulus
+        while value >= modulus:
+            value -= modulus
+        return value
+
+    def matrix_mod(
+        self,
+        rows: Sequence[Sequence[int]],
+        columns: Iterable[Sequence[int]],
+        modulus: int,
+    ) -> list[list[int]]:
+        """
+        Compute the product of a matrix, given by its rows, with a matrix, given by its columns,
+        with a single Barrett reduction per entry.
+
+        :param rows: rows of the first matrix
+        :param columns: columns of the second matrix
+        :param modulus: modulus of the result
+        :return: the rows of the product modulo the modulus
+        """
+        columns = list(columns)
+        reduce = self.reduce
+        return [
+            [reduce(sum(map(mul, row, column)), modulus) for column in columns]
+            for row in rows
+        ]
+
+    def elementwise_mod(
+        self,
+        left: Sequence[int],
+        right: Sequence[int] | int,
+        operator: Callable[[int, int], int],
+        modulus: int,
+    ) -> list[int]:
+        """
+        Apply an operation element-wise to two vectors, or to a vector and an integer, and
+        reduce the results modulo the modulus with Barrett reduction.
+
+        :param left: first vector
+        :param right: second vector of the same length, or an integer
+        :param operator: element-wise operation, e.g. operator.add
+        :param modulus: modulus of the result
+        :return: the results modulo the modulus
+        """
+        reduce = self.reduce
+        if isinstance(right, int):
+            return [reduce(operator(value, right), modulus) for value in left]
+        return [
+            reduce(operator(value, other), modulus) for value, other in zip(left, right)
+        ]
+
+    def dot_mod(self, left: Iterable[int], right: Iterable[int], modulus: int) -> int:
+        """
+        Compute the dot product of two vectors with a single Barrett reduction at the end.
+
+        :param left: first vector
+        :param right: second vector
+        :param modulus: modulus of the result
+        :return: the dot product modulo the modulus
+        """
+        return self.reduce(sum(map(mul, left, right)), modulus)
+
+    def mul_mod(self, left: int, right: int, modulus: int) -> int:
+        """
+        Compute the product of two integers modulo the modulus with Barrett reduction.
+
+        :param left: first factor
+        :param right: second factor
+        :param modulus: modulus of the result
+        :return: the product modulo the modulus
+        """
+        return self.reduce(left * right, modulus)
+
+
+PYTHON_BACKEND = PythonBackend()
+GMPY2_BACKEND: PythonBackend | None = Gmpy2Backend() if USE_GMPY2 else None
+NUMPY_BACKEND: PythonBackend | None = NumpyBackend() if NUMPY_INSTALLED else None
+
+
+def select_backend(modulus: int) -> PythonBackend:
+    """
+    Select the fastest available backend for arithmetic modulo the given modulus.
+
+    :param modulus: modulus of the arithmetic
+    :return: the NumPy backend if NumPy is installed and the modulus is below
+        NUMPY_MAX_MODULUS, the gmpy2 backend if gmpy2 is installed and the modulus has at least
+        GMPY2_MIN_BITS bits, a Barrett backend for the modulus if gmpy2 is not installed and the
+        modulus has at least BARRETT_MIN_BITS bits, the pure Python backend otherwise
+    """
+    if NUMPY_BACKEND is not None and modulus < NUMPY_MAX_MODULUS:
+        return NUMPY_BACKEND
+    if GMPY2_BACKEND is not None and modulus.bit_length() >= GMPY2_MIN_BITS:
+        return GMPY2_BACKEND
+    if GMPY2_BACKEND is None and modulus.bit_length() >= BARRETT_MIN_BITS:
+        return BarrettBackend(modulus)
+    return PYTHON_BACKEND
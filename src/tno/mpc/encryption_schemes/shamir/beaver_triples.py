@@ -0,0 +1,232 @@
+"""
+Beaver-triple preprocessing and online multiplication of Shamir sharings.
+
+In the offline phase, Shamir-shared triples $(a, b, c = ab)$ are generated in bulk and stored
+per party. In the online phase, a product $xy$ is computed by opening $d = x - a$ and
+$e = y - b$ and locally computing $z = c + d b + e a + d e$, which does not increase the degree
+of the sharing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Tuple
+
+from tno.mpc.encryption_schemes.shamir.shamir import (
+    DEFAULT_EVALUATION_POINTS,
+    ShamirSecretSharingScheme,
+)
+from tno.mpc.encryption_schemes.shamir.shamir_shares_vector import ShamirSharesVector
+from tno.mpc.encryption_schemes.shamir.utils import (
+    MemoryMappedStore,
+    StrPath,
+    decode_fixed_width,
+    encode_fixed_width,
+    limb_size,
+)
+
+Triples = Tuple[ShamirSharesVector, ShamirSharesVector, ShamirSharesVector]
+
+
+def generate_triples(scheme: ShamirSecretSharingScheme, count: int) -> Triples:
+    """
+    Generate Shamir-shared multiplication triples in bulk, as a trusted dealer.
+
+    :param scheme: scheme with which the triples are shared
+    :param count: number of triples to generate
+    :return: vectors with the sharings of a, b and c = ab respectively
+    """
+    a_values = scheme.randomness.sample(scheme.modulus, count)
+    b_values = scheme.randomness.sample(scheme.modulus, count)
+    c_values = [a * b % scheme.modulus for a, b in zip(a_values, b_values)]
+    return (
+        ShamirSharesVector(scheme, scheme.share_secrets(a_values)),
+        ShamirSharesVector(scheme, scheme.share_secrets(b_values)),
+        ShamirSharesVector(scheme, scheme.share_secrets(c_values)),
+    )
+
+
+class TripleStore(MemoryMappedStore):
+    """
+    Memory-mapped on-disk store of the multiplication triple shares of a single party.
+
+    The file starts with a header containing the scheme parameters, the id of the party and the
+    number of triples that have been consumed, followed by fixed-width records of the shares
+    $(a_i, b_i, c_i)$ of the party. Triples are consumed streaming-wise with take. The consumption
+    counter is persisted in the file, such that a triple is never handed out twice, also not after
+    reopening the store.
+    """
+
+    MAGIC = b"SSTS"
+    DESCRIPTION = "triple store"
+
+    def _set_up(
+        self, modulus: int, number_of_parties: int, polynomial_degree: int
+    ) -> None:
+        """
+        Set up the scheme of the triples from the parameters in the header.
+
+        :param modulus: modulus of the scheme of the triples
+        :param number_of_parties: number of parties of the scheme of the triples
+        :param polynomial_degree: polynomial degree of the scheme of the triples
+        """
+        self.scheme = ShamirSecretSharingScheme.get_instance(
+            modulus, number_of_parties, polynomial_degree
+        )
+        self._record_size: int = 3 * self.limb_size
+
+    @classmethod
+    def write(
+        cls,
+        path: StrPath,
+        party_id: int,
+        triples: Triples,
+    ) -> TripleStore:
+        """
+        Create a triple store with the shares of the given party of the triples.
+
+        :param path: location of the file of the store
+        :param party_id: id of the party whose shares are stored
+        :param triples: vectors with the sharings of a, b and c respectively
+        :raise ValueError: In case the scheme does not use the default evaluation points.
+        :return: the opened triple store
+        """
+        scheme = triples[0].scheme
+        if scheme.evaluation_points != DEFAULT_EVALUATION_POINTS:
+            raise ValueError(
+                "Only schemes with the default evaluation points can be stored."
+            )
+        width = limb_size(scheme.modulus)
+        a_shares, b_shares, c_shares = (vector.shares[party_id] for vector in triples)
+        with open(path, "wb") as file:
+            file.write(
+                cls._encode_header(
+                    scheme.modulus,
+                    scheme.number_of_parties,
+                    scheme.polynomial_degree,
+                    party_id,
+                )
+            )
+            file.write(
+                encode_fixed_width(
+                    (
+                        share
+                        for record in zip(a_shares, b_shares, c_shares)
+                        for share in record
+                    ),
+                    width,
+                )
+            )
+        return cls(path)
+
+    @classmethod
+    def write_all(cls, directory: StrPath, triples: Triples) -> dict[int, TripleStore]:
+        """
+        Create a triple store for every party, as a trusted dealer would.
+
+        :param directory: directory in which the files of the stores are created
+        :param triples: vectors with the sharings of a, b and c respectively
+        :return: mapping from every party id to its opened triple store
+        """
+        return {
+            party_id: cls.write(
+                Path(directory) / f"triples_party_{party_id}.bin", party_id, triples
+            )
+            for party_id in triples[0].shares
+        }
+
+    @property
+    def consumed(self) -> int:
+        """
+        Number of triples that have been consumed from this store.
+
+        :return: number of consumed triples
+        """
+        return self._counter
+
+    def __len__(self) -> int:
+        """
+        Number of triples that are still available in this store.
+
+        :return: number of available triples
+        """
+        total = (len(self._mmap) - self._data_offset) // self._record_size
+        return total - self.consumed
+
+    def take(self, count: int) -> tuple[list[int], list[int], list[int]]:
+        """
+        Consume the next triples from this store.
+
+        :param count: number of triples to consume
+        :raise ValueError: In case less than count triples are available.
+        :return: shares of this party of a, b and c respectively
+        """
+        if count > len(self):
+            raise ValueError(
+                f"Requested {count} triples, but only {len(self)} are available."
+            )
+        consumed = self.consumed
+        start = self._data_offset + consumed * self._record_size
+        with memoryview(self._mmap) as view:
+            records = decode_fixed_width(
+                view[start : start + count * self._record_size], self.limb_size
+            )
+        self._counter = consumed + count
+        return records[0::3], records[1::3], records[2::3]
+
+
+def take_triples(stores: Mapping[int, TripleStore], count: int) -> Triples:
+    """
+    Consume the next triples from the stores of all parties and combine them into vectors, for
+    local simulation of the online phase.
+
+    :param stores: mapping from party id to the triple store of that party
+    :param count: number of triples to consume
+    :return: vectors with the sharings of a, b and c respectively
+    """
+    taken = {party_id: store.take(count) for party_id, store in stores.items()}
+    scheme = next(iter(stores.values())).scheme
+    return (
+        ShamirSharesVector(scheme, {i: shares[0] for i, shares in taken.items()}),
+        ShamirSharesVector(scheme, {i: shares[1] for i, shares in taken.items()}),
+        ShamirSharesVector(scheme, {i: shares[2] for i, shares in taken.items()}),
+    )
+
+
+def multiply_with_triple(
+    x: ShamirSharesVector,
+    y: ShamirSharesVector,
+    triples: Triples,
+) -> ShamirSharesVector:
+    """
+    Multiply two vectors of sharings element-wise using one multiplication triple per element.
+    The masked values d = x - a and e = y - b are opened in a single batch, after which the
+    product is computed locally and keeps the degree of the inputs.
+
+    :param x: first vector of sharings
+    :param y: second vector of sharings
+    :param triples: vectors with the sharings of a, b and c = ab respectively, of the same length
+        as x and y
+    :return: sharings of the element-wise product of x and y
+    """
+    a_vector, b_vector, c_vector = triples
+    modulus = x.scheme.modulus
+    d_values = (x - a_vector).reconstruct_secrets()
+    e_values = (y - b_vector).reconstruct_secrets()
+    return ShamirSharesVector(
+        c_vector.scheme,
+        {
+            i: [
+                (c + d * b + e * a + d * e) % modulus
+                for a, b, c, d, e in zip(
+                    a_vector.shares[i],
+                    b_vector.shares[i],
+                    c_column,
+                    d_values,
+                    e_values,
+                )
+            ]
+            for i, c_column in c_vector.shares.items()
+        },
+    )
@@ -0,0 +1,358 @@
+"""
+Compact binary wire format for Shamir schemes and shares.
+
+Instead of repeating the scheme parameters in every message, a scheme is encoded (and sent)
+once, after which shares refer to it by a short scheme id. Shares are encoded as fixed-width
+little-endian limbs: sized to the modulus for sharings over a prime field, and sized to the
+largest share for sharings over the integers. Vectors of shares use a columnar layout, i.e.
+the shares of every party are stored consecutively. Decoding works directly on a memoryview of
+the received buffer, such that the buffer itself is never copied.
+
+Every encoding starts with a fixed header of a magic, a version and the kind of the encoded
+object.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from collections import OrderedDict
+from typing import Union
+
+from tno.mpc.encryption_schemes.shamir.shamir import (
+    DEFAULT_EVALUATION_POINTS,
+    ShamirSecretSharingScheme,
+    ShamirShares,
+)
+from tno.mpc.encryption_schemes.shamir.shamir_secret_sharing_integers import (
+    IntegerShares,
+    ShamirSecretSharingIntegers,
+)
+from tno.mpc.encryption_schemes.shamir.shamir_shares_vector import ShamirSharesVector
+from tno.mpc.encryption_schemes.shamir.utils import (
+    decode_fixed_width,
+    encode_fixed_width,
+    limb_size,
+)
+
+Scheme = Union[ShamirSecretSharingScheme, ShamirSecretSharingIntegers]
+Encodable = Union[Scheme, ShamirShares, IntegerShares, ShamirSharesVector]
+
+MAGIC = b"SH"
+VERSION = 1
+SCHEME_ID_SIZE = 8
+SCHEME_REGISTRY_SIZE = 128
+
+KIND_SHAMIR_SCHEME = 1
+KIND_INTEGER_SCHEME = 2
+KIND_SHAMIR_SHARES = 3
+KIND_INTEGER_SHARES = 4
+KIND_SHAMIR_SHARES_VECTOR = 5
+
+# magic, version, kind
+_HEADER = struct.Struct("<2sBB")
+# number of parties, polynomial degree
+_SCHEME_PARAMETERS = struct.Struct("<II")
+# scheme id, degree, number of shares, number of elements
+_SHARES_HEADER = struct.Struct(f"<{SCHEME_ID_SIZE}sIII")
+_PARTY_ID = struct.Struct("<I")
+_LENGTH = struct.Struct("<I")
+
+# Bounded (least recently used) registry of the schemes by their id
+_schemes: OrderedDict[bytes, Scheme] = OrderedDict()
+
+
+def _encode_int(value: int) -> bytes:
+    """
+    Encode an arbitrary (signed) integer as a length-prefixed byte string.
+
+    :param value: integer to be encoded
+    :return: encoding of the integer
+    """
+    width = value.bit_length() // 8 + 1
+    return _LENGTH.pack(width) + value.to_bytes(width, "little", signed=True)
+
+
+def _decode_int(view: memoryview, offset: int) -> tuple[int, int]:
+    """
+    Decode a length-prefixed (signed) integer.
+
+    :param view: buffer containing the encoding
+    :param offset: position of the encoding in the buffer
+    :return: the decoded integer and the position directly after its encoding
+    """
+    (width,) = _LENGTH.unpack_from(view, offset)
+    offset += _LENGTH.size
+    return (
+        int.from_bytes(view[offset : offset + width], "little", signed=True),
+        offset + width,
+    )
+
+
+def _check_encodable(scheme: Scheme) -> None:
+    """
+    Check that a scheme uses the default evaluation points and randomness interval, as other
+    evaluation points and intervals are not part of the binary format.
+
+    :param scheme: scheme to be checked
+    :raise ValueError: In case the scheme uses other evaluation points or a tight randomness
+        interval.
+    """
+    if (
+        isinstance(scheme, ShamirSecretSharingScheme)
+        and scheme.evaluation_points != DEFAULT_EVALUATION_POINTS
+    ):
+        raise ValueError(
+            "Only schemes with the default evaluation points can be encoded in the binary "
+            "format."
+        )
+    if isinstance(scheme, ShamirSecretSharingIntegers) and scheme.tight_interval:
+        raise ValueError(
+            "Only schemes with the default randomness interval can be encoded in the binary "
+            "format."
+        )
+
+
+def _encode_scheme_parameters(scheme: Scheme) -> bytes:
+    """
+    Encode the parameters of a scheme, without header.
+
+    :param scheme: scheme to be encoded
+    :return: encoding of the scheme parameters
+    """
+    _check_encodable(scheme)
+    parameters = _SCHEME_PARAMETERS.pack(
+        scheme.number_of_parties, scheme.polynomial_degree
+    )
+    if isinstance(scheme, ShamirSecretSharingScheme):
+        return parameters + _encode_int(scheme.modulus)
+    return parameters + _encode_int(scheme.kappa) + _encode_int(scheme.max_int)
+
+
+def scheme_id(scheme: Scheme) -> bytes:
+    """
+    Short identifier of a scheme, derived from its parameters. The scheme is registered under
+    this id, such that shares that refer to it can be decoded. Shamir schemes that only differ
+    in their polynomial degree share the same id. At most SCHEME_REGISTRY_SIZE schemes are
+    registered, the least recently used scheme is dropped first.
+
+    :param scheme: scheme to be identified
+    :return: identifier of the scheme
+    """
+    _check_encodable(scheme)
+    if isinstance(scheme, ShamirSecretSharingScheme):
+        # The degree of Shamir shares is sent along with the shares, such that shares of derived
+        # (degree-raised) schemes can refer to the same id.
+        parameters = (
+            bytes([KIND_SHAMIR_SCHEME])
+            + _PARTY_ID.pack(scheme.number_of_parties)
+            + _encode_int(scheme.modulus)
+        )
+    else:
+        parameters = bytes([KIND_INTEGER_SCHEME]) + _encode_scheme_parameters(scheme)
+    identifier = hashlib.blake2b(parameters, digest_size=SCHEME_ID_SIZE).digest()
+    _schemes.setdefault(identifier, scheme)
+    _schemes.move_to_end(identifier)
+    if len(_schemes) > SCHEME_REGISTRY_SIZE:
+        _schemes.popitem(last=False)
+    return identifier
+
+
+def _lookup_scheme(identifier: bytes) -> Scheme:
+    """
+    Find the registered scheme with the given id.
+
+    :param identifier: identifier of the scheme
+    :raise ValueError: In case no scheme with this id is known.
+    :return: the registered scheme
+    """
+    try:
+        scheme = _schemes[identifier]
+    except KeyError:
+        raise ValueError(
+            f"Unknown scheme id {identifier.hex()}, the scheme should be decoded first."
+        ) from None
+    _schemes.move_to_end(identifier)
+    return scheme
+
+
+def _share_width(scheme: Scheme, values: list[int]) -> int:
+    """
+    Width of the limbs of the given shares.
+
+    :param scheme: scheme of the shares
+    :param values: the shares
+    :return: number of bytes per share
+    """
+    if isinstance(scheme, ShamirSecretSharingScheme):
+        return limb_size(scheme.modulus)
+    # shares over the integers are signed and unbounded
+    return max((value.bit_length() // 8 + 1 for value in values), default=1)
+
+
+def encode(obj: Encodable) -> bytes:
+    """
+    Encode a scheme or shares into the compact binary wire format. Note that shares modulo a
+    prime are encoded in their reduced form.
+
+    :param obj: object to be encoded
+    :raise TypeError: In case the object cannot be encoded.
+    :return: binary encoding of the object
+    """
+    if isinstance(obj, ShamirSecretSharingScheme):
+        return _HEADER.pack(
+            MAGIC, VERSION, KIND_SHAMIR_SCHEME
+        ) + _encode_scheme_parameters(obj)
+    if isinstance(obj, ShamirSecretSharingIntegers):
+        return _HEADER.pack(
+            MAGIC, VERSION, KIND_INTEGER_SCHEME
+        ) + _encode_scheme_parameters(obj)
+    if isinstance(obj, ShamirSharesVector):
+        modulus = obj.scheme.modulus
+        return b"".join(
+            [
+                _HEADER.pack(MAGIC, VERSION, KIND_SHAMIR_SHARES_VECTOR),
+                _SHARES_HEADER.pack(
+                    scheme_id(obj.scheme), obj.degree, len(obj.shares), len(obj)
+                ),
+                b"".join(_PARTY_ID.pack(i) for i in obj.shares),
+                encode_fixed_width(
+                    (
+                        share % modulus
+                        for column in obj.shares.values()
+                        for share in column
+                    ),
+                    limb_size(modulus),
+                ),
+            ]
+        )
+    if isinstance(obj, ShamirShares):
+        values = [share % obj.scheme.modulus for share in obj.shares.values()]
+        kind = KIND_SHAMIR_SHARES
+        trailer = b""
+    elif isinstance(obj, IntegerShares):
+        values = list(obj.shares.values())
+        kind = KIND_INTEGER_SHARES
+        trailer = _encode_int(obj.scaling)
+    else:
+        raise TypeError(f"Cannot encode objects of type {type(obj).__name__}.")
+    width = _share_width(obj.scheme, values)
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, VERSION, kind),
+            _SHARES_HEADER.pack(scheme_id(obj.scheme), obj.degree, len(values), width),
+            b"".join(_PARTY_ID.pack(i) for i in obj.shares),
+            encode_fixed_width(values, width, signed=kind == KIND_INTEGER_SHARES),
+            trailer,
+        ]
+    )
+
+
+def _decode_scheme(kind: int, view: memoryview, offset: int) -> Scheme:
+    """
+    Decode and register a scheme.
+
+    :param kind: kind of the scheme
+    :param view: buffer containing the encoding
+    :param offset: position of the scheme parameters in the buffer
+    :return: the decoded scheme
+    """
+    number_of_parties, polynomial_degree = _SCHEME_PARAMETERS.unpack_from(view, offset)
+    offset += _SCHEME_PARAMETERS.size
+    scheme: Scheme
+    if kind == KIND_SHAMIR_SCHEME:
+        modulus, _ = _decode_int(view, offset)
+        scheme = ShamirSecretSharingScheme.get_instance(
+            modulus, number_of_parties, polynomial_degree
+        )
+    else:
+        kappa, offset = _decode_int(view, offset)
+        max_int, _ = _decode_int(view, offset)
+        scheme = ShamirSecretSharingIntegers(
+            kappa, max_int, number_of_parties, polynomial_degree
+        )
+    scheme_id(scheme)
+    return scheme
+
+
+def decode(buffer: bytes | bytearray | memoryview) -> Encodable:
+    """
+    Decode a scheme or shares from the compact binary wire format. Schemes are registered when
+    they are decoded, shares can only be decoded when their scheme is known.
+
+    :param buffer: binary encoding of the object
+    :raise ValueError: In case the buffer is not a valid encoding.
+    :return: the decoded object
+    """
+    with memoryview(buffer) as view:
+        magic, version, kind = _HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a valid encoding of Shamir shares or schemes.")
+        offset = _HEADER.size
+        if kind in (KIND_SHAMIR_SCHEME, KIND_INTEGER_SCHEME):
+            return _decode_scheme(kind, view, offset)
+        if kind not in (
+            KIND_SHAMIR_SHARES,
+            KIND_INTEGER_SHARES,
+            KIND_SHAMIR_SHARES_VECTOR,
+        ):
+            raise ValueError(f"Unknown kind {kind} of encoded object.")
+
+        identifier, degree, number_of_shares, size = _SHARES_HEADER.unpack_from(
+            view, offset
+        )
+        scheme = _lookup_scheme(identifier)
+        offset += _SHARES_HEADER.size
+        party_ids = [
+            _PARTY_ID.unpack_from(view, offset + index * _PARTY_ID.size)[0]
+            for index in range(number_of_shares)
+        ]
+        offset += number_of_shares * _PARTY_ID.size
+
+        if kind == KIND_INTEGER_SHARES:
+            if not isinstance(scheme, ShamirSecretSharingIntegers):
+                raise ValueError("The scheme id refers to a scheme of the wrong kind.")
+            values_view = view[offset : offset + number_of_shares * size]
+            values = decode_fixed_width(values_view, size, signed=True)
+            scaling, _ = _decode_int(view, offset + number_of_shares * size)
+            return IntegerShares(scheme, dict(zip(party_ids, values)), degree, scaling)
+        if not isinstance(scheme, ShamirSecretSharingScheme):
+            raise ValueError("The scheme id refers to a scheme of the wrong kind.")
+        if kind == KIND_SHAMIR_SHARES_VECTOR:
+            width = limb_size(scheme.modulus)
+            column_size = size * width
+            return ShamirSharesVector(
+                _with_degree(scheme, degree),
+                {
+                    i: decode_fixed_width(
+                        view[
+                            offset
+                            + index * column_size : offset
+                            + (index + 1) * column_size
+                        ],
+                        width,
+                    )
+                    for index, i in enumerate(party_ids)
+                },
+            )
+        values_view = view[offset : offset + number_of_shares * size]
+        return ShamirShares(
+            _with_degree(scheme, degree),
+            dict(zip(party_ids, decode_fixed_width(values_view, size))),
+        )
+
+
+def _with_degree(
+    scheme: ShamirSecretSharingScheme, degree: int
+) -> ShamirSecretSharingScheme:
+    """
+    The scheme of shares of the given degree, as the degree of ShamirShares is determined by its
+    scheme.
+
+    :param scheme: scheme with which the shares were created
+    :param degree: degree of the shares
+    :return: the (interned) scheme with the given polynomial degree
+    """
+    if scheme.polynomial_degree == degree:
+        return scheme
+    return scheme.with_degree(degree)
@@ -0,0 +1,173 @@
+r"""
+Degree reduction of Shamir sharings by resharing, in the style of Gennaro, Rabin and Rabin (GRR).
+
+After a multiplication of two sharings of degree $t$, the parties hold a sharing $h$ of degree
+$2t$. Every party $i$ in a reconstruction set $R$ of $2t + 1$ parties reshares its share $h(i)$
+with a polynomial of degree $t$, after which every party $j$ locally combines the received
+subshares with the (precomputed) recombination vector $\lambda$, i.e. the Lagrange coefficients
+of $R$, into a fresh share $\sum_{i \in R} \lambda_i [h(i)]_t(j)$ of degree $t$.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping, Sequence
+
+from tno.mpc.encryption_schemes.shamir.distributed import MessagePool
+from tno.mpc.encryption_schemes.shamir.shamir import (
+    ShamirSecretSharingScheme,
+    ShamirShares,
+)
+from tno.mpc.encryption_schemes.shamir.shamir_shares_vector import ShamirSharesVector
+
+
+def recombination_vector(
+    source_scheme: ShamirSecretSharingScheme,
+) -> dict[int, int]:
+    """
+    Recombination vector for reducing the degree of sharings of the given scheme, i.e. the
+    Lagrange coefficients of the first polynomial_degree + 1 parties. The coefficients are taken
+    from the Lagrange cache of the scheme.
+
+    :param source_scheme: scheme (of high degree) of the sharings to be reduced
+    :raise ValueError: In case there are too little parties to reduce the degree.
+    :return: mapping from the ids of the resharing parties to their coefficient
+    """
+    if source_scheme.number_of_parties < source_scheme.polynomial_degree + 1:
+        raise ValueError(
+            "Too little parties to reconstruct, hence to reduce the degree."
+        )
+    return source_scheme.lagrange_coefficients(
+        range(1, source_scheme.polynomial_degree + 2)
+    )
+
+
+def _check_schemes(
+    source_scheme: ShamirSecretSharingScheme,
+    target_scheme: ShamirSecretSharingScheme,
+) -> None:
+    """
+    Check whether sharings of the source scheme can be reduced to sharings of the target scheme.
+
+    :param source_scheme: scheme of the sharings to be reduced
+    :param target_scheme: scheme of the reduced sharings
+    :raise ValueError: In case the schemes have a different modulus or number of parties.
+    """
+    if (
+        source_scheme.modulus != target_scheme.modulus
+        or source_scheme.number_of_parties != target_scheme.number_of_parties
+    ):
+        raise ValueError(
+            "The target scheme should have the same modulus and number of parties."
+        )
+
+
+def _recombine(
+    subshares: Mapping[int, Sequence[int]],
+    weights: Mapping[int, int],
+    modulus: int,
+) -> list[int]:
+    """
+    Combine the subshares received by a single party into its new shares.
+
+    :param subshares: mapping from the id of every resharing party to the subshares it sent
+    :param weights: recombination vector
+    :param modulus: modulus of the scheme
+    :return: new share for every value
+    """
+    columns = [subshares[i] for i in weights.keys()]
+    coefficients = list(weights.values())
+    return [
+        sum(weight * share for weight, share in zip(coefficients, shares)) % modulus
+        for shares in zip(*columns)
+    ]
+
+
+def reduce_degree_many(
+    vector: ShamirSharesVector,
+    target_scheme: ShamirSecretSharingScheme,
+) -> ShamirSharesVector:
+    """
+    Locally simulate the degree reduction of a vector of sharings, e.g. the result of an
+    element-wise multiplication. All values are reshared in a single batch per party.
+
+    :param vector: sharings of high degree, containing the shares of at least the resharing
+        parties
+    :param target_scheme: scheme (of low degree) of the reduced sharings
+    :return: fresh sharings of the same values with respect to the target scheme
+    """
+    _check_schemes(vector.scheme, target_scheme)
+    weights = recombination_vector(vector.scheme)
+    # Every resharing party shares all of its shares in a single batch
+    subshares = {i: target_scheme.share_secrets(vector.shares[i]) for i in weights}
+    return ShamirSharesVector(
+        target_scheme,
+        {
+            j: _recombine(
+                {i: subshares[i][j] for i in weights}, weights, target_scheme.modulus
+            )
+            for j in range(1, target_scheme.number_of_parties + 1)
+        },
+    )
+
+
+def reduce_degree(
+    sharing: ShamirShares,
+    target_scheme: ShamirSecretSharingScheme,
+) -> ShamirShares:
+    """
+    Locally simulate the degree reduction of a single sharing, e.g. the result of a
+    multiplication.
+
+    :param sharing: sharing of high degree, containing the shares of at least the resharing
+        parties
+    :param target_scheme: scheme (of low degree) of the reduced sharing
+    :return: fresh sharing of the same value with respect to the target scheme
+    """
+    return reduce_degree_many(ShamirSharesVector.from_shares([sharing]), target_scheme)[
+        0
+    ]
+
+
+async def reduce_degree_distributed(
+    pool: MessagePool,
+    party_id: int,
+    party_names: Mapping[int, str],
+    shares: Sequence[int],
+    source_scheme: ShamirSecretSharingScheme,
+    target_scheme: ShamirSecretSharingScheme,
+    msg_id: str = "degree_reduction",
+) -> list[int]:
+    """
+    Reduce the degree of a batch of sharings in a single communication round over a
+    communication pool. Every party in the network should call this function with its own shares.
+
+    :param pool: communication pool of this party
+    :param party_id: id of this party in the secret sharing schemes
+    :param party_names: mapping from the id of every other party to its handler name in the pool
+    :param shares: shares of this party of the values of high degree
+    :param source_scheme: scheme (of high degree) of the sharings to be reduced
+    :param target_scheme: scheme (of low degree) of the reduced sharings
+    :param msg_id: identifier of the messages of this round
+    :return: shares of this party of the values with respect to the target scheme
+    """
+    _check_schemes(source_scheme, target_scheme)
+    weights = recombination_vector(source_scheme)
+
+    received: dict[int, Sequence[int]] = {}
+    if party_id in weights:
+        subshares = target_scheme.share_secrets(shares)
+        received[party_id] = subshares[party_id]
+        await asyncio.gather(
+            *(
+                pool.send(party_names[j], subshares[j], msg_id)
+                for j in subshares
+                if j != party_id
+            )
+        )
+    others = [i for i in weights if i != party_id]
+    messages = await asyncio.gather(
+        *(pool.recv(party_names[i], msg_id) for i in others)
+    )
+    received.update(zip(others, messages))
+    return _recombine(received, weights, target_scheme.modulus)
@@ -0,0 +1,209 @@
+"""
+Asynchronous distribution and reconstruction of Shamir sharings over communication pools.
+
+All messages of a round are coalesced into batches of shares, such that a single message
+carries the shares of many values. The number of messages that are sent concurrently can be
+bounded. The functions only rely on the send and recv methods of a tno.mpc.communication Pool,
+so any object that provides these (e.g. an in-process stand-in for testing) can be used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping, Sequence
+from typing import Any, Protocol
+
+from tno.mpc.encryption_schemes.shamir.shamir import ShamirSecretSharingScheme
+from tno.mpc.encryption_schemes.shamir.shamir_shares_vector import ShamirSharesVector
+
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class MessagePool(Protocol):
+    """
+    Communication functionality that is required from a pool, e.g. tno.mpc.communication.Pool.
+    """
+
+    async def send(
+        self, handler_name: str, message: Any, msg_id: str | None = None
+    ) -> None:
+        """
+        Send a message to a peer.
+
+        :param handler_name: the name of the pool handler to send a message to
+        :param message: the message to send
+        :param msg_id: an optional string identifying the message to send
+        """
+
+    async def recv(self, handler_name: str, msg_id: str | None = None) -> Any:
+        """
+        Receive a message from a peer.
+
+        :param handler_name: the name of the pool handler to receive a message from
+        :param msg_id: an optional string identifying the message to collect
+        :return: the message from peer
+        """
+
+
+def _batches(shares: Sequence[int], batch_size: int) -> list[list[int]]:
+    """
+    Split shares into consecutive batches, of which there is always at least one.
+
+    :param shares: shares to be split
+    :param batch_size: maximum number of shares per batch
+    :return: the batches of shares
+    """
+    return [
+        list(shares[start : start + batch_size])
+        for start in range(0, max(len(shares), 1), batch_size)
+    ]
+
+
+async def send_batched(
+    pool: MessagePool,
+    handler_name: str,
+    shares: Sequence[int],
+    msg_id: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    semaphore: asyncio.Semaphore | None = None,
+) -> None:
+    """
+    Send shares to a single peer, coalesced into batches. Every batch is sent as a message that
+    also carries the total number of batches, such that the receiver knows when it is done.
+
+    :param pool: communication pool of this party
+    :param handler_name: handler name of the peer in the pool
+    :param shares: shares to be sent
+    :param msg_id: identifier of the messages of this round
+    :param batch_size: maximum number of shares per message
+    :param semaphore: optional semaphore that bounds the number of concurrent messages
+    """
+    batches = _batches(shares, batch_size)
+
+    async def send_batch(index: int, batch: list[int]) -> None:
+        """
+        Send a single batch, respecting the concurrency bound.
+
+        :param index: index of the batch
+        :param batch: shares in the batch
+        """
+        message = {"batches": len(batches), "shares": batch}
+        if semaphore is None:
+            await pool.send(handler_name, message, f"{msg_id}_{index}")
+        else:
+            async with semaphore:
+                await pool.send(handler_name, message, f"{msg_id}_{index}")
+
+    await asyncio.gather(*(send_batch(i, batch) for i, batch in enumerate(batches)))
+
+
+async def receive_batched(
+    pool: MessagePool, handler_name: str, msg_id: str
+) -> list[int]:
+    """
+    Receive shares from a single peer that were sent with send_batched.
+
+    :param pool: communication pool of this party
+    :param handler_name: handler name of the peer in the pool
+    :param msg_id: identifier of the messages of this round
+    :return: the received shares, in order
+    """
+    first = await pool.recv(handler_name, f"{msg_id}_0")
+    others = await asyncio.gather(
+        *(
+            pool.recv(handler_name, f"{msg_id}_{index}")
+            for index in range(1, first["batches"])
+        )
+    )
+    return [share for message in (first, *others) for share in message["shares"]]
+
+
+async def distribute_shares(
+    pool: MessagePool,
+    party_names: Mapping[int, str],
+    sharings: ShamirSharesVector,
+    msg_id: str = "shares",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[int] | None:
+    """
+    Distribute the shares of many values, e.g. created with share_secrets, from a dealer to the
+    parties in batched messages.
+
+    :param pool: communication pool of the dealer
+    :param party_names: mapping from the id of every party, other than the dealer, to its handler
+        name in the pool
+    :param sharings: sharings of the values to be distributed
+    :param msg_id: identifier of the messages of this round
+    :param batch_size: maximum number of shares per message
+    :param max_concurrency: maximum number of messages that are sent concurrently
+    :return: the shares of the dealer if the dealer is one of the parties, None otherwise
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    await asyncio.gather(
+        *(
+            send_batched(
+                pool, party_names[i], sharings.shares[i], msg_id, batch_size, semaphore
+            )
+            for i in party_names
+        )
+    )
+    own_ids = [i for i in sharings.shares if i not in party_names]
+    return list(sharings.shares[own_ids[0]]) if own_ids else None
+
+
+async def receive_shares(
+    pool: MessagePool, dealer_name: str, msg_id: str = "shares"
+) -> list[int]:
+    """
+    Receive the shares that were distributed by a dealer with distribute_shares.
+
+    :param pool: communication pool of this party
+    :param dealer_name: handler name of the dealer in the pool
+    :param msg_id: identifier of the messages of this round
+    :return: the shares of this party, in the order of the values
+    """
+    return await receive_batched(pool, dealer_name, msg_id)
+
+
+async def open_shares(
+    pool: MessagePool,
+    party_id: int,
+    party_names: Mapping[int, str],
+    shares: Sequence[int],
+    scheme: ShamirSecretSharingScheme,
+    msg_id: str = "open",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[int]:
+    """
+    Open many sharings towards all parties in a single round: every party sends its shares to all
+    peers in batched messages, gathers the shares of its peers and reconstructs all values at once.
+    Every party in the network should call this function with its own shares.
+
+    :param pool: communication pool of this party
+    :param party_id: id of this party in the secret sharing scheme
+    :param party_names: mapping from the id of every other party to its handler name in the pool
+    :param shares: shares of this party of the values to be opened
+    :param scheme: scheme with which the values are shared
+    :param msg_id: identifier of the messages of this round
+    :param batch_size: maximum number of shares per message
+    :param max_concurrency: maximum number of messages that are sent concurrently
+    :return: the opened values
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    _, received = await asyncio.gather(
+        asyncio.gather(
+            *(
+                send_batched(pool, name, shares, msg_id, batch_size, semaphore)
+                for name in party_names.values()
+            )
+        ),
+        asyncio.gather(
+            *(receive_batched(pool, name, msg_id) for name in party_names.values())
+        ),
+    )
+    shares_by_party = dict(zip(party_names.keys(), received))
+    shares_by_party[party_id] = list(shares)
+    return scheme.reconstruct_many(dict(sorted(shares_by_party.items())))
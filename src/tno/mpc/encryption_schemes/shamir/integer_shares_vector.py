@@ -0,0 +1,376 @@
+"""
+Utility for vectors of Shamir secret shares over the integers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, TypedDict, Union, overload
+
+from tno.mpc.communication import SupportsSerialization
+
+from tno.mpc.encryption_schemes.shamir.shamir_secret_sharing_integers import (
+    IntegerShares,
+    ShamirSecretSharingIntegers,
+)
+
+# Check to see if the communication module is available
+try:
+    from tno.mpc.communication import RepetitionError, Serialization
+
+    COMMUNICATION_INSTALLED = True
+except ModuleNotFoundError:
+    COMMUNICATION_INSTALLED = False
+
+Operand = Union["IntegerSharesVector", int]
+
+
+class IntegerSharesVector(SupportsSerialization):
+    """
+    Class that keeps track of the shares for a vector of values that are shared over the
+    integers with the same scheme, degree and scaling.
+
+    The shares are stored in a columnar (party x element) layout, like ShamirSharesVector: for
+    every party a single list contains the shares of that party for all elements of the vector.
+    """
+
+    def __init__(
+        self,
+        shamir_sss: ShamirSecretSharingIntegers,
+        shares: dict[int, list[int]],
+        degree: int | None = None,
+        scaling: int | None = None,
+        bound: int | None = None,
+    ) -> None:
+        """
+        Initialize a vector of integer shares.
+
+        :param shamir_sss: scheme with which all elements are shared
+        :param shares: mapping from every party id to the list of shares of that party, for
+            example as returned by ShamirSecretSharingIntegers.share_secrets
+        :param degree: degree of the sharings, the polynomial degree of the scheme if None
+        :param scaling: scaling of the sharings, the precomputed n! of the scheme if None
+        :param bound: upper bound on the absolute value of all shares, the bound on fresh shares
+            of the scheme if the degree and scaling are None as well and the largest absolute
+            value of the given shares otherwise
+        :raise ValueError: In case the parties hold a different number of shares.
+        """
+        if len({len(column) for column in shares.values()}) > 1:
+            raise ValueError("All parties should hold the same number of shares.")
+        self.scheme = shamir_sss
+        self.shares = shares
+        self.degree = self.scheme.polynomial_degree if degree is None else degree
+        self.scaling = self.scheme.n_fac if scaling is None else scaling
+        if bound is not None:
+            self.bound = bound
+        elif degree is None and scaling is None:
+            self.bound = self.scheme.share_bound
+        else:
+            self.bound = self._largest_share()
+
+    def _largest_share(self) -> int:
+        """
+        Largest absolute value of the shares in this vector.
+
+        :return: largest absolute share
+        """
+        return max(
+            (abs(share) for column in self.shares.values() for share in column),
+            default=0,
+        )
+
+    @property
+    def worst_case_bit_length(self) -> int:
+        """
+        Number of bits of the largest share that this vector may contain, including a sign bit,
+        see IntegerShares.worst_case_bit_length.
+
+        :return: worst-case bit length of a share
+        """
+        return self.bound.bit_length() + 1
+
+    @property
+    def bit_length(self) -> int:
+        """
+        Number of bits of the largest share of this vector, including a sign bit.
+
+        :return: bit length of the largest share
+        """
+        return self._largest_share().bit_length() + 1
+
+    @property
+    def scaling_bit_length(self) -> int:
+        """
+        Number of bits of the scaling of the secrets, which grows with log2(n!) bits per
+        multiplication.
+
+        :return: bit length of the scaling
+        """
+        return self.scaling.bit_length()
+
+    @classmethod
+    def from_shares(cls, sharings: Sequence[IntegerShares]) -> IntegerSharesVector:
+        """
+        Create a vector of shares from a (non-empty) list of IntegerShares of the same scheme,
+        degree and scaling.
+
+        :param sharings: sharings of the elements of the vector
+        :raise ValueError: In case the list is empty or the sharings are incompatible.
+        :return: vector containing the given sharings
+        """
+        if not sharings:
+            raise ValueError("Cannot determine the scheme of an empty list of shares.")
+        first = sharings[0]
+        if any(
+            sharing.scheme != first.scheme
+            or sharing.degree != first.degree
+            or sharing.scaling != first.scaling
+            for sharing in sharings
+        ):
+            raise ValueError(
+                "All sharings should have the same scheme, degree and scaling."
+            )
+        return cls(
+            first.scheme,
+            {
+                i: [sharing.shares[i] for sharing in sharings]
+                for i in first.shares.keys()
+            },
+            first.degree,
+            first.scaling,
+            max(sharing.bound for sharing in sharings),
+        )
+
+    def to_shares(self) -> list[IntegerShares]:
+        """
+        Convert this vector into a list of IntegerShares, one per element.
+
+        :return: sharing of every element of the vector
+        """
+        return [
+            IntegerShares(
+                self.scheme,
+                dict(zip(self.shares.keys(), element)),
+                self.degree,
+                self.scaling,
+                self.bound,
+            )
+            for element in zip(*self.shares.values())
+        ]
+
+    def __len__(self) -> int:
+        """
+        Number of elements in this vector.
+
+        :return: length of the vector
+        """
+        return len(next(iter(self.shares.values()), []))
+
+    @overload
+    def __getitem__(self, index: int) -> IntegerShares: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> IntegerSharesVector: ...
+
+    def __getitem__(self, index: int | slice) -> IntegerShares | IntegerSharesVector:
+        """
+        Select a single element or a slice of this vector.
+
+        :param index: index or slice of the elements to select
+        :return: sharing of the selected element, or a vector of the selected elements
+        """
+        if isinstance(index, slice):
+            return IntegerSharesVector(
+                self.scheme,
+                {i: column[index] for i, column in self.shares.items()},
+                self.degree,
+                self.scaling,
+                self.bound,
+            )
+        return IntegerShares(
+            self.scheme,
+            {i: column[index] for i, column in self.shares.items()},
+            self.degree,
+            self.scaling,
+            self.bound,
+        )
+
+    def __str__(self) -> str:
+        """
+        String formatted version of this IntegerSharesVector object.
+
+        :return: Pretty string.
+        """
+        return (
+            f"vector of {len(self)} integer sharings, parties: {list(self.shares.keys())}, "
+            f"degree: {self.degree}, scaling: {self.scaling}"
+        )
+
+    def reconstruct_secrets(self, modulus: int = 0) -> list[int]:
+        """
+        Function that uses the shares from other parties to reconstruct all secrets in this vector,
+        as a single weighted sum per secret.
+
+        :param modulus: the modulus to use, 0 for a reconstruction over the integers
+        :return: original secrets
+        """
+        return self.scheme.reconstruct_many(
+            self.shares, self.degree, self.scaling, modulus
+        )
+
+    def _check_compatibility(self, other: IntegerSharesVector) -> None:
+        """
+        Check whether the other vector can be combined element-wise with this vector.
+
+        :param other: Vector to be combined with this vector.
+        :raise ValueError: In case a different secret sharing scheme was used or the lengths of
+            the vectors differ.
+        """
+        if self.scheme != other.scheme:
+            raise ValueError(
+                "Different secret sharing schemes have been used, i.e. shares are incompatible."
+            )
+        if len(self) != len(other):
+            raise ValueError("Vectors of different lengths are incompatible.")
+
+    def __add__(self, other: IntegerSharesVector) -> IntegerSharesVector:
+        """
+        Add another vector element-wise to this vector.
+
+        :param other: Vector to be added to these shares.
+        :raise ValueError: In case the vectors are incompatible or have different scaling factors.
+        :return: New IntegerSharesVector object where the shares have been added together.
+        """
+        self._check_compatibility(other)
+        if self.scaling != other.scaling:
+            raise ValueError("Incompatible shares, different scaling factors.")
+        return IntegerSharesVector(
+            self.scheme,
+            {
+                i: [a + b for a, b in zip(column, other.shares[i])]
+                for i, column in self.shares.items()
+            },
+            max(self.degree, other.degree),
+            self.scaling,
+            self.bound + other.bound,
+        )
+
+    def __mul__(self, other: Any) -> IntegerSharesVector:
+        """
+        Multiply this vector element-wise with another vector or a public integer. When two
+        vectors are multiplied, the degrees are added and the scaling factors are multiplied.
+
+        :param other: Vector or public integer to be multiplied with these shares.
+        :return: New IntegerSharesVector object where the shares have been multiplied together.
+        """
+        if isinstance(other, int):
+            return IntegerSharesVector(
+                self.scheme,
+                {i: [other * a for a in column] for i, column in self.shares.items()},
+                self.degree,
+                self.scaling,
+                abs(other) * self.bound,
+            )
+        if not isinstance(other, IntegerSharesVector):
+            # If self is multiplied (from the right) by another object, we redirect to the
+            # __rmul__ method of that object, e.g. of a vector of Shamir shares.
+            return NotImplemented
+        self._check_compatibility(other)
+        return IntegerSharesVector(
+            self.scheme,
+            {
+                i: [a * b for a, b in zip(column, other.shares[i])]
+                for i, column in self.shares.items()
+            },
+            self.degree + other.degree,
+            self.scaling * other.scaling,
+            self.bound * other.bound,
+        )
+
+    def __rmul__(self, other: Any) -> IntegerSharesVector:
+        """
+        Multiply this vector with a public integer from the left.
+
+        :param other: Public integer to be multiplied with these shares.
+        :raise ValueError: raised when other is not an integer.
+        :return: New IntegerSharesVector object where every element has been multiplied.
+        """
+        if isinstance(other, int):
+            return self * other
+        raise ValueError("A vector of shares can only be multiplied by an integer.")
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare equality between this IntegerSharesVector and the other object.
+
+        :param other: Object to compare with.
+        :return: Boolean stating (in)equality
+        """
+        if not isinstance(other, IntegerSharesVector):
+            return False
+        return (
+            self.scheme == other.scheme
+            and self.shares == other.shares
+            and self.degree == other.degree
+            and self.scaling == other.scaling
+        )
+
+    class SerializedIntegerSharesVector(TypedDict):
+        """
+        Class which contains the information of the vector of integer shares from which
+        deserialization is possible.
+        """
+
+        scheme: ShamirSecretSharingIntegers.SerializedShamirSecretSharingIntegers
+        party_ids: list[int]
+        shares: list[list[int]]
+        degree: int
+        scaling: int
+        bound: int
+
+    def serialize(
+        self, **_kwargs: Any
+    ) -> IntegerSharesVector.SerializedIntegerSharesVector:
+        r"""
+        Serialization function for the vector of integer shares and corresponding scheme, which
+        will be passed to the communication module. The scheme is included once and the shares
+        are kept in their columnar layout, i.e. one list per party.
+
+        :param \**_kwargs: optional extra keyword arguments
+        :return: json object containing the necessary information to deserialize
+        """
+        return {
+            "scheme": self.scheme.serialize(),
+            "party_ids": list(self.shares.keys()),
+            "shares": list(self.shares.values()),
+            "degree": self.degree,
+            "scaling": self.scaling,
+            "bound": self.bound,
+        }
+
+    @staticmethod
+    def deserialize(
+        obj: IntegerSharesVector.SerializedIntegerSharesVector, **_kwargs: Any
+    ) -> IntegerSharesVector:
+        r"""
+        Deserialization function for the vector of integer shares and corresponding scheme,
+        which will be passed to the communication module.
+
+        :param obj: serialization of the vector of integer shares
+        :param \**_kwargs: optional extra keyword arguments
+        :return: Deserialized IntegerSharesVector object.
+        """
+        return IntegerSharesVector(
+            ShamirSecretSharingIntegers.deserialize(obj["scheme"]),
+            dict(zip(obj["party_ids"], obj["shares"])),
+            obj["degree"],
+            obj["scaling"],
+            obj["bound"],
+        )
+
+
+if COMMUNICATION_INSTALLED:
+    try:
+        Serialization.register_class(IntegerSharesVector)
+    except RepetitionError:
+        pass
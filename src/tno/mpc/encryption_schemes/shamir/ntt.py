@@ -0,0 +1,398 @@
+r"""
+Shamir secret sharing with roots of unity as evaluation points, for large numbers of parties.
+
+When the multiplicative group of the prime field contains a subgroup of order $N$, a power of
+two of at least the number of parties, party $i$ evaluates the sharing polynomials in
+$\omega^{i - 1}$, with $\omega$ a primitive $N$-th root of unity. A sharing polynomial is then
+evaluated in all points at once by a number-theoretic transform (NTT) in $O(N \log N)$, instead
+of $O(n t)$ with the Vandermonde matrix.
+
+The Lagrange coefficients of a reconstruction set of consecutive parties (such as the first
+$t + 1$ parties, which are used by default) only depend on the size of the set, as the points
+form a geometric progression. They are computed with prefix products and a single modular
+inversion in $O(t)$, instead of $O(t^2)$ multiplications and $t + 1$ inversions. Other
+reconstruction sets use the generic (cached) Lagrange coefficients.
+
+Note that the shares of these schemes are not compatible with features that assume that party
+$i$ evaluates in $i$, such as sharings over the integers, PRSS, seed-compressed sharing and the
+binary format and on-disk stores; these raise a ValueError for such schemes.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any
+
+import sympy
+
+from tno.mpc.encryption_schemes.shamir.backend import PythonBackend
+from tno.mpc.encryption_schemes.shamir.randomness import RandomnessSource
+from tno.mpc.encryption_schemes.shamir.shamir import (
+    ShamirSecretSharingScheme,
+    ShamirShares,
+)
+from tno.mpc.encryption_schemes.shamir.utils import lagrange_coefficients
+
+# Check to see if the communication module is available
+try:
+    from tno.mpc.communication import RepetitionError, Serialization
+
+    COMMUNICATION_INSTALLED = True
+except ModuleNotFoundError:
+    COMMUNICATION_INSTALLED = False
+
+WEIGHTS_CACHE_SIZE = 256
+# Relative cost of a butterfly of a transform and a multiply-add of a Vandermonde evaluation
+TRANSFORM_COST_FACTOR = 4
+
+
+def transform_size(number_of_parties: int) -> int:
+    """
+    Size of the transforms for the given number of parties, i.e. the smallest power of two that
+    is at least the number of parties.
+
+    :param number_of_parties: number of parties
+    :return: size of the transforms
+    """
+    return 1 << max(number_of_parties - 1, 0).bit_length()
+
+
+def ntt_prime(bit_length: int, size: int) -> int:
+    """
+    Smallest prime of the given bit length that supports transforms of the given size, i.e.
+    that is one modulo size.
+
+    :param bit_length: bit length of the prime, such that the prime is at least
+        2 ** (bit_length - 1)
+    :param size: size of the transforms, a power of two
+    :raise ValueError: In case no such prime exists.
+    :return: the prime
+    """
+    lower_bound = 1 << (bit_length - 1)
+    candidate = (lower_bound - 1) // size * size + 1
+    if candidate < lower_bound:
+        candidate += size
+    while candidate < 2 * lower_bound:
+        if sympy.isprime(candidate):
+            return candidate
+        candidate += size
+    raise ValueError(f"No {bit_length}-bit prime supports transforms of size {size}.")
+
+
+def root_of_unity(modulus: int, size: int) -> int:
+    """
+    Primitive root of unity of the given order modulo a prime.
+
+    :param modulus: prime modulus
+    :param size: order of the root of unity, a power of two that divides modulus - 1
+    :raise ValueError: In case the modulus does not support roots of unity of this order.
+    :return: a primitive size-th root of unity
+    """
+    if size < 1 or size & (size - 1) or (modulus - 1) % size:
+        raise ValueError(
+            f"The modulus does not have primitive roots of unity of order {size}."
+        )
+    for base in range(2, modulus):
+        root = pow(base, (modulus - 1) // size, modulus)
+        # As the order is a power of two, the root is primitive iff root^(size/2) != 1
+        if size == 1 or pow(root, size // 2, modulus) != 1:
+            return root
+    raise ValueError(f"No primitive root of unity of order {size} was found.")
+
+
+@lru_cache(maxsize=None)
+def _bit_reversal(size: int) -> tuple[int, ...]:
+    """
+    Bit-reversal permutation of the indices of a transform.
+
+    :param size: size of the transform, a power of two
+    :return: the bit-reversed index of every index
+    """
+    bits = size.bit_length() - 1
+    return tuple(
+        int(f"{index:0{bits}b}"[::-1], 2) if bits else 0 for index in range(size)
+    )
+
+
+def ntt(values: Sequence[int], root: int, modulus: int) -> list[int]:
+    r"""
+    Number-theoretic transform: the evaluations of the polynomial with the given coefficients in
+    the powers $\omega^0, \ldots, \omega^{N - 1}$ of a root of unity. The additions of every
+    butterfly are not reduced, only the products are, and the results are reduced once at the
+    end.
+
+    :param values: coefficients of the polynomial, the length N is a power of two
+    :param root: primitive N-th root of unity
+    :param modulus: prime modulus
+    :return: the evaluations of the polynomial
+    """
+    size = len(values)
+    result = [values[index] for index in _bit_reversal(size)]
+    length = 2
+    while length <= size:
+        half = length // 2
+        step = pow(root, size // length, modulus)
+        twiddles = list(accumulate([1] * half, lambda power, _: power * step % modulus))
+        for start in range(0, size, length):
+            middle, end = start + half, start + length
+            low = result[start:middle]
+            high = [
+                value * twiddle % modulus
+                for value, twiddle in zip(result[middle:end], twiddles)
+            ]
+            result[start:middle] = [u + v for u, v in zip(low, high)]
+            result[middle:end] = [u - v for u, v in zip(low, high)]
+        length *= 2
+    return [value % modulus for value in result]
+
+
+def inverse_ntt(values: Sequence[int], root: int, modulus: int) -> list[int]:
+    """
+    Inverse number-theoretic transform: the coefficients of the polynomial of degree below N
+    with the given evaluations in the powers of a root of unity.
+
+    :param values: evaluations of the polynomial, the length N is a power of two
+    :param root: primitive N-th root of unity
+    :param modulus: prime modulus
+    :return: the coefficients of the polynomial
+    """
+    size_inverse = pow(len(values), -1, modulus)
+    return [
+        value * size_inverse % modulus
+        for value in ntt(values, pow(root, -1, modulus), modulus)
+    ]
+
+
+@lru_cache(maxsize=WEIGHTS_CACHE_SIZE)
+def consecutive_weights(modulus: int, root: int, count: int) -> tuple[int, ...]:
+    r"""
+    Lagrange coefficients for the interpolation in zero from the consecutive points
+    $\omega^s, \ldots, \omega^{s + m - 1}$, which do not depend on $s$:
+    $\lambda_k = 1 / (\prod_{d=1}^{k} (1 - \omega^d) \prod_{d=1}^{m-1-k} (1 - \omega^{-d}))$.
+    The products are computed as prefix products and all coefficients are inverted at once.
+
+    :param modulus: prime modulus
+    :param root: root of unity $\omega$, of an order of at least count
+    :param count: number of points m
+    :return: the Lagrange coefficient of every point
+    """
+    inverse_root = pow(root, -1, modulus)
+    powers = list(accumulate([root] * (count - 1), lambda a, b: a * b % modulus))
+    inverse_powers = list(
+        accumulate([inverse_root] * (count - 1), lambda a, b: a * b % modulus)
+    )
+    forward = list(
+        accumulate(
+            (1 - power for power in powers),
+            lambda a, b: a * b % modulus,
+            initial=1,
+        )
+    )
+    backward = list(
+        accumulate(
+            (1 - power for power in inverse_powers),
+            lambda a, b: a * b % modulus,
+            initial=1,
+        )
+    )
+    denominators = [
+        forward[k] * backward[count - 1 - k] % modulus for k in range(count)
+    ]
+    # Montgomery's trick: invert all denominators with a single modular inversion
+    prefix = list(accumulate(denominators, lambda a, b: a * b % modulus))
+    inverse = pow(prefix[-1], -1, modulus)
+    weights = [0] * count
+    for k in range(count - 1, 0, -1):
+        weights[k] = inverse * prefix[k - 1] % modulus
+        inverse = inverse * denominators[k] % modulus
+    weights[0] = inverse
+    return tuple(weights)
+
+
+class NTTShamirSecretSharingScheme(ShamirSecretSharingScheme):
+    """
+    Shamir secret sharing in which party i evaluates in the (i-1)-th power of a primitive root
+    of unity, such that sharing uses number-theoretic transforms.
+    """
+
+    evaluation_points = "roots_of_unity"
+
+    def __init__(
+        self,
+        modulus: int,
+        number_of_parties: int,
+        polynomial_degree: int,
+        randomness: RandomnessSource | None = None,
+        backend: PythonBackend | None = None,
+    ) -> None:
+        """
+        Initialize a secret sharing scheme with roots of unity as evaluation points.
+
+        :param modulus: prime modulus, one modulo the transform size, see ntt_prime
+        :param number_of_parties: number of shares that need to be created for each sharing
+        :param polynomial_degree: degree of the polynomials used to create shares
+        :param randomness: source of the random polynomial coefficients, secrets.randbelow is used
+            if None
+        :param backend: backend for the modular arithmetic of the operations that do not use the
+            transforms, selected based on the size of the modulus if None
+        :raise ValueError: In case the modulus does not support transforms of the required size.
+        """
+        super().__init__(
+            modulus, number_of_parties, polynomial_degree, randomness, backend
+        )
+        self.transform_size = transform_size(number_of_parties)
+        self.root = root_of_unity(modulus, self.transform_size)
+        self.points = list(
+            accumulate(
+                [self.root] * (number_of_parties - 1),
+                lambda a, b: a * b % modulus,
+                initial=1,
+            )
+        )
+
+    def evaluation_point(self, party_id: int) -> int:
+        """
+        Point in which the given party evaluates the sharing polynomials.
+
+        :param party_id: id of the party
+        :return: the evaluation point of the party
+        """
+        return self.points[party_id - 1]
+
+    @property
+    def van_der_monde(self) -> list[list[int]]:
+        """
+        Vandermonde matrix for evaluation of polynomials in the points of the parties, which is
+        used instead of the transforms for schemes with a small polynomial degree.
+
+        :return: A VanDerMonde matrix of dimensions self.number_of_parties x
+            self.polynomial_degree + 1
+        """
+        if not self._van_der_monde:
+            self._van_der_monde = [
+                [
+                    self.backend.convert(pow(point, j, self.modulus))
+                    for j in range(self.polynomial_degree + 1)
+                ]
+                for point in self.points
+            ]
+        return self._van_der_monde
+
+    @property
+    def uses_transforms(self) -> bool:
+        """
+        Whether sharing uses the transforms, i.e. whether a transform of N log N butterflies is
+        cheaper than the evaluation of a polynomial in all points with the Vandermonde matrix,
+        where a butterfly costs TRANSFORM_COST_FACTOR multiply-adds.
+
+        :return: True if the transforms are used for sharing
+        """
+        size = self.transform_size
+        evaluation_cost = (self.polynomial_degree + 1) * self.number_of_parties
+        return evaluation_cost > TRANSFORM_COST_FACTOR * size * max(math.log2(size), 1)
+
+    def share_secret(self, secret: int) -> ShamirShares:
+        """
+        Function that creates shares of a value for each party.
+
+        :param secret: secret to be shared
+        :return: sharing of the secret
+        """
+        shares = self.share_secrets([secret])
+        return ShamirShares(self, {i: column[0] for i, column in shares.items()})
+
+    def share_secrets(self, values: Sequence[int]) -> dict[int, list[int]]:
+        """
+        Function that creates shares of many values at once for each party, evaluating every
+        sharing polynomial with a single transform.
+
+        :param values: secrets to be shared
+        :return: columnar sharing of the secrets, mapping every party id to the list containing
+            the share of that party for every secret (in the order of values)
+        """
+        if not self.uses_transforms:
+            return super().share_secrets(values)
+        random_coefficients = self.randomness.sample_matrix(
+            self.modulus, self.polynomial_degree, len(values)
+        )
+        padding = [0] * (self.transform_size - self.polynomial_degree - 1)
+        evaluations = [
+            ntt([*polynomial, *padding], self.root, self.modulus)
+            for polynomial in zip(values, *random_coefficients)
+        ]
+        return {
+            i: [evaluation[i - 1] for evaluation in evaluations]
+            for i in range(1, self.number_of_parties + 1)
+        }
+
+    def lagrange_coefficients(self, party_ids: Iterable[int]) -> dict[int, int]:
+        """
+        Lagrange coefficients for reconstructing a secret from the shares of the given parties.
+        The coefficients of consecutive parties are computed in linear time, other sets use the
+        generic Lagrange coefficients of their evaluation points. Both are cached.
+
+        :param party_ids: ids of the parties in the reconstruction set
+        :return: mapping from every party id to its Lagrange coefficient
+        """
+        sorted_ids = tuple(sorted(party_ids))
+        if not sorted_ids:
+            return {}
+        if sorted_ids[-1] - sorted_ids[0] == len(sorted_ids) - 1:
+            weights = consecutive_weights(self.modulus, self.root, len(sorted_ids))
+        else:
+            weights = lagrange_coefficients(
+                self.modulus, tuple(self.points[i - 1] for i in sorted_ids)
+            )
+        return dict(zip(sorted_ids, weights))
+
+    def interpolate(
+        self, shares_by_party: Mapping[int, Sequence[int]]
+    ) -> list[list[int]]:
+        """
+        Coefficients of the sharing polynomials from the shares of all parties, with an inverse
+        transform per secret. Requires that the number of parties equals the transform size.
+
+        :param shares_by_party: mapping from every party id to the shares of that party for
+            every secret
+        :raise ValueError: In case not all transform_size parties are present.
+        :return: the coefficients of the polynomial of every secret, starting with the secret
+        """
+        if sorted(shares_by_party) != list(range(1, self.transform_size + 1)):
+            raise ValueError(
+                "Interpolation with transforms requires the shares of all "
+                f"{self.transform_size} parties."
+            )
+        columns = [shares_by_party[i] for i in range(1, self.transform_size + 1)]
+        return [
+            inverse_ntt(evaluations, self.root, self.modulus)
+            for evaluations in zip(*columns)
+        ]
+
+    @staticmethod
+    def deserialize(
+        obj: ShamirSecretSharingScheme.SerializedShamirSecretSharingScheme,
+        **_kwargs: Any,
+    ) -> NTTShamirSecretSharingScheme:
+        r"""
+        Deserialization function for the secret sharing scheme with roots of unity as evaluation
+        points, which will be passed to the communication module.
+
+        :param obj: serialization of a secret sharing scheme
+        :param \**_kwargs: optional extra keyword arguments
+        :raise ValueError: In case the serialized scheme has different evaluation points.
+        :return: Deserialized NTTShamirSecretSharingScheme.
+        """
+        scheme = ShamirSecretSharingScheme.deserialize(obj)
+        if not isinstance(scheme, NTTShamirSecretSharingScheme):
+            raise ValueError("The serialized scheme does not use roots of unity.")
+        return scheme
+
+
+if COMMUNICATION_INSTALLED:
+    try:
+        Serialization.register_class(NTTShamirSecretSharingScheme)
+    except RepetitionError:
+        pass
@@ -0,0 +1,431 @@
+"""
+Utility for packed (Franklin-Yung) Shamir secret sharing, which embeds multiple secrets in a
+single sharing polynomial.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Sequence
+from functools import lru_cache
+from operator import mul
+from typing import Any, TypedDict
+
+from tno.mpc.communication import SupportsSerialization
+
+from tno.mpc.encryption_schemes.shamir.randomness import (
+    DEFAULT_RANDOMNESS,
+    RandomnessSource,
+)
+from tno.mpc.encryption_schemes.shamir.utils import (
+    compute_lagrange_coefficients,
+    is_prime_cached,
+)
+
+PACKED_LAGRANGE_CACHE_SIZE = 128
+
+# Check to see if the communication module is available
+try:
+    from tno.mpc.communication import RepetitionError, Serialization
+
+    COMMUNICATION_INSTALLED = True
+except ModuleNotFoundError:
+    COMMUNICATION_INSTALLED = False
+
+
+@lru_cache(maxsize=PACKED_LAGRANGE_CACHE_SIZE)
+def packed_lagrange_coefficients(
+    modulus: int, party_ids: tuple[int, ...], evaluation_points: tuple[int, ...]
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Utility function to compute the Lagrange coefficients for interpolation of the values in
+    several evaluation points of a polynomial from its evaluations in the given points.
+
+    The results are kept in a bounded LRU cache of their own, such that the evaluation points of
+    the packed scheme do not evict the reconstruction sets of the regular schemes from the cache
+    of utils.lagrange_coefficients.
+
+    :param modulus: prime modulus of the field in which to interpolate
+    :param party_ids: evaluation points of the polynomial, i.e. the ids of the parties
+    :param evaluation_points: points in which the polynomial is interpolated
+    :return: for every evaluation point, the Lagrange coefficient of every party id
+    """
+    return tuple(
+        compute_lagrange_coefficients(modulus, party_ids, evaluation_point)
+        for evaluation_point in evaluation_points
+    )
+
+
+class PackedShamirSecretSharingScheme(SupportsSerialization):
+    r"""
+    Class with packed Shamir secret sharing functionality.
+
+    The pack_size secrets are embedded at the evaluation points $0, -1, \ldots, -(k-1)$ of a
+    polynomial of degree $t + k - 1$, where $t$ is the corruption threshold and $k$ the pack size.
+    The polynomial is fixed by the secrets together with $t$ random values at the evaluation
+    points $-k, \ldots, -(k+t-1)$, and the parties receive its evaluations at the points
+    $1, \ldots, n$.
+    """
+
+    def __init__(
+        self,
+        modulus: int,
+        number_of_parties: int,
+        polynomial_degree: int,
+        pack_size: int,
+        randomness: RandomnessSource | None = None,
+    ) -> None:
+        r"""
+        Initialize a packed secret sharing scheme that embeds $k$ secrets in every sharing and
+        remains private against $t$ corrupted parties, where
+
+        - $t$ = \text{polynomial_degree}$
+        - $k$ = \text{pack_size}$
+        - $n$ = \text{number_of_parties}$
+
+        Note that the sharing polynomials have degree $t + k - 1$, so $t + k$ shares are required
+        for reconstruction.
+
+        :param modulus: prime modulus of the coefficients in the polynomials used to create shares
+        :param number_of_parties: number of shares that need to be created for each sharing
+        :param polynomial_degree: corruption threshold, i.e. the degree of the polynomials used to
+            create shares when the pack size is one
+        :param pack_size: number of secrets that are embedded in a single sharing
+        :param randomness: source of the random polynomial coefficients, secrets.randbelow is used
+            if None
+        :raise ValueError: In case the pack size is not positive or the modulus is too small to
+            provide distinct evaluation points for the parties, secrets and randomness.
+        """
+        if pack_size < 1:
+            raise ValueError("The pack size should be at least one.")
+        if modulus <= number_of_parties + pack_size + polynomial_degree:
+            raise ValueError(
+                "The modulus is too small to provide distinct evaluation points."
+            )
+        self.modulus = modulus
+        self.number_of_parties = number_of_parties
+        self.polynomial_degree = polynomial_degree
+        self.pack_size = pack_size
+        self.randomness = DEFAULT_RANDOMNESS if randomness is None else randomness
+
+        if not is_prime_cached(self.modulus):
+            warnings.warn(f"The modulus {self.modulus} is not prime")
+
+        self._sharing_matrix: list[list[int]] | None = None
+
+    @property
+    def packed_degree(self) -> int:
+        """
+        Degree of the polynomials used to create packed shares, i.e. $t + k - 1$.
+
+        :return: degree of the sharing polynomials
+        """
+        return self.polynomial_degree + self.pack_size - 1
+
+    @property
+    def secret_points(self) -> tuple[int, ...]:
+        r"""
+        Evaluation points at which the secrets are embedded, i.e. $0, -1, \ldots, -(k-1)$
+        modulo the modulus.
+
+        :return: evaluation point of every secret in a pack
+        """
+        return tuple(-j % self.modulus for j in range(self.pack_size))
+
+    @property
+    def sharing_matrix(self) -> list[list[int]]:
+        """
+        Matrix that maps the values of a sharing polynomial at the secret and randomness points to
+        its values at the points [1,..,n] of the parties. Entry [i][j] is the j-th Lagrange basis
+        polynomial on the secret and randomness points evaluated at party i + 1.
+
+        Analogously to the Vandermonde matrix of the regular scheme, the matrix is constructed on
+        the first call.
+
+        :return: A matrix of dimensions self.number_of_parties x (self.packed_degree + 1)
+        """
+        if not self._sharing_matrix:
+            defining_points = tuple(
+                -j % self.modulus for j in range(self.packed_degree + 1)
+            )
+            self._sharing_matrix = [
+                list(row)
+                for row in packed_lagrange_coefficients(
+                    self.modulus,
+                    defining_points,
+                    tuple(range(1, self.number_of_parties + 1)),
+                )
+            ]
+        return self._sharing_matrix
+
+    def share_secret(self, values: Sequence[int]) -> PackedShamirShares:
+        """
+        Function that creates packed shares of pack_size values for each party.
+
+        :param values: secrets to be shared, at most pack_size of them; missing secrets are
+            padded with zeros
+        :raise ValueError: In case more than pack_size values are provided.
+        :return: packed sharing of the secrets
+        """
+        if len(values) > self.pack_size:
+            raise ValueError(
+                f"At most {self.pack_size} values can be packed in a single sharing."
+            )
+        # The polynomial is defined by its values at the secret and randomness points
+        defining_values = (
+            list(values)
+            + [0] * (self.pack_size - len(values))
+            + self.randomness.sample(self.modulus, self.polynomial_degree)
+        )
+        # Player IDs are equal to the points of evaluation.
+        shares = {
+            ind
+            + 1: sum(map(mul, self.sharing_matrix[ind], defining_values)) % self.modulus
+            for ind in range(self.number_of_parties)
+        }
+        return PackedShamirShares(self, shares, self.packed_degree)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare equality between this PackedShamirSecretSharingScheme and the other object.
+
+        :param other: Object to compare with.
+        :return: Boolean stating (in)equality
+        """
+        if isinstance(other, PackedShamirSecretSharingScheme):
+            return (
+                self.modulus == other.modulus
+                and self.number_of_parties == other.number_of_parties
+                and self.polynomial_degree == other.polynomial_degree
+                and self.pack_size == other.pack_size
+            )
+        # else
+        return False
+
+    class SerializedPackedShamirSecretSharingScheme(TypedDict):
+        """
+        Class which contains the information of the packed shamir secret sharing scheme from
+        which deserialization is possible.
+        """
+
+        P: int
+        n: int
+        t: int
+        k: int
+
+    def serialize(
+        self, **_kwargs: Any
+    ) -> PackedShamirSecretSharingScheme.SerializedPackedShamirSecretSharingScheme:
+        r"""
+        Serialization function for the packed shamir secret sharing scheme, which will be passed
+        to the communication module
+
+        :param \**_kwargs: optional extra keyword arguments
+        :return: json object containing the necessary information to deserialize
+        """
+        return {
+            "P": self.modulus,
+            "n": self.number_of_parties,
+            "t": self.polynomial_degree,
+            "k": self.pack_size,
+        }
+
+    @staticmethod
+    def deserialize(
+        obj: PackedShamirSecretSharingScheme.SerializedPackedShamirSecretSharingScheme,
+        **_kwargs: Any,
+    ) -> PackedShamirSecretSharingScheme:
+        r"""
+        Deserialization function for the packed shamir secret sharing scheme, which will be
+        passed to the communication module
+
+        :param obj: serialization of a packed shamir secret sharing scheme
+        :param \**_kwargs: optional extra keyword arguments
+        :return: Deserialized PackedShamirSecretSharingScheme.
+        """
+        return PackedShamirSecretSharingScheme(obj["P"], obj["n"], obj["t"], obj["k"])
+
+
+class PackedShamirShares(SupportsSerialization):
+    """
+    Class that keeps track of the packed shares for a pack of values
+    """
+
+    def __init__(
+        self,
+        shamir_sss: PackedShamirSecretSharingScheme,
+        shares: dict[int, int],
+        degree: int,
+    ) -> None:
+        self.scheme = shamir_sss
+        self.shares = shares
+        # The degree of the polynomial used for sharing the secrets, i.e. at least degree+1
+        # shares are required to reconstruct.
+        self.degree = degree
+
+    def __str__(self) -> str:
+        """
+        String formatted version of this PackedShamirShares object.
+
+        :return: Pretty string.
+        """
+        if self.shares:
+            text = "shares: "
+            for share_key in self.shares.keys():
+                text += f"key: {share_key} share:{str(self.shares[share_key])}, "
+            text += "degree: " + str(self.degree)
+            return text
+        # else
+        return f"shares: <no shares> degree: {self.degree}"
+
+    class SerializedPackedShamirShares(TypedDict):
+        """
+        Class which contains the information of the packed shamir shares from which
+        deserialization is possible.
+        """
+
+        scheme: (
+            PackedShamirSecretSharingScheme.SerializedPackedShamirSecretSharingScheme
+        )
+        shares: dict[int, int]
+        degree: int
+
+    def serialize(
+        self, **_kwargs: Any
+    ) -> PackedShamirShares.SerializedPackedShamirShares:
+        r"""
+        Serialization function for the packed shamir shares and corresponding scheme, which will
+        be passed to the communication module
+
+        :param \**_kwargs: optional extra keyword arguments
+        :return: json object containing the necessary information to deserialize
+        """
+        return {
+            "scheme": self.scheme.serialize(),
+            "shares": self.shares,
+            "degree": self.degree,
+        }
+
+    @staticmethod
+    def deserialize(
+        obj: PackedShamirShares.SerializedPackedShamirShares, **_kwargs: Any
+    ) -> PackedShamirShares:
+        r"""
+        Deserialization function for the packed shamir shares and corresponding scheme, which
+        will be passed to the communication module
+
+        :param obj: serialization of the packed shamir shares
+        :param \**_kwargs: optional extra keyword arguments
+        :return: Deserialized PackedShamirShares object.
+        """
+        return PackedShamirShares(
+            PackedShamirSecretSharingScheme.deserialize(obj["scheme"]),
+            obj["shares"],
+            obj["degree"],
+        )
+
+    def reconstruct_secrets(self) -> list[int]:
+        """
+        Function that uses the shares from other parties to reconstruct (unpack) the secrets
+
+        :raise ValueError: In case not enough shares are known to reconstruct the secrets.
+        :return: original secrets
+        """
+        if len(self.shares) < self.degree + 1:
+            raise ValueError("Too little shares to reconstruct.")
+
+        # We will use the first self.degree+1 shares to reconstruct. This can be any subset.
+        reconstruction_set = tuple(sorted(list(self.shares.keys())[: self.degree + 1]))
+        reconstruction_shares = [self.shares[i] for i in reconstruction_set]
+        return [
+            sum(map(mul, coefficients, reconstruction_shares)) % self.scheme.modulus
+            for coefficients in packed_lagrange_coefficients(
+                self.scheme.modulus, reconstruction_set, self.scheme.secret_points
+            )
+        ]
+
+    def _check_compatibility(self, other: PackedShamirShares) -> None:
+        """
+        Check whether the other shares were created with the same scheme.
+
+        :param other: Shares to be combined with these shares.
+        :raise ValueError: In case a different secret sharing scheme was used.
+        """
+        if self.scheme != other.scheme:
+            raise ValueError(
+                "Different secret sharing schemes have been used, i.e. shares are incompatible."
+            )
+
+    def __add__(self, other: PackedShamirShares) -> PackedShamirShares:
+        """
+        Add the packed shares belonging to the two given PackedShamirShares values together, i.e.
+        add the secrets element-wise.
+
+        :param other: Shares to be added to these shares.
+        :return: New PackedShamirShares object where the shares have been added together.
+        """
+        self._check_compatibility(other)
+        shares = {
+            i: (self.shares[i] + other.shares[i]) % self.scheme.modulus
+            for i in self.shares.keys()
+        }
+        return PackedShamirShares(self.scheme, shares, max(self.degree, other.degree))
+
+    def __sub__(self, other: PackedShamirShares) -> PackedShamirShares:
+        """
+        Subtract other PackedShamirShares (subtrahend) from these PackedShamirShares (minuend),
+        i.e. subtract the secrets element-wise.
+
+        :param other: Shares to be subtracted from these shares.
+        :return: New PackedShamirShares object representing the difference between these shares
+            and other.
+        """
+        self._check_compatibility(other)
+        shares = {
+            i: (self.shares[i] - other.shares[i]) % self.scheme.modulus
+            for i in self.shares.keys()
+        }
+        return PackedShamirShares(self.scheme, shares, max(self.degree, other.degree))
+
+    def __mul__(self, other: PackedShamirShares) -> PackedShamirShares:
+        """
+        Multiply the packed shares belonging to the two given PackedShamirShares values together,
+        i.e. multiply the secrets element-wise. The degree of the resulting sharing is the sum of
+        the degrees of both sharings.
+
+        :param other: Shares to be multiplied with these shares.
+        :return: New PackedShamirShares object where the shares have been multiplied together.
+        """
+        if not isinstance(other, PackedShamirShares):
+            return NotImplemented
+        self._check_compatibility(other)
+        shares = {
+            i: (self.shares[i] * other.shares[i]) % self.scheme.modulus
+            for i in self.shares.keys()
+        }
+        return PackedShamirShares(self.scheme, shares, self.degree + other.degree)
+
+    def __rmul__(self, other: Any) -> PackedShamirShares:
+        """
+        Multiply all secrets in these packed shares with a given scalar integer.
+
+        :param other: Scalar to be multiplied with these shares.
+        :raise ValueError: raised when other is not an integer.
+        :return: New PackedShamirShares object where the shares have been multiplied by the scalar.
+        """
+        if isinstance(other, int):
+            shares = {
+                i: (other * self.shares[i]) % self.scheme.modulus
+                for i in self.shares.keys()
+            }
+            return PackedShamirShares(self.scheme, shares, self.degree)
+        # else
+        raise ValueError("Packed shares can only be multiplied by a scalar integer.")
+
+
+if COMMUNICATION_INSTALLED:
+    try:
+        Serialization.register_class(PackedShamirSecretSharingScheme)
+        Serialization.register_class(PackedShamirShares)
+    except RepetitionError:
+        pass
@@ -0,0 +1,463 @@
+"""
+Parallel sharing and reconstruction of large batches over multiple processes.
+
+The big-integer arithmetic of sharing and interpolation is CPU-bound and therefore limited to a
+single core by the GIL. A ParallelShamirEngine shards a batch into chunks that are processed by
+a persistent pool of worker processes. Every worker creates the scheme, including its
+Vandermonde matrix, once when it starts. The workers write their results in a fixed-width
+encoding to a shared memory block, from which the engine decodes the columns of all parties,
+instead of returning pickled results.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any, Union
+
+from tno.mpc.encryption_schemes.shamir.backend import PythonBackend
+from tno.mpc.encryption_schemes.shamir.randomness import RandomnessSource
+from tno.mpc.encryption_schemes.shamir.shamir import ShamirSecretSharingScheme
+from tno.mpc.encryption_schemes.shamir.shamir_secret_sharing_integers import (
+    ShamirSecretSharingIntegers,
+)
+from tno.mpc.encryption_schemes.shamir.utils import (
+    decode_fixed_width,
+    encode_fixed_width,
+    limb_size,
+)
+
+DEFAULT_CHUNK_SIZE = 1_000
+
+Scheme = Union[ShamirSecretSharingScheme, ShamirSecretSharingIntegers]
+
+# Scheme of a worker process, created once by _initialize_worker
+_worker_scheme: Scheme | None = None
+
+
+def _create_scheme(
+    scheme_type: type[Scheme],
+    parameters: Mapping[str, Any],
+    randomness_type: type[RandomnessSource],
+    backend: PythonBackend | None,
+) -> Scheme:
+    """
+    Create a scheme from its serialization, with a fresh randomness source.
+
+    :param scheme_type: class of the scheme, e.g. a subclass of ShamirSecretSharingScheme with
+        other evaluation points
+    :param parameters: serialization of the scheme
+    :param randomness_type: type of the randomness source, constructible without arguments
+    :param backend: arithmetic backend of a ShamirSecretSharingScheme, None for integer schemes
+    :return: the scheme
+    """
+    if issubclass(scheme_type, ShamirSecretSharingScheme):
+        return scheme_type(
+            parameters["P"],
+            parameters["n"],
+            parameters["t"],
+            randomness=randomness_type(),
+            backend=backend,
+        )
+    return ShamirSecretSharingIntegers(
+        kappa=parameters["kappa"],
+        max_int=parameters["max_int"],
+        number_of_parties=parameters["number_of_parties"],
+        polynomial_degree=parameters["polynomial_degree"],
+        randomness=randomness_type(),
+        tight_interval=parameters.get("tight_interval", False),
+    )
+
+
+def _initialize_worker(
+    scheme_type: type[Scheme],
+    parameters: Mapping[str, Any],
+    randomness_type: type[RandomnessSource],
+    backend: PythonBackend | None,
+) -> None:
+    """
+    Create the scheme of a worker process and precompute its Vandermonde matrix.
+
+    :param scheme_type: class of the scheme
+    :param parameters: serialization of the scheme
+    :param randomness_type: type of the randomness source, constructible without arguments
+    :param backend: arithmetic backend of a ShamirSecretSharingScheme, None for integer schemes
+    """
+    global _worker_scheme  # pylint: disable=global-statement
+    _worker_scheme = _create_scheme(scheme_type, parameters, randomness_type, backend)
+    _ = _worker_scheme.van_der_monde
+
+
+def _share(scheme: Scheme, values: Sequence[int]) -> list[list[int]]:
+    """
+    Share values with a scheme.
+
+    :param scheme: scheme with which the values are shared
+    :param values: secrets to be shared
+    :return: the shares of every party (in the order of the party ids) for every secret
+    """
+    return list(scheme.share_secrets(values).values())
+
+
+def _reconstruct(
+    scheme: Scheme,
+    shares: Mapping[int, Sequence[int]],
+    degree: int,
+    scaling: int,
+    modulus: int,
+) -> list[int]:
+    """
+    Reconstruct secrets from the shares of a reconstruction set.
+
+    :param scheme: scheme with which the secrets are shared
+    :param shares: columnar shares of the reconstruction set
+    :param degree: degree of the sharings
+    :param scaling: scaling of integer sharings
+    :param modulus: modulus of the reconstruction of integer sharings, 0 for none
+    :return: the reconstructed secrets
+    """
+    if isinstance(scheme, ShamirSecretSharingScheme):
+        if degree != scheme.polynomial_degree:
+            scheme = scheme.with_degree(degree)
+        return scheme.reconstruct_many(shares)
+    return scheme.reconstruct_many(shares, degree, scaling, modulus)
+
+
+def _shared_buffer(memory: SharedMemory) -> memoryview:
+    """
+    The buffer of a shared memory block.
+
+    :param memory: shared memory block
+    :raise RuntimeError: In case the shared memory block has no buffer (anymore).
+    :return: buffer of the shared memory block
+    """
+    buffer = memory.buf
+    if buffer is None:
+        raise RuntimeError(f"The shared memory block {memory.name} has no buffer.")
+    return buffer
+
+
+def _get_worker_scheme() -> Scheme:
+    """
+    The scheme of the current worker process.
+
+    :raise RuntimeError: In case the worker process has not been initialized.
+    :return: the scheme that was set up by _initialize_worker
+    """
+    if _worker_scheme is None:
+        raise RuntimeError("The scheme of the worker process has not been initialized.")
+    return _worker_scheme
+
+
+def _write_rows(
+    rows: Sequence[Sequence[int]],
+    name: str,
+    start: int,
+    count: int,
+    width: int,
+    signed: bool,
+) -> None:
+    """
+    Write a chunk of every row of a result to a shared memory block.
+
+    :param rows: chunk of every row
+    :param name: name of the shared memory block
+    :param start: index of the first element of the chunk within its row
+    :param count: length of every row
+    :param width: number of bytes per element
+    :param signed: whether the elements can be negative
+    """
+    memory = SharedMemory(name=name)
+    try:
+        buffer = _shared_buffer(memory)
+        for index, row in enumerate(rows):
+            offset = (index * count + start) * width
+            buffer[offset : offset + len(row) * width] = encode_fixed_width(
+                row, width, signed
+            )
+    finally:
+        memory.close()
+
+
+def _share_chunk(values: Sequence[int], *layout: Any) -> None:
+    """
+    Share a chunk of values in a worker process and write the shares to shared memory.
+
+    :param values: secrets to be shared
+    :param layout: name of the shared memory block, start of the chunk, length of the rows,
+        width and signedness of the elements, see _write_rows
+    """
+    _write_rows(_share(_get_worker_scheme(), values), *layout)
+
+
+def _reconstruct_chunk(
+    shares: Mapping[int, Sequence[int]],
+    degree: int,
+    scaling: int,
+    modulus: int,
+    *layout: Any,
+) -> None:
+    """
+    Reconstruct a chunk of secrets in a worker process and write them to shared memory.
+
+    :param shares: chunk of the columnar shares of the reconstruction set
+    :param degree: degree of the sharings
+    :param scaling: scaling of integer sharings
+    :param modulus: modulus of the reconstruction of integer sharings, 0 for none
+    :param layout: name of the shared memory block, start of the chunk, length of the rows,
+        width and signedness of the elements, see _write_rows
+    """
+    _write_rows(
+        [_reconstruct(_get_worker_scheme(), shares, degree, scaling, modulus)], *layout
+    )
+
+
+class ParallelShamirEngine:
+    """
+    Sharing and reconstruction of large batches with a ShamirSecretSharingScheme or a
+    ShamirSecretSharingIntegers scheme over a persistent pool of worker processes.
+
+    Batches of at most chunk_size elements are processed in the calling process. Every worker
+    samples its coefficients from a fresh instance of the type of the randomness source of the
+    scheme, such that a seeded source is never used by multiple processes; the type should
+    therefore be constructible without arguments.
+    """
+
+    def __init__(
+        self,
+        shamir_sss: Scheme,
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Initialize a parallel engine. The worker processes are started on first use.
+
+        :param shamir_sss: scheme with which the secrets are shared
+        :param max_workers: number of worker processes, the number of processors if None
+        :param chunk_size: number of elements that is processed by a worker at once
+        :raise ValueError: In case the chunk size is not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size should be positive.")
+        self.scheme = shamir_sss
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """
+        Persistent pool of worker processes, which is created on first use.
+
+        :return: the pool of worker processes
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self.max_workers,
+                initializer=_initialize_worker,
+                initargs=(
+                    type(self.scheme),
+                    self.scheme.serialize(),
+                    type(self.scheme.randomness),
+                    (
+                        self.scheme.backend
+                        if isinstance(self.scheme, ShamirSecretSharingScheme)
+                        else None
+                    ),
+                ),
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> ParallelShamirEngine:
+        """
+        Use the engine as a context manager, which shuts down the worker processes on exit.
+
+        :return: this engine
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Shut down the worker processes.
+
+        :param exc_type: type of the raised exception, if any
+        :param exc_value: raised exception, if any
+        :param traceback: traceback of the raised exception, if any
+        """
+        self.close()
+
+    def _run(
+        self,
+        task: Callable[..., None],
+        chunks: Sequence[tuple[Any, ...]],
+        rows: int,
+        count: int,
+        width: int,
+        signed: bool,
+    ) -> list[list[int]]:
+        """
+        Process chunks in the worker processes and collect their results from shared memory.
+
+        :param task: function that processes a chunk in a worker process and writes its rows
+        :param chunks: arguments of the task for every chunk, of chunk_size elements each
+        :param rows: number of rows of the result
+        :param count: length of every row
+        :param width: number of bytes per element
+        :param signed: whether the elements can be negative
+        :return: the rows of the result
+        """
+        size = rows * count * width
+        memory = SharedMemory(create=True, size=size)
+        try:
+            futures = [
+                self.executor.submit(
+                    task,
+                    *arguments,
+                    memory.name,
+                    index * self.chunk_size,
+                    count,
+                    width,
+                    signed,
+                )
+                for index, arguments in enumerate(chunks)
+            ]
+            for future in futures:
+                future.result()
+            data = bytes(_shared_buffer(memory)[:size])
+        finally:
+            memory.close()
+            memory.unlink()
+        row_size = count * width
+        return [
+            decode_fixed_width(
+                data[row * row_size : (row + 1) * row_size], width, signed
+            )
+            for row in range(rows)
+        ]
+
+    def _split(self, values: Sequence[int]) -> list[Sequence[int]]:
+        """
+        Split values into chunks of chunk_size elements.
+
+        :param values: values to be split
+        :return: the chunks
+        """
+        return [
+            values[start : start + self.chunk_size]
+            for start in range(0, len(values), self.chunk_size)
+        ]
+
+    def share_secrets(self, values: Sequence[int]) -> dict[int, list[int]]:
+        """
+        Share many values at once, in parallel.
+
+        :param values: secrets to be shared
+        :return: columnar sharing of the secrets, mapping every party id to the list containing
+            the share of that party for every secret (in the order of values)
+        """
+        scheme = self.scheme
+        parties = range(1, scheme.number_of_parties + 1)
+        if len(values) <= self.chunk_size:
+            return dict(zip(parties, _share(scheme, values)))
+        if isinstance(scheme, ShamirSecretSharingScheme):
+            width, signed = limb_size(scheme.modulus), False
+        else:
+            # Every share is a sum of degree + 1 terms of at most n^degree times a coefficient
+            largest = max(
+                math.factorial(scheme.number_of_parties) * max(map(abs, values)),
+                scheme.randomness_interval,
+            )
+            bound = (
+                (scheme.polynomial_degree + 1)
+                * scheme.number_of_parties**scheme.polynomial_degree
+                * largest
+            )
+            width, signed = bound.bit_length() // 8 + 1, True
+        columns = self._run(
+            _share_chunk,
+            [(chunk,) for chunk in self._split(values)],
+            scheme.number_of_parties,
+            len(values),
+            width,
+            signed,
+        )
+        return dict(zip(parties, columns))
+
+    def reconstruct_many(
+        self,
+        shares_by_party: Mapping[int, Sequence[int]],
+        degree: int | None = None,
+        scaling: int | None = None,
+        modulus: int = 0,
+    ) -> list[int]:
+        """
+        Reconstruct many secrets at once from a columnar sharing, in parallel. Similar to
+        ShamirSecretSharingScheme.reconstruct_many, the first degree + 1 parties are used.
+
+        :param shares_by_party: mapping from party id to the shares of that party for every secret
+        :param degree: degree of the sharings, the polynomial degree of the scheme if None
+        :param scaling: scaling of integer sharings, the factorial of the number of parties if
+            None
+        :param modulus: modulus of the reconstruction of integer sharings, 0 for none
+        :raise ValueError: In case not enough parties are present to reconstruct the secrets, in
+            case the parties hold a different number of shares, or in case a scaling or modulus
+            is given for a ShamirSecretSharingScheme.
+        :return: reconstructed secrets, in the order of the shares
+        """
+        scheme = self.scheme
+        is_prime_field = isinstance(scheme, ShamirSecretSharingScheme)
+        if is_prime_field and (scaling is not None or modulus != 0):
+            raise ValueError(
+                "A scaling and modulus only apply to sharings over the integers."
+            )
+        degree = scheme.polynomial_degree if degree is None else degree
+        if scaling is None:
+            scaling = math.factorial(scheme.number_of_parties)
+        if len(shares_by_party) < degree + 1:
+            raise ValueError("Too little shares to reconstruct.")
+        reconstruction_set = list(shares_by_party.keys())[: degree + 1]
+        columns = [shares_by_party[i] for i in reconstruction_set]
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All parties should hold the same number of shares.")
+        count = len(columns[0])
+        if count <= self.chunk_size:
+            return _reconstruct(
+                scheme,
+                dict(zip(reconstruction_set, columns)),
+                degree,
+                scaling,
+                modulus,
+            )
+        if isinstance(scheme, ShamirSecretSharingScheme):
+            width, signed = limb_size(scheme.modulus), False
+        elif modulus != 0:
+            width, signed = limb_size(modulus), False
+        else:
+            # Every Lagrange coefficient is at most n^degree in absolute value
+            bound = (
+                (degree + 1)
+                * scheme.number_of_parties**degree
+                * max(max(map(abs, column)) for column in columns)
+            )
+            width, signed = bound.bit_length() // 8 + 1, True
+        chunks = [
+            (dict(zip(reconstruction_set, chunk)), degree, scaling, modulus)
+            for chunk in zip(*(self._split(column) for column in columns))
+        ]
+        return self._run(_reconstruct_chunk, chunks, 1, count, width, signed)[0]
@@ -0,0 +1,304 @@
+r"""
+Seed-compressed and pseudo-random secret sharing (PRSS).
+
+Seed-compressed sharing: a uniformly random polynomial $f$ of degree $t$ with $f(0) = s$ is
+fixed just as well by $s$ together with the $t$ uniformly random shares $f(1), \ldots, f(t)$.
+The dealer therefore sends a short seed to each of the parties $1, \ldots, t$, from which they
+derive their shares locally, and only computes (by interpolation through the secret) and sends
+the shares of the remaining $n - t$ parties.
+
+PRSS, in the style of Cramer, Damgård and Ishai: every maximal unqualified set $A$ of $t$
+parties is associated with a key $r_A$ that is known to all parties outside of $A$. The parties
+then derive shares of fresh random values, or of zero, without any interaction, by combining
+the pseudo-random values derived from their keys with the degree-$t$ polynomials $f_A$ that
+satisfy $f_A(0) = 1$ and $f_A(j) = 0$ for $j \in A$.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+from collections.abc import Mapping, Sequence
+from itertools import combinations
+from operator import mul
+
+from tno.mpc.encryption_schemes.utils import mod_inv
+
+from tno.mpc.encryption_schemes.shamir.distributed import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    MessagePool,
+    receive_batched,
+    send_batched,
+)
+from tno.mpc.encryption_schemes.shamir.randomness import SEED_SIZE, StreamRandomness
+from tno.mpc.encryption_schemes.shamir.shamir import (
+    DEFAULT_EVALUATION_POINTS,
+    ShamirSecretSharingScheme,
+)
+from tno.mpc.encryption_schemes.shamir.utils import lagrange_coefficients
+
+_COUNTER_SIZE = 8
+
+
+def _check_evaluation_points(scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Check that a scheme uses the default evaluation points, i.e. that party i evaluates in i.
+
+    :param scheme: scheme to be checked
+    :raise ValueError: In case the scheme uses other evaluation points.
+    """
+    if scheme.evaluation_points != DEFAULT_EVALUATION_POINTS:
+        raise ValueError(
+            "Only schemes with the default evaluation points are supported."
+        )
+
+
+def seed_parties(scheme: ShamirSecretSharingScheme) -> range:
+    """
+    Ids of the parties that receive a seed instead of their shares in a seed-compressed
+    sharing, i.e. the first polynomial_degree parties.
+
+    :param scheme: scheme with which the values are shared
+    :return: ids of the parties that receive a seed
+    """
+    return range(1, scheme.polynomial_degree + 1)
+
+
+def expand_seed(
+    scheme: ShamirSecretSharingScheme, seed: bytes, count: int
+) -> list[int]:
+    """
+    Derive the shares of a party from the seed it received in a seed-compressed sharing.
+
+    :param scheme: scheme with which the values are shared
+    :param seed: seed of the party
+    :param count: number of shared values
+    :return: shares of the party, in the order of the values
+    """
+    return StreamRandomness(seed).sample(scheme.modulus, count)
+
+
+def share_secrets_compressed(
+    scheme: ShamirSecretSharingScheme, values: Sequence[int]
+) -> tuple[dict[int, bytes], dict[int, list[int]]]:
+    """
+    Create a seed-compressed sharing of many values at once.
+
+    :param scheme: scheme with which the values are shared
+    :param values: secrets to be shared
+    :raise ValueError: In case the scheme does not use the default evaluation points.
+    :return: seed of every party in seed_parties, and the (columnar) shares of every other party
+    """
+    _check_evaluation_points(scheme)
+    seeds = {i: secrets.token_bytes(SEED_SIZE) for i in seed_parties(scheme)}
+    seeded_shares = [expand_seed(scheme, seed, len(values)) for seed in seeds.values()]
+    # Every polynomial is fixed by the secret in 0 and the seeded shares in 1, ..., t
+    polynomials = list(zip(values, *seeded_shares))
+    points = (0, *seeds)
+    explicit_shares = {}
+    for j in range(scheme.polynomial_degree + 1, scheme.number_of_parties + 1):
+        weights = lagrange_coefficients(scheme.modulus, points, j)
+        explicit_shares[j] = [
+            sum(map(mul, weights, polynomial)) % scheme.modulus
+            for polynomial in polynomials
+        ]
+    return seeds, explicit_shares
+
+
+async def distribute_shares_compressed(
+    pool: MessagePool,
+    party_names: Mapping[int, str],
+    scheme: ShamirSecretSharingScheme,
+    values: Sequence[int],
+    msg_id: str = "compressed_shares",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[int] | None:
+    """
+    Share many values with a seed-compressed sharing and distribute the seeds and shares from a
+    dealer to the parties. The parties in seed_parties receive a single message with their seed,
+    the other parties receive their shares in batched messages.
+
+    :param pool: communication pool of the dealer
+    :param party_names: mapping from the id of every party, other than the dealer, to its handler
+        name in the pool
+    :param scheme: scheme with which the values are shared
+    :param values: secrets to be shared
+    :param msg_id: identifier of the messages of this round
+    :param batch_size: maximum number of shares per message
+    :param max_concurrency: maximum number of messages that are sent concurrently
+    :return: the shares of the dealer if the dealer is one of the parties, None otherwise
+    """
+    seeds, explicit_shares = share_secrets_compressed(scheme, values)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    await asyncio.gather(
+        *(
+            pool.send(
+                party_names[i], {"seed": seed, "count": len(values)}, f"{msg_id}_seed"
+            )
+            for i, seed in seeds.items()
+            if i in party_names
+        ),
+        *(
+            send_batched(pool, party_names[i], shares, msg_id, batch_size, semaphore)
+            for i, shares in explicit_shares.items()
+            if i in party_names
+        ),
+    )
+    own_ids = [
+        i for i in range(1, scheme.number_of_parties + 1) if i not in party_names
+    ]
+    if not own_ids:
+        return None
+    if own_ids[0] in seeds:
+        return expand_seed(scheme, seeds[own_ids[0]], len(values))
+    return explicit_shares[own_ids[0]]
+
+
+async def receive_shares_compressed(
+    pool: MessagePool,
+    dealer_name: str,
+    party_id: int,
+    scheme: ShamirSecretSharingScheme,
+    msg_id: str = "compressed_shares",
+) -> list[int]:
+    """
+    Receive the shares that were distributed by a dealer with distribute_shares_compressed,
+    deriving them from the received seed if this party is one of the seed_parties.
+
+    :param pool: communication pool of this party
+    :param dealer_name: handler name of the dealer in the pool
+    :param party_id: id of this party in the secret sharing scheme
+    :param scheme: scheme with which the values are shared
+    :param msg_id: identifier of the messages of this round
+    :return: the shares of this party, in the order of the values
+    """
+    if party_id in seed_parties(scheme):
+        message = await pool.recv(dealer_name, f"{msg_id}_seed")
+        return expand_seed(scheme, message["seed"], message["count"])
+    return await receive_batched(pool, dealer_name, msg_id)
+
+
+def generate_prss_keys(
+    scheme: ShamirSecretSharingScheme,
+) -> dict[int, dict[tuple[int, ...], bytes]]:
+    """
+    Generate the PRSS keys of all parties, as a trusted dealer. Every party receives the keys of
+    all sets of polynomial_degree parties it is not a member of. Note that the number of keys
+    grows with the binomial coefficient of the number of parties and the polynomial degree, so
+    PRSS is only practical for a small number of parties.
+
+    :param scheme: scheme of the pseudo-random sharings
+    :return: mapping from every party id to the keys of that party, keyed by their set
+    """
+    parties = range(1, scheme.number_of_parties + 1)
+    keys: dict[int, dict[tuple[int, ...], bytes]] = {i: {} for i in parties}
+    for subset in combinations(parties, scheme.polynomial_degree):
+        key = secrets.token_bytes(SEED_SIZE)
+        for i in parties:
+            if i not in subset:
+                keys[i][subset] = key
+    return keys
+
+
+class PseudoRandomSecretSharing:
+    """
+    Class with the PRSS functionality of a single party, which derives shares of random values
+    and of zero from its keys without interaction.
+
+    All parties should perform the same sequence of calls, such that they use the same
+    pseudo-random values for every call.
+    """
+
+    def __init__(
+        self,
+        shamir_sss: ShamirSecretSharingScheme,
+        party_id: int,
+        keys: Mapping[tuple[int, ...], bytes],
+    ) -> None:
+        """
+        Initialize the PRSS of a party.
+
+        :param shamir_sss: scheme of the pseudo-random sharings
+        :param party_id: id of this party in the secret sharing scheme
+        :param keys: keys of this party, as generated by generate_prss_keys
+        :raise ValueError: In case the scheme does not use the default evaluation points.
+        """
+        _check_evaluation_points(shamir_sss)
+        self.scheme = shamir_sss
+        self.party_id = party_id
+        self.keys = keys
+        self._counter = 0
+        # Evaluation f_A(party_id) of the polynomial of every set A
+        self._weights = {subset: self._evaluate(subset) for subset in keys}
+
+    def _evaluate(self, subset: tuple[int, ...]) -> int:
+        """
+        Evaluate the degree-t polynomial that is one in zero and vanishes on the given set in the
+        point of this party.
+
+        :param subset: set of parties on which the polynomial vanishes
+        :return: evaluation of the polynomial in the point of this party
+        """
+        modulus = self.scheme.modulus
+        value = 1
+        for j in subset:
+            value = value * (j - self.party_id) * int(mod_inv(j, modulus)) % modulus
+        return value
+
+    def _pseudo_random(self, key: bytes, tag: bytes, count: int) -> list[int]:
+        """
+        Pseudo-random field elements derived from a key, for the current call.
+
+        :param key: key of a set of parties
+        :param tag: domain separation tag of the kind of sharing
+        :param count: number of field elements
+        :return: the pseudo-random field elements
+        """
+        nonce = tag + self._counter.to_bytes(_COUNTER_SIZE, "little")
+        return StreamRandomness(key + nonce).sample(self.scheme.modulus, count)
+
+    def random_shares(self, count: int) -> list[int]:
+        """
+        Shares of this party of count fresh pseudo-random values, shared with a polynomial of
+        degree polynomial_degree.
+
+        :param count: number of random values
+        :return: the shares of this party
+        """
+        self._counter += 1
+        shares = [0] * count
+        for subset, key in self.keys.items():
+            weight = self._weights[subset]
+            shares = [
+                share + weight * value
+                for share, value in zip(shares, self._pseudo_random(key, b"R", count))
+            ]
+        return [share % self.scheme.modulus for share in shares]
+
+    def zero_shares(self, count: int) -> list[int]:
+        """
+        Shares of this party of count sharings of zero, shared with a polynomial of degree
+        2 * polynomial_degree, e.g. to rerandomize the product of two sharings.
+
+        :param count: number of sharings of zero
+        :return: the shares of this party
+        """
+        self._counter += 1
+        modulus = self.scheme.modulus
+        degree = self.scheme.polynomial_degree
+        if degree == 0:
+            return [0] * count
+        powers = [pow(self.party_id, j, modulus) for j in range(1, degree + 1)]
+        shares = [0] * count
+        for subset, key in self.keys.items():
+            weight = self._weights[subset]
+            values = self._pseudo_random(key, b"Z", degree * count)
+            # every set contributes f_A(i) * sum_j x_{A,j} * i^j, which is zero in zero
+            rows = [values[j * count : (j + 1) * count] for j in range(degree)]
+            shares = [
+                share + weight * sum(map(mul, powers, column))
+                for share, column in zip(shares, zip(*rows))
+            ]
+        return [share % modulus for share in shares]
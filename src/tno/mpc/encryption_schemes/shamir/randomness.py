@@ -0,0 +1,144 @@
+"""
+Sources of randomness for sampling the coefficients of sharing polynomials.
+
+By default, every coefficient is sampled with secrets.randbelow. A StreamRandomness source
+instead expands a short random seed into a pseudo-random stream (SHAKE-256 in counter mode) and
+converts large blocks of this stream into many field elements at once by rejection sampling,
+which is considerably faster when many (large) coefficients are needed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import secrets
+from abc import ABC, abstractmethod
+
+from tno.mpc.encryption_schemes.shamir.utils import decode_fixed_width
+
+SEED_SIZE = 32
+_COUNTER_SIZE = 8
+
+
+class RandomnessSource(ABC):
+    """
+    Source of uniformly random integers in a range [0, bound).
+    """
+
+    @abstractmethod
+    def sample(self, bound: int, count: int) -> list[int]:
+        """
+        Sample integers uniformly at random from the range [0, bound).
+
+        :param bound: exclusive upper bound of the integers, at least 1
+        :param count: number of integers to sample
+        :return: the sampled integers
+        """
+
+    def randbelow(self, bound: int) -> int:
+        """
+        Sample a single integer uniformly at random from the range [0, bound).
+
+        :param bound: exclusive upper bound of the integer, at least 1
+        :return: the sampled integer
+        """
+        return self.sample(bound, 1)[0]
+
+    def sample_matrix(self, bound: int, rows: int, columns: int) -> list[list[int]]:
+        """
+        Sample a matrix of integers uniformly at random from the range [0, bound) in a single
+        call, e.g. the random coefficients of many sharing polynomials.
+
+        :param bound: exclusive upper bound of the integers, at least 1
+        :param rows: number of rows of the matrix
+        :param columns: number of columns of the matrix
+        :return: the sampled matrix, as a list of rows
+        """
+        values = self.sample(bound, rows * columns)
+        return [values[row * columns : (row + 1) * columns] for row in range(rows)]
+
+
+class SecretsRandomness(RandomnessSource):
+    """
+    Randomness source that samples every integer with secrets.randbelow.
+    """
+
+    def sample(self, bound: int, count: int) -> list[int]:
+        """
+        Sample integers uniformly at random from the range [0, bound).
+
+        :param bound: exclusive upper bound of the integers, at least 1
+        :param count: number of integers to sample
+        :return: the sampled integers
+        """
+        return [secrets.randbelow(bound) for _ in range(count)]
+
+
+class StreamRandomness(RandomnessSource):
+    """
+    Randomness source that expands a seed into a SHAKE-256 stream in counter mode. Integers are
+    sampled by rejection sampling: candidates of the bit length of bound - 1 are taken from the
+    stream and accepted when they are smaller than bound.
+
+    The stream is fully determined by the seed, so sources with the same seed produce the same
+    integers. The seed should therefore be kept secret and never be reused for other purposes.
+    """
+
+    def __init__(self, seed: bytes | None = None) -> None:
+        """
+        Initialize a randomness source from a seed.
+
+        :param seed: seed of the stream, a fresh random seed of SEED_SIZE bytes is used if None
+        """
+        self.seed = secrets.token_bytes(SEED_SIZE) if seed is None else seed
+        self._counter = 0
+
+    def _stream(self, size: int) -> bytes:
+        """
+        Next block of the pseudo-random stream.
+
+        :param size: number of bytes in the block
+        :return: block of pseudo-random bytes
+        """
+        block = hashlib.shake_256(
+            self.seed + self._counter.to_bytes(_COUNTER_SIZE, "little")
+        ).digest(size)
+        self._counter += 1
+        return block
+
+    def sample(self, bound: int, count: int) -> list[int]:
+        """
+        Sample integers uniformly at random from the range [0, bound).
+
+        :param bound: exclusive upper bound of the integers, at least 1
+        :param count: number of integers to sample
+        :raise ValueError: In case the bound is smaller than 1.
+        :return: the sampled integers
+        """
+        if bound < 1:
+            raise ValueError(f"Cannot sample integers below {bound}.")
+        bits = (bound - 1).bit_length()
+        if bits == 0:
+            return [0] * count
+        width = (bits + 7) // 8
+        mask = (1 << bits) - 1
+        samples: list[int] = []
+        while len(samples) < count:
+            missing = count - len(samples)
+            # A candidate is accepted with probability bound / 2**bits > 1/2, so the expected
+            # number of candidates is requested (plus some slack) to mostly need a single block.
+            candidates = -(-(missing << bits) // bound) + 16
+            samples.extend(
+                candidate
+                for candidate in (
+                    value & mask
+                    for value in decode_fixed_width(
+                        self._stream(candidates * width), width
+                    )
+                )
+                if candidate < bound
+            )
+        del samples[count:]
+        return samples
+
+
+DEFAULT_RANDOMNESS: RandomnessSource = SecretsRandomness()
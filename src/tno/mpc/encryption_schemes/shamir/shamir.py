@@ -4,28 +4,81 @@ Utility for Shamir secret sharing.
 
 from __future__ import annotations
 
-import secrets
 import warnings
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, ClassVar, NamedTuple, TypedDict
 
-from tno.mpc.encryption_schemes.utils import is_prime, mod_inv
+from tno.mpc.communication import SupportsSerialization
 
+from tno.mpc.encryption_schemes.shamir.backend import PythonBackend, select_backend
+from tno.mpc.encryption_schemes.shamir.randomness import (
+    DEFAULT_RANDOMNESS,
+    RandomnessSource,
+)
 from tno.mpc.encryption_schemes.shamir.shamir_secret_sharing_integers import (
     IntegerShares,
 )
-from tno.mpc.encryption_schemes.shamir.utils import mult_list
+from tno.mpc.encryption_schemes.shamir.utils import (
+    is_prime_cached,
+    lagrange_coefficients,
+)
+
+DEFAULT_EVALUATION_POINTS = "integers"
+INSTANCE_CACHE_SIZE = 128
+
+# Check to see if the communication module is available
+try:
+    from tno.mpc.communication import RepetitionError, Serialization
 
+    COMMUNICATION_INSTALLED = True
+except ModuleNotFoundError:
+    COMMUNICATION_INSTALLED = False
 
-class ShamirSecretSharingScheme:
+
+class LagrangeCacheInfo(NamedTuple):
+    """
+    Statistics of the cache of Lagrange coefficients.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class ShamirSecretSharingScheme(SupportsSerialization):
     """
     Class with Shamir Secret sharing functionality.
     """
 
+    # Name of the evaluation points of the parties; party i evaluates in the integer i
+    evaluation_points: ClassVar[str] = DEFAULT_EVALUATION_POINTS
+    # Scheme classes by the name of their evaluation points, for deserialization
+    _classes: ClassVar[dict[str, type[ShamirSecretSharingScheme]]] = {}
+    # Bounded (least recently used) registry of interned schemes, see get_instance
+    _instances: ClassVar[OrderedDict[tuple[Any, ...], ShamirSecretSharingScheme]] = (
+        OrderedDict()
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Register a subclass with other evaluation points, and give it its own registry of
+        interned schemes.
+
+        :param kwargs: keyword arguments of the subclass definition
+        """
+        super().__init_subclass__(**kwargs)
+        cls._instances = OrderedDict()
+        ShamirSecretSharingScheme._classes.setdefault(cls.evaluation_points, cls)
+
     def __init__(
         self,
         modulus: int,
         number_of_parties: int,
         polynomial_degree: int,
+        randomness: RandomnessSource | None = None,
+        backend: PythonBackend | None = None,
     ) -> None:
         r"""
         Initialize a $t$-out-of-$n$ secret sharing scheme where
@@ -38,16 +91,88 @@ class ShamirSecretSharingScheme:
         :param modulus: prime modulus of the coefficients in the polynomials used to create shares
         :param number_of_parties: number of shares that need to be created for each sharing
         :param polynomial_degree: degree of the polynomials used to create shares
+        :param randomness: source of the random polynomial coefficients, secrets.randbelow is used
+            if None
+        :param backend: backend for the modular arithmetic, selected based on the size of the
+            modulus if None
         """
         self.modulus = modulus
         self.number_of_parties = number_of_parties
         self.polynomial_degree = polynomial_degree
+        self.randomness = DEFAULT_RANDOMNESS if randomness is None else randomness
+        self.backend = select_backend(modulus) if backend is None else backend
+        # The modulus in the representation of the backend, for the modular reductions
+        self.backend_modulus = self.backend.convert(modulus)
 
-        if not is_prime(self.modulus):
+        if not is_prime_cached(self.modulus):
             warnings.warn(f"The modulus {self.modulus} is not prime")
 
         self._van_der_monde: list[list[int]] | None = None
 
+    @classmethod
+    def get_instance(
+        cls,
+        modulus: int,
+        number_of_parties: int,
+        polynomial_degree: int,
+        randomness: RandomnessSource | None = None,
+        backend: PythonBackend | None = None,
+    ) -> ShamirSecretSharingScheme:
+        """
+        Get the interned scheme with the given parameters, creating it on first use.
+
+        Interned schemes are shared, such that derived schemes (e.g. the degree-raised scheme of
+        a product of shares) keep their precomputed Vandermonde matrix and are not reconstructed
+        and re-tested for primality on every operation. Schemes with different randomness
+        sources or kinds of backends are interned separately, and only the INSTANCE_CACHE_SIZE
+        most recently used schemes are kept.
+
+        :param modulus: prime modulus of the coefficients in the polynomials used to create shares
+        :param number_of_parties: number of shares that need to be created for each sharing
+        :param polynomial_degree: degree of the polynomials used to create shares
+        :param randomness: source of the random polynomial coefficients, secrets.randbelow is used
+            if None
+        :param backend: backend for the modular arithmetic, selected based on the size of the
+            modulus if None
+        :return: the interned ShamirSecretSharingScheme with the given parameters
+        """
+        randomness = DEFAULT_RANDOMNESS if randomness is None else randomness
+        backend = select_backend(modulus) if backend is None else backend
+        # Backends of the same kind are interchangeable for the same modulus, whereas randomness
+        # sources may carry state (e.g. a seeded stream), so they are distinguished by identity
+        key = (modulus, number_of_parties, polynomial_degree, randomness, type(backend))
+        if key in cls._instances:
+            cls._instances.move_to_end(key)
+            return cls._instances[key]
+        scheme = cls(
+            modulus,
+            number_of_parties,
+            polynomial_degree,
+            randomness=randomness,
+            backend=backend,
+        )
+        cls._instances[key] = scheme
+        if len(cls._instances) > INSTANCE_CACHE_SIZE:
+            cls._instances.popitem(last=False)
+        return scheme
+
+    def with_degree(self, polynomial_degree: int) -> ShamirSecretSharingScheme:
+        """
+        The interned scheme with the same modulus, parties, evaluation points, randomness source
+        and backend as this scheme, but with the given polynomial degree, e.g. the scheme of the
+        product of two sharings.
+
+        :param polynomial_degree: degree of the polynomials of the scheme
+        :return: the scheme with the given polynomial degree
+        """
+        return type(self).get_instance(
+            self.modulus,
+            self.number_of_parties,
+            polynomial_degree,
+            self.randomness,
+            self.backend,
+        )
+
     @property
     def van_der_monde(self) -> list[list[int]]:
         """
@@ -56,12 +181,16 @@ class ShamirSecretSharingScheme:
         needed for the evaluation of sharing polynomials. We now have that i**j = Vm[i][j].
         To evaluate a polynomial p(x) = a0 + a1 * x + ... + ad * x**d we can simply compute
         a0 * Vm[x][0] + a1 * Vm[x][1] + ... + ad * Vm[x][d].
+        The entries are stored in the representation of the arithmetic backend of the scheme.
 
         :return: A VanDerMonde matrix of dimpensions self.polynomial_degree + 1 x self.number_of_parties
         """
         if not self._van_der_monde:
             self._van_der_monde = [
-                [pow(i + 1, j, self.modulus) for j in range(self.polynomial_degree + 1)]
+                [
+                    self.backend.convert(pow(i + 1, j, self.modulus))
+                    for j in range(self.polynomial_degree + 1)
+                ]
                 for i in range(self.number_of_parties)
             ]
         return self._van_der_monde
@@ -75,24 +204,98 @@ class ShamirSecretSharingScheme:
         """
         # Sample random polynomial of degree t with constant coefficient
 
-        secret_poly = [secret] + [
-            secrets.randbelow(self.modulus) for _ in range(self.polynomial_degree)
-        ]
+        secret_poly = [secret] + self.randomness.sample(
+            self.modulus, self.polynomial_degree
+        )
         # Create an array of all the shares
         # Player IDs are equal to the points of evaluation.
-        shares = {
-            ind
-            + 1: sum(
-                [
-                    self.van_der_monde[ind][i] * secret_poly[i] % self.modulus
-                    for i in range(self.polynomial_degree + 1)
-                ]
-            )
-            for ind in range(self.number_of_parties)
-        }
+        evaluations = self.backend.matrix_mod(
+            self.van_der_monde, [secret_poly], self.backend_modulus
+        )
+        shares = {ind + 1: evaluation for ind, (evaluation,) in enumerate(evaluations)}
         sharing = ShamirShares(self, shares)
         return sharing
 
+    def share_secrets(self, values: Sequence[int]) -> dict[int, list[int]]:
+        """
+        Function that creates shares of many values at once for each party.
+
+        All sharing polynomials are evaluated against the cached Vandermonde matrix in a single
+        batched matrix product, i.e. every share is computed as one dot product between a row of
+        the Vandermonde matrix and the coefficients of a sharing polynomial, with a single modular
+        reduction at the end.
+
+        :param values: secrets to be shared
+        :return: columnar sharing of the secrets, mapping every party id to the list containing
+            the share of that party for every secret (in the order of values)
+        """
+        # Sample random polynomials of degree t, one column of coefficients per secret
+        random_coefficients = self.randomness.sample_matrix(
+            self.modulus, self.polynomial_degree, len(values)
+        )
+        evaluations = self.backend.matrix_mod(
+            self.van_der_monde,
+            zip(values, *random_coefficients),
+            self.backend_modulus,
+        )
+        # Player IDs are equal to the points of evaluation.
+        return {ind + 1: shares for ind, shares in enumerate(evaluations)}
+
+    def lagrange_coefficients(self, party_ids: Iterable[int]) -> dict[int, int]:
+        """
+        Lagrange coefficients for reconstructing a secret from the shares of the given parties.
+
+        The coefficients only depend on the modulus and the reconstruction set, hence they are
+        taken from a bounded LRU cache keyed by the modulus and the sorted tuple of party ids.
+
+        :param party_ids: ids of the parties in the reconstruction set
+        :return: mapping from every party id to its Lagrange coefficient
+        """
+        sorted_ids = tuple(sorted(party_ids))
+        return dict(zip(sorted_ids, lagrange_coefficients(self.modulus, sorted_ids)))
+
+    def reconstruct_many(
+        self, shares_by_party: Mapping[int, Sequence[int]]
+    ) -> list[int]:
+        """
+        Function that reconstructs many secrets at once from a columnar sharing, as returned by
+        share_secrets.
+
+        The interpolation weights are computed (or taken from the cache) once for the whole batch,
+        after which every secret is obtained as a single weighted sum of its shares.
+
+        :param shares_by_party: mapping from party id to the shares of that party for every secret
+        :raise ValueError: In case not enough parties are present to reconstruct the secrets, or
+            in case the parties hold a different number of shares.
+        :return: reconstructed secrets, in the order of the shares
+        """
+        if len(shares_by_party) < self.polynomial_degree + 1:
+            raise ValueError("Too little shares to reconstruct.")
+
+        # We will use the first polynomial_degree+1 parties to reconstruct, similar to
+        # ShamirShares.reconstruct_secret.
+        reconstruction_set = list(shares_by_party.keys())[: self.polynomial_degree + 1]
+        columns = [shares_by_party[i] for i in reconstruction_set]
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All parties should hold the same number of shares.")
+        weights = self.lagrange_coefficients(reconstruction_set)
+        ordered_weights = [self.backend.convert(weights[i]) for i in reconstruction_set]
+
+        return self.backend.matrix_mod(
+            [ordered_weights], zip(*columns), self.backend_modulus
+        )[0]
+
+    @staticmethod
+    def lagrange_cache_info() -> LagrangeCacheInfo:
+        """
+        Statistics of the cache of Lagrange coefficients. This is not a per-scheme cache: it is
+        the module-global cache of utils.lagrange_coefficients, which is shared by all schemes
+        (and other users of that function) in the process.
+
+        :return: named tuple with the hits, misses, maximum size and current size of the cache
+        """
+        return LagrangeCacheInfo(*lagrange_coefficients.cache_info())
+
     def __eq__(self, other: object) -> bool:
         """
         Compare equality between this ShamirSecretSharingScheme and the other object.
@@ -102,28 +305,76 @@ class ShamirSecretSharingScheme:
         """
         if isinstance(other, ShamirSecretSharingScheme):
             return (
-                self.modulus == other.modulus
+                self.evaluation_points == other.evaluation_points
+                and self.modulus == other.modulus
                 and self.number_of_parties == other.number_of_parties
                 and self.polynomial_degree == other.polynomial_degree
             )
         # else
         return False
 
-    def serialize(self) -> dict[str, int]:
+    class _SerializedParameters(TypedDict):
+        """
+        Parameters that are part of the serialization of every shamir secret sharing scheme.
+        """
+
+        P: int
+        n: int
+        t: int
+
+    class SerializedShamirSecretSharingScheme(_SerializedParameters, total=False):
+        """
+        Class which contains the information of the shamir secret sharing scheme from which
+        deserialization is possible. The evaluation points are only included when they differ
+        from the default.
         """
-        Serialization function
 
+        points: str
+
+    def serialize(
+        self, **_kwargs: Any
+    ) -> ShamirSecretSharingScheme.SerializedShamirSecretSharingScheme:
+        r"""
+        Serialization function for the shamir secret sharing scheme, which will be passed to the
+        communication module
+
+        :param \**_kwargs: optional extra keyword arguments
         :return: json object containing the necessary information to deserialize
         """
 
-        return {
+        serialization: ShamirSecretSharingScheme.SerializedShamirSecretSharingScheme = {
             "P": self.modulus,
             "n": self.number_of_parties,
             "t": self.polynomial_degree,
         }
+        if self.evaluation_points != DEFAULT_EVALUATION_POINTS:
+            serialization["points"] = self.evaluation_points
+        return serialization
+
+    @staticmethod
+    def deserialize(
+        obj: ShamirSecretSharingScheme.SerializedShamirSecretSharingScheme,
+        **_kwargs: Any,
+    ) -> ShamirSecretSharingScheme:
+        r"""
+        Deserialization function for the shamir secret sharing scheme, which will be passed to the
+        communication module. The interned scheme is returned, such that a receiver does not
+        construct (and primality test) a new scheme for every message.
+
+        :param obj: serialization of a shamir secret sharing scheme
+        :param \**_kwargs: optional extra keyword arguments
+        :return: Deserialized ShamirSecretSharingScheme.
+        """
+        points = obj.get("points", DEFAULT_EVALUATION_POINTS)
+        scheme_class = (
+            ShamirSecretSharingScheme
+            if points == DEFAULT_EVALUATION_POINTS
+            else ShamirSecretSharingScheme._classes[points]
+        )
+        return scheme_class.get_instance(obj["P"], obj["n"], obj["t"])
 
 
-class ShamirShares:
+class ShamirShares(SupportsSerialization):
     """
     Class that keeps track of the shares for a certain value
     """
@@ -153,12 +404,22 @@ class ShamirShares:
         # else
         return f"shares: <no shares> degree: {self.degree}"
 
-    def serialize(
-        self,
-    ) -> dict[str, int | dict[int, int] | dict[str, int] | dict[str, dict[str, int]]]:
+    class SerializedShamirShares(TypedDict):
         """
-        Serialization function
+        Class which contains the information of the shamir shares from which deserialization is
+        possible.
+        """
+
+        scheme: ShamirSecretSharingScheme.SerializedShamirSecretSharingScheme
+        shares: dict[int, int]
+        degree: int
 
+    def serialize(self, **_kwargs: Any) -> ShamirShares.SerializedShamirShares:
+        r"""
+        Serialization function for the shamir shares and corresponding scheme, which will be
+        passed to the communication module
+
+        :param \**_kwargs: optional extra keyword arguments
         :return: json object containing the necessary information to deserialize
         """
         return {
@@ -167,6 +428,22 @@ class ShamirShares:
             "degree": self.degree,
         }
 
+    @staticmethod
+    def deserialize(
+        obj: ShamirShares.SerializedShamirShares, **_kwargs: Any
+    ) -> ShamirShares:
+        r"""
+        Deserialization function for the shamir shares and corresponding scheme, which will be
+        passed to the communication module. The received shares are used as is, and the scheme
+        is the interned scheme with the degree of the shares.
+
+        :param obj: serialization of the shamir shares
+        :param \**_kwargs: optional extra keyword arguments
+        :return: Deserialized ShamirShares object.
+        """
+        scheme = ShamirSecretSharingScheme.deserialize(obj["scheme"])
+        return ShamirShares(scheme.with_degree(obj["degree"]), obj["shares"])
+
     def reconstruct_secret(self) -> int:
         """
         Function that uses the shares from other parties to reconstruct the secret
@@ -179,36 +456,16 @@ class ShamirShares:
 
         # We will use the first self.degree+1 shares to reconstruct. This can be any subset.
         # Hence, here the reconstruction set is implicitly defined.
-        reconstruction_shares = {
-            key: self.shares[key] for key in list(self.shares.keys())[: self.degree + 1]
-        }
-
-        # We precomputed some values so that the Lagrange interpolation.
-        # We assume that we can always use shares f(1), ... f(self.degree+1)
-
-        lagrange_interpol_enum = {
-            i: mult_list(
-                [j for j in reconstruction_shares.keys() if i != j], self.scheme.modulus
-            )
-            for i in reconstruction_shares.keys()
-        }
-        lagrange_interpol_denom = {
-            i: mult_list(
-                [(j - i) for j in reconstruction_shares.keys() if i != j],
-                self.scheme.modulus,
-            )
-            for i in reconstruction_shares.keys()
-        }
-
-        secret = int(
-            sum(
-                lagrange_interpol_enum[i]
-                * mod_inv(lagrange_interpol_denom[i], self.scheme.modulus)
-                * reconstruction_shares[i]
-                % self.scheme.modulus
-                for i in reconstruction_shares.keys()
-            )
-            % self.scheme.modulus
+        reconstruction_set = list(self.shares.keys())[: self.degree + 1]
+        # The Lagrange coefficients only depend on the reconstruction set and are cached by the
+        # scheme, such that the reconstruction boils down to a single dot product.
+        weights = self.scheme.lagrange_coefficients(reconstruction_set)
+
+        backend = self.scheme.backend
+        secret = backend.dot_mod(
+            [backend.convert(weights[i]) for i in reconstruction_set],
+            [self.shares[i] for i in reconstruction_set],
+            self.scheme.backend_modulus,
         )
         return secret
 
@@ -266,13 +523,15 @@ class ShamirShares:
             return NotImplemented
 
         shares = {
-            i: (self.shares[i] * other.shares[i]) % self.scheme.modulus
+            i: self.scheme.backend.mul_mod(
+                self.shares[i],
+                other.shares[i],
+                self.scheme.backend_modulus,
+            )
             for i in self.shares.keys()
         }
-        mult_scheme = ShamirSecretSharingScheme(
-            self.scheme.modulus,
-            self.scheme.number_of_parties,
-            self.scheme.polynomial_degree + other.scheme.polynomial_degree,
+        mult_scheme = self.scheme.with_degree(
+            self.scheme.polynomial_degree + other.scheme.polynomial_degree
         )
         return ShamirShares(mult_scheme, shares)
 
@@ -290,7 +549,11 @@ class ShamirShares:
         if isinstance(other, int):
             # Scalar multiplication from the left by an integer
             shares = {
-                i: (other * self.shares[i]) % self.scheme.modulus
+                i: self.scheme.backend.mul_mod(
+                    other,
+                    self.shares[i],
+                    self.scheme.backend_modulus,
+                )
                 for i in self.shares.keys()
             }
             return ShamirShares(self.scheme, shares)
@@ -298,24 +561,37 @@ class ShamirShares:
             # Multiply by a sharing over the integers and return a Shamir Sharing
             # NB: This operation returns a Shamir sharing which inherits the statistical security
             # of the integer sharing and should therefore only be used with caution.
+            if self.scheme.evaluation_points != DEFAULT_EVALUATION_POINTS:
+                raise ValueError(
+                    "Integer shares can only be multiplied with shares of a scheme with the "
+                    "default evaluation points."
+                )
             warnings.warn("Caution multiplying integer shares by shamir shares.")
 
+            inverse_scaling = self.scheme.backend.invert(
+                other.scaling, self.scheme.modulus
+            )
             shares = {
-                i: (
-                    self.shares[i]
-                    * other.shares[i]
-                    * mod_inv(other.scaling, self.scheme.modulus)
+                i: self.scheme.backend.mul_mod(
+                    self.shares[i] * other.shares[i],
+                    inverse_scaling,
+                    self.scheme.backend_modulus,
                 )
-                % self.scheme.modulus
                 for i in self.shares.keys()
             }
-            mult_scheme = ShamirSecretSharingScheme(
-                self.scheme.modulus,
-                self.scheme.number_of_parties,
-                self.scheme.polynomial_degree + other.scheme.polynomial_degree,
+            mult_scheme = self.scheme.with_degree(
+                self.scheme.polynomial_degree + other.scheme.polynomial_degree
             )
             return ShamirShares(mult_scheme, shares)
         # else
         raise ValueError(
             "Different secret sharing schemes have been used, i.e. shares are incompatible."
         )
+
+
+if COMMUNICATION_INSTALLED:
+    try:
+        Serialization.register_class(ShamirSecretSharingScheme)
+        Serialization.register_class(ShamirShares)
+    except RepetitionError:
+        pass
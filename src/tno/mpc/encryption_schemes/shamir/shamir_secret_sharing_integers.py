@@ -5,13 +5,20 @@ Utility for Shamir secret sharing over the integers.
 from __future__ import annotations
 
 import math
-import secrets
+from collections.abc import Iterable, Mapping, Sequence
+from operator import mul
 from typing import Any, TypedDict
 
 from tno.mpc.communication import SupportsSerialization
-from tno.mpc.encryption_schemes.utils import mod_inv
 
-from tno.mpc.encryption_schemes.shamir.utils import mult_list
+from tno.mpc.encryption_schemes.shamir.randomness import (
+    DEFAULT_RANDOMNESS,
+    RandomnessSource,
+)
+from tno.mpc.encryption_schemes.shamir.utils import (
+    integral_lagrange_weights,
+    mod_inv_cached,
+)
 
 # Check to see if the communication module is available
 try:
@@ -22,6 +29,31 @@ except ModuleNotFoundError:
     COMMUNICATION_INSTALLED = False
 
 
+def tight_randomness_interval(
+    kappa: int, max_int: int, n_fac: int, polynomial_degree: int
+) -> int:
+    """
+    Smallest bound A such that sampling the random coefficients of the sharing polynomials
+    uniformly from [-A, A] hides secrets in [-max_int, max_int] from any t = polynomial_degree
+    parties up to statistical distance 2**-kappa.
+
+    Given the shares of a set T of t parties, the sharings of two secrets s and s' are related by
+    adding (s - s') * n! * prod_{j in T} (1 - x / j) to the polynomial. The k-th coefficient of
+    this shift is at most 2 * max_int * n! * e_k(1, 1/2, ..., 1/t) in absolute value, where e_k is
+    the k-th elementary symmetric polynomial, and these bounds sum to 2 * max_int * n! * t. The
+    statistical distance is therefore at most 2 * max_int * n! * t / (2A + 1), which yields
+    A = 2**kappa * max_int * n! * t. This is a factor n! / t smaller than the default interval
+    (n!)**2 * 2**kappa * max_int, which saves about log2(n! / t) bits per share.
+
+    :param kappa: statistical security parameter
+    :param max_int: bound on the absolute value of the secrets
+    :param n_fac: scaling n! of the secrets
+    :param polynomial_degree: degree t of the sharing polynomials
+    :return: bound A of the randomness interval [-A, A]
+    """
+    return (1 << kappa) * max_int * n_fac * polynomial_degree
+
+
 class ShamirSecretSharingIntegers(SupportsSerialization):
     """
     Class with Shamir Secret sharing functionality over the integers
@@ -33,6 +65,8 @@ class ShamirSecretSharingIntegers(SupportsSerialization):
         max_int: int = 5,
         number_of_parties: int = 10,
         polynomial_degree: int = 4,
+        randomness: RandomnessSource | None = None,
+        tight_interval: bool = False,
     ) -> None:
         """
         Initialize a secret sharing over the integers
@@ -43,16 +77,29 @@ class ShamirSecretSharingIntegers(SupportsSerialization):
             the Paillier modulus is used for max.
         :param number_of_parties: number of shares that need to be created for each sharing
         :param polynomial_degree: degree of polynomials used to share secrets
+        :param randomness: source of the random polynomial coefficients, secrets.randbelow is used
+            if None
+        :param tight_interval: sample the random coefficients from the smallest interval that
+            is statistically hiding for the degree and scaling in use, see
+            tight_randomness_interval, instead of the default interval
         """
         self.kappa = kappa
         self.max_int = max_int
         self.number_of_parties = number_of_parties
         self.polynomial_degree = polynomial_degree
+        self.randomness = DEFAULT_RANDOMNESS if randomness is None else randomness
+        # n! scales the secrets and makes the Lagrange coefficients integral; it is computed once
+        # per scheme and reused by all sharings.
+        self.n_fac = math.factorial(number_of_parties)
+        self.tight_interval = tight_interval
         # Random polynomial coefficients are sampled uniformly at random from the interval [-A,A],
         # with A as follows:
-        self.randomness_interval = (
-            (math.factorial(number_of_parties) ** 2) * (2**kappa) * max_int
-        )
+        if tight_interval:
+            self.randomness_interval = tight_randomness_interval(
+                kappa, max_int, self.n_fac, polynomial_degree
+            )
+        else:
+            self.randomness_interval = (self.n_fac**2) * (2**kappa) * max_int
         self._van_der_monde: list[list[int]] | None = None
 
     @property
@@ -73,6 +120,21 @@ class ShamirSecretSharingIntegers(SupportsSerialization):
             ]
         return self._van_der_monde
 
+    @property
+    def share_bound(self) -> int:
+        """
+        Upper bound on the absolute value of the shares of a fresh sharing of a secret in
+        [-max_int, max_int], i.e. n! * max_int + A * (n + n**2 + ... + n**t) for the randomness
+        interval [-A, A].
+
+        :return: bound on the absolute value of fresh shares
+        """
+        # n + n**2 + ... + n**t with Horner's rule
+        powers = 0
+        for _ in range(self.polynomial_degree):
+            powers = (powers + 1) * self.number_of_parties
+        return self.n_fac * self.max_int + self.randomness_interval * powers
+
     def share_secret(self, secret: int) -> IntegerShares:
         """
         Function that creates shares of a value for each party
@@ -82,25 +144,121 @@ class ShamirSecretSharingIntegers(SupportsSerialization):
         """
         # Sample random polynomial of degree polynomial_degree with constant coefficient
         n = self.randomness_interval
-        secret_poly = [math.factorial(self.number_of_parties) * secret] + [
-            secrets.randbelow(2 * n + 1) - n for _ in range(self.polynomial_degree)
+        secret_poly = [self.n_fac * secret] + [
+            coefficient - n
+            for coefficient in self.randomness.sample(2 * n + 1, self.polynomial_degree)
         ]
         # Create an array of all the shares
         # Player IDs are equal to the points of evaluation.
         shares = {
-            ind
-            + 1: sum(
-                [
-                    self.van_der_monde[ind][i] * secret_poly[i]
-                    for i in range(self.polynomial_degree + 1)
-                ]
-            )
-            for ind in range(self.number_of_parties)
+            ind + 1: sum(map(mul, row, secret_poly))
+            for ind, row in enumerate(self.van_der_monde)
         }
-        scaling = math.factorial(self.number_of_parties)
-        sharing = IntegerShares(self, shares, self.polynomial_degree, scaling)
+        sharing = IntegerShares(
+            self, shares, self.polynomial_degree, self.n_fac, self.share_bound
+        )
         return sharing
 
+    def share_secrets(self, values: Sequence[int]) -> dict[int, list[int]]:
+        """
+        Function that creates shares of many values at once for each party.
+
+        The random coefficients of all sharing polynomials are sampled in a single call, after
+        which every party evaluates all polynomials at once with Horner's rule, one coefficient
+        row at a time. The evaluation point of a party is small, so this is cheaper than
+        multiplying the large coefficients by the entries of the Vandermonde matrix. All
+        sharings have degree polynomial_degree and scaling n!, see IntegerSharesVector.
+
+        :param values: secrets to be shared
+        :return: columnar sharing of the secrets, mapping every party id to the list containing
+            the share of that party for every secret (in the order of values)
+        """
+        n = self.randomness_interval
+        random_coefficients = self.randomness.sample_matrix(
+            2 * n + 1, self.polynomial_degree, len(values)
+        )
+        coefficient_rows = [[self.n_fac * value for value in values]] + [
+            [coefficient - n for coefficient in row] for row in random_coefficients
+        ]
+        shares = {}
+        for point in range(1, self.number_of_parties + 1):
+            column = coefficient_rows[-1]
+            for row in reversed(coefficient_rows[:-1]):
+                column = [share * point + c for share, c in zip(column, row)]
+            shares[point] = column if self.polynomial_degree else list(column)
+        return shares
+
+    def lagrange_weights(self, party_ids: Iterable[int]) -> dict[int, int]:
+        """
+        Integral Lagrange weights n! * lambda_i for reconstructing a secret from the shares of the
+        given parties. The weights only depend on n! and the reconstruction set, hence they are
+        taken from a bounded LRU cache.
+
+        :param party_ids: ids of the parties in the reconstruction set
+        :return: mapping from every party id to its integral Lagrange weight
+        """
+        sorted_ids = tuple(sorted(party_ids))
+        return dict(zip(sorted_ids, integral_lagrange_weights(self.n_fac, sorted_ids)))
+
+    def reconstruct_many(
+        self,
+        shares_by_party: Mapping[int, Sequence[int]],
+        degree: int | None = None,
+        scaling: int | None = None,
+        modulus: int = 0,
+    ) -> list[int]:
+        """
+        Function that reconstructs many secrets at once from a columnar sharing, as returned by
+        share_secrets.
+
+        The integral Lagrange weights are taken from the cache once for the whole batch, after
+        which every secret is obtained as a single weighted sum of its shares. For a
+        reconstruction modulo a modulus, e.g. to open integer sharings of values modulo a
+        Paillier modulus, the weighted sum is reduced once and multiplied by the (cached)
+        inverse of the scaling.
+
+        :param shares_by_party: mapping from party id to the shares of that party for every secret
+        :param degree: degree of the sharings, the polynomial degree of the scheme if None
+        :param scaling: scaling of the sharings, n! if None
+        :param modulus: the modulus to use, 0 for a reconstruction over the integers
+        :raise ValueError: In case not enough parties are present to reconstruct the secrets, the
+            parties hold a different number of shares, or the scaling is divisible by the
+            modulus.
+        :return: reconstructed secrets, in the order of the shares
+        """
+        degree = self.polynomial_degree if degree is None else degree
+        scaling = self.n_fac if scaling is None else scaling
+        if len(shares_by_party) < degree + 1:
+            raise ValueError("Too little shares to reconstruct.")
+
+        # We will use the first degree+1 parties to reconstruct. This can be any subset.
+        # Hence, here the reconstruction set is implicitly defined.
+        reconstruction_set = list(shares_by_party.keys())[: degree + 1]
+        columns = [shares_by_party[i] for i in reconstruction_set]
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All parties should hold the same number of shares.")
+        weights = self.lagrange_weights(reconstruction_set)
+        ordered_weights = [weights[i] for i in reconstruction_set]
+
+        # modulus=0 is treated as standard reconstruction.
+        # Otherwise, reconstruct modulo modulus
+        if modulus == 0:
+            # The scaling factor and n! are divisors of every weighted sum.
+            divisor = scaling * self.n_fac
+            return [
+                sum(map(mul, ordered_weights, element)) // divisor
+                for element in zip(*columns)
+            ]
+        if scaling % modulus == 0:
+            raise ValueError("Scaling is not divisible mod modulus")
+        inverse = mod_inv_cached(scaling * self.n_fac % modulus, modulus)
+        # The weights are small, so the weighted sum of the unreduced shares is cheaper than
+        # reducing every share, and it only requires a single reduction.
+        return [
+            sum(map(mul, ordered_weights, element)) % modulus * inverse % modulus
+            for element in zip(*columns)
+        ]
+
     def __eq__(self, other: object) -> bool:
         """
         Compare equality between this ShamirSecretSharingIntegers and the other object.
@@ -114,13 +272,15 @@ class ShamirSecretSharingIntegers(SupportsSerialization):
                 and self.max_int == other.max_int
                 and self.number_of_parties == other.number_of_parties
                 and self.polynomial_degree == other.polynomial_degree
+                and self.tight_interval == other.tight_interval
             )
         # else
         return False
 
-    class SerializedShamirSecretSharingIntegers(TypedDict):
+    class _SerializedParameters(TypedDict):
         """
-        Class which contains the information of the shamir secret share from which deserialization is possible.
+        Parameters that are part of the serialization of every shamir secret sharing integers
+        scheme.
         """
 
         kappa: int
@@ -128,6 +288,14 @@ class ShamirSecretSharingIntegers(SupportsSerialization):
         polynomial_degree: int
         max_int: int
 
+    class SerializedShamirSecretSharingIntegers(_SerializedParameters, total=False):
+        """
+        Class which contains the information of the shamir secret share from which deserialization is possible.
+        The randomness interval is only included when it differs from the default.
+        """
+
+        tight_interval: bool
+
     def serialize(
         self, **_kwargs: Any
     ) -> ShamirSecretSharingIntegers.SerializedShamirSecretSharingIntegers:
@@ -138,12 +306,17 @@ class ShamirSecretSharingIntegers(SupportsSerialization):
         :param \**_kwargs: optional extra keyword arguments
         :return: Dictionary containing the serialization of this ShamirSecretSharingIntegers scheme.
         """
-        return {
+        serialization: (
+            ShamirSecretSharingIntegers.SerializedShamirSecretSharingIntegers
+        ) = {
             "kappa": self.kappa,
             "number_of_parties": self.number_of_parties,
             "polynomial_degree": self.polynomial_degree,
             "max_int": self.max_int,
         }
+        if self.tight_interval:
+            serialization["tight_interval"] = True
+        return serialization
 
     @staticmethod
     def deserialize(
@@ -163,6 +336,7 @@ class ShamirSecretSharingIntegers(SupportsSerialization):
             number_of_parties=obj["number_of_parties"],
             polynomial_degree=obj["polynomial_degree"],
             max_int=obj["max_int"],
+            tight_interval=obj.get("tight_interval", False),
         )
 
 
@@ -177,73 +351,75 @@ class IntegerShares(SupportsSerialization):
         shares: dict[int, int],
         degree: int,
         scaling: int,
+        bound: int | None = None,
     ) -> None:
+        """
+        Initialize a sharing over the integers.
+
+        :param shamir_sss: scheme with which the secret is shared
+        :param shares: mapping from every party id to the share of that party
+        :param degree: degree of the sharing
+        :param scaling: scaling of the secret, n! for a fresh sharing
+        :param bound: upper bound on the absolute value of the shares that holds for any secret
+            and randomness, the largest absolute value of the given shares if None
+        """
         self.scheme = shamir_sss
         self.shares = shares
         # The degree of the polynomial used for sharing the secret, i.e.
         # at least degree+1 shares are required to reconstruct.
         self.degree = degree
         self.n = self.scheme.number_of_parties
-        self.n_fac = math.factorial(self.n)
+        self.n_fac = self.scheme.n_fac
         self.scaling = scaling
+        self.bound = (
+            max(map(abs, shares.values()), default=0) if bound is None else bound
+        )
+
+    @property
+    def worst_case_bit_length(self) -> int:
+        """
+        Number of bits of the largest share that this sharing may contain, including a sign
+        bit, which follows from the bound on fresh shares and the operations that produced this
+        sharing.
+
+        :return: worst-case bit length of a share
+        """
+        return self.bound.bit_length() + 1
+
+    @property
+    def bit_length(self) -> int:
+        """
+        Number of bits of the largest share of this sharing, including a sign bit.
+
+        :return: bit length of the largest share
+        """
+        return max(map(abs, self.shares.values()), default=0).bit_length() + 1
+
+    @property
+    def scaling_bit_length(self) -> int:
+        """
+        Number of bits of the scaling of the secret, which grows with log2(n!) bits per
+        multiplication.
+
+        :return: bit length of the scaling
+        """
+        return self.scaling.bit_length()
 
     def reconstruct_secret(self, modulus: int = 0) -> int:
         """
         Function that uses the shares from other parties to reconstruct the secret
 
         :param modulus: the modulus to use
-        :raise ValueError: In case not enough shares are present to reconstruct the secret.
+        :raise ValueError: In case not enough shares are present to reconstruct the secret, or
+            the scaling is divisible by the modulus.
         :return: original secret
         """
-        if len(self.shares) < self.degree + 1:
-            raise ValueError("Too little shares to reconstruct.")
-
-        # We will use the first self.degree+1 shares to reconstruct. This can be any subset.
-        # Hence, here the reconstruction set is implicitly defined.
-        reconstruction_shares = {
-            key: self.shares[key] for key in list(self.shares.keys())[: self.degree + 1]
-        }
-
-        # We precompute some values so that we can do the Lagrange interpolation.
-        lagrange_interpol_enum = {
-            i: mult_list([j for j in reconstruction_shares.keys() if i != j])
-            for i in reconstruction_shares.keys()
-        }
-        lagrange_interpol_denom = {
-            i: mult_list([(j - i) for j in reconstruction_shares.keys() if i != j])
-            for i in reconstruction_shares.keys()
-        }
-
-        # modulus=0 is treated as standard reconstruction.
-        # Otherwise, reconstruct modulo modulus
-        if modulus == 0:
-            partial_recon = [
-                (lagrange_interpol_enum[i] * self.n_fac * reconstruction_shares[i])
-                // lagrange_interpol_denom[i]
-                for i in reconstruction_shares.keys()
-            ]  # The fractions in this list are all integral.
-            secret = sum(partial_recon) // (
-                self.scaling * self.n_fac
-            )  # The scaling factor is a divisor of the enumerator.
-        else:
-            if self.scaling % modulus == 0:
-                raise ValueError("Scaling is not divisible mod modulus")
-            partial_recon = [
-                (
-                    (
-                        lagrange_interpol_enum[i]
-                        * self.n_fac
-                        * (reconstruction_shares[i] % modulus)
-                    )
-                    // lagrange_interpol_denom[i]
-                )
-                % modulus
-                for i in reconstruction_shares.keys()
-            ]  # The fractions in this list are all integral.
-            secret = (
-                sum(partial_recon) * int(mod_inv(self.scaling * self.n_fac, modulus))
-            ) % modulus
-        return secret
+        return self.scheme.reconstruct_many(
+            {i: [share] for i, share in self.shares.items()},
+            self.degree,
+            self.scaling,
+            modulus,
+        )[0]
 
     def __add__(self, other: IntegerShares) -> IntegerShares:
         """
@@ -264,7 +440,8 @@ class IntegerShares(SupportsSerialization):
         shares = {i: (self.shares[i] + other.shares[i]) for i in self.shares.keys()}
         degree = max(self.degree, other.degree)
         scaling = self.scaling
-        return IntegerShares(self.scheme, shares, degree, scaling)
+        bound = self.bound + other.bound
+        return IntegerShares(self.scheme, shares, degree, scaling, bound)
 
     def __mul__(self, other: IntegerShares) -> IntegerShares:
         """
@@ -283,7 +460,8 @@ class IntegerShares(SupportsSerialization):
         shares = {i: (self.shares[i] * other.shares[i]) for i in self.shares.keys()}
         degree = self.degree + other.degree
         scaling = self.scaling * other.scaling
-        return IntegerShares(self.scheme, shares, degree, scaling)
+        bound = self.bound * other.bound
+        return IntegerShares(self.scheme, shares, degree, scaling, bound)
 
     def __rmul__(self, other: Any) -> Any:
         """
@@ -298,7 +476,8 @@ class IntegerShares(SupportsSerialization):
             shares = {i: (other * self.shares[i]) for i in self.shares.keys()}
             degree = self.degree
             scaling = self.scaling
-            return IntegerShares(self.scheme, shares, degree, scaling)
+            bound = abs(other) * self.bound
+            return IntegerShares(self.scheme, shares, degree, scaling, bound)
         # Else, we redirect to the __rmul__ functionality of other.
         return self * other
 
@@ -320,9 +499,9 @@ class IntegerShares(SupportsSerialization):
             and other.scaling == self.scaling
         )
 
-    class SerializedIntegerShares(TypedDict):
+    class _SerializedSharing(TypedDict):
         """
-        Class which contains the information of the integer shares from which deserialization is possible.
+        Information that is part of the serialization of all integer shares.
         """
 
         scheme: ShamirSecretSharingIntegers.SerializedShamirSecretSharingIntegers
@@ -330,6 +509,13 @@ class IntegerShares(SupportsSerialization):
         degree: int
         scaling: int
 
+    class SerializedIntegerShares(_SerializedSharing, total=False):
+        """
+        Class which contains the information of the integer shares from which deserialization is possible.
+        """
+
+        bound: int
+
     def serialize(self, **_kwargs: Any) -> IntegerShares.SerializedIntegerShares:
         r"""
         Serialization function for the integer shares and corresponding scheme, which will be passed to
@@ -343,6 +529,7 @@ class IntegerShares(SupportsSerialization):
             "shares": self.shares,
             "degree": self.degree,
             "scaling": self.scaling,
+            "bound": self.bound,
         }
 
     @staticmethod
@@ -363,6 +550,7 @@ class IntegerShares(SupportsSerialization):
             shares=obj["shares"],
             degree=obj["degree"],
             scaling=obj["scaling"],
+            bound=obj.get("bound"),
         )
 
 
@@ -0,0 +1,528 @@
+"""
+Utility for vectors of Shamir secret shares.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Callable, Iterable, Sequence
+from operator import add, mul, sub
+from typing import Any, TypedDict, Union, overload
+
+from tno.mpc.communication import SupportsSerialization
+
+from tno.mpc.encryption_schemes.shamir.integer_shares_vector import IntegerSharesVector
+from tno.mpc.encryption_schemes.shamir.shamir import (
+    DEFAULT_EVALUATION_POINTS,
+    ShamirSecretSharingScheme,
+    ShamirShares,
+)
+
+# Check to see if the communication module is available
+try:
+    from tno.mpc.communication import RepetitionError, Serialization
+
+    COMMUNICATION_INSTALLED = True
+except ModuleNotFoundError:
+    COMMUNICATION_INSTALLED = False
+
+Operand = Union["ShamirSharesVector", int]
+
+
+class ShamirSharesVector(SupportsSerialization):
+    """
+    Class that keeps track of the shares for a vector of values that are shared with the same
+    scheme.
+
+    The shares are stored in a columnar (party x element) layout: for every party a single list
+    contains the shares of that party for all elements of the vector. Element-wise arithmetic is
+    therefore performed as a single pass over the lists of every party, instead of creating a
+    ShamirShares object per element.
+    """
+
+    def __init__(
+        self, shamir_sss: ShamirSecretSharingScheme, shares: dict[int, list[int]]
+    ) -> None:
+        """
+        Initialize a vector of shares.
+
+        :param shamir_sss: scheme with which all elements are shared
+        :param shares: mapping from every party id to the list of shares of that party, for
+            example as returned by ShamirSecretSharingScheme.share_secrets
+        :raise ValueError: In case the parties hold a different number of shares.
+        """
+        if len({len(column) for column in shares.values()}) > 1:
+            raise ValueError("All parties should hold the same number of shares.")
+        self.scheme = shamir_sss
+        # Shallow copy, such that in-place arithmetic does not modify the mapping of the caller
+        self.shares = dict(shares)
+        # The degree of the polynomial used for sharing the secrets, i.e. at least degree+1 shares
+        # are required to reconstruct.
+        self.degree = self.scheme.polynomial_degree
+
+    @classmethod
+    def from_shares(cls, sharings: Sequence[ShamirShares]) -> ShamirSharesVector:
+        """
+        Create a vector of shares from a (non-empty) list of ShamirShares of the same scheme.
+
+        :param sharings: sharings of the elements of the vector
+        :raise ValueError: In case the list is empty or different schemes were used.
+        :return: vector containing the given sharings
+        """
+        if not sharings:
+            raise ValueError("Cannot determine the scheme of an empty list of shares.")
+        scheme = sharings[0].scheme
+        if any(sharing.scheme != scheme for sharing in sharings):
+            raise ValueError(
+                "Different secret sharing schemes have been used, i.e. shares are incompatible."
+            )
+        return cls(
+            scheme,
+            {
+                i: [sharing.shares[i] for sharing in sharings]
+                for i in sharings[0].shares.keys()
+            },
+        )
+
+    def to_shares(self) -> list[ShamirShares]:
+        """
+        Convert this vector into a list of ShamirShares, one per element.
+
+        :return: sharing of every element of the vector
+        """
+        return [
+            ShamirShares(self.scheme, dict(zip(self.shares.keys(), element)))
+            for element in zip(*self.shares.values())
+        ]
+
+    @classmethod
+    def from_integer_shares(
+        cls, shamir_sss: ShamirSecretSharingScheme, vector: IntegerSharesVector
+    ) -> ShamirSharesVector:
+        """
+        Convert a vector of shares over the integers into a vector of Shamir shares of the same
+        secrets. The integer shares are multiplied column-wise by the inverse of their scaling,
+        which is computed once for the whole vector, and reduced. The resulting vector has the
+        degree of the integer sharings, on the interned degree-raised scheme.
+
+        Note: The resulting sharings inherit the statistical security of the integer sharings
+        and should therefore only be used with caution.
+
+        :param shamir_sss: scheme of the prime field, with the same number of parties
+        :param vector: vector of integer shares to be converted
+        :raise ValueError: In case the schemes have different numbers of parties or the scheme
+            does not use the default evaluation points.
+        :return: vector with Shamir shares of the secrets of the integer sharings
+        """
+        if shamir_sss.number_of_parties != vector.scheme.number_of_parties:
+            raise ValueError(
+                "Different secret sharing schemes have been used, i.e. shares are incompatible."
+            )
+        if shamir_sss.evaluation_points != DEFAULT_EVALUATION_POINTS:
+            raise ValueError(
+                "Integer shares can only be converted to shares of a scheme with the default "
+                "evaluation points."
+            )
+        warnings.warn("Caution converting integer shares to shamir shares.")
+        backend = shamir_sss.backend
+        modulus = shamir_sss.modulus
+        inverse_scaling = backend.invert(vector.scaling % modulus, modulus)
+        return cls(
+            shamir_sss.with_degree(vector.degree),
+            {
+                i: backend.elementwise_mod(
+                    column,
+                    inverse_scaling,
+                    mul,
+                    shamir_sss.backend_modulus,
+                )
+                for i, column in vector.shares.items()
+            },
+        )
+
+    @classmethod
+    def concatenate(cls, vectors: Iterable[ShamirSharesVector]) -> ShamirSharesVector:
+        """
+        Concatenate vectors of shares of the same scheme into a single vector.
+
+        :param vectors: vectors to be concatenated
+        :raise ValueError: In case no vectors are given or different schemes were used.
+        :return: vector containing the elements of all vectors in order
+        """
+        vectors = list(vectors)
+        if not vectors:
+            raise ValueError("Cannot determine the scheme of an empty list of vectors.")
+        if any(vector.scheme != vectors[0].scheme for vector in vectors):
+            raise ValueError(
+                "Different secret sharing schemes have been used, i.e. shares are incompatible."
+            )
+        return cls(
+            vectors[0].scheme,
+            {
+                i: [share for vector in vectors for share in vector.shares[i]]
+                for i in vectors[0].shares.keys()
+            },
+        )
+
+    def __len__(self) -> int:
+        """
+        Number of elements in this vector.
+
+        :return: length of the vector
+        """
+        return len(next(iter(self.shares.values()), []))
+
+    @overload
+    def __getitem__(self, index: int) -> ShamirShares: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ShamirSharesVector: ...
+
+    def __getitem__(self, index: int | slice) -> ShamirShares | ShamirSharesVector:
+        """
+        Select a single element or a slice of this vector.
+
+        :param index: index or slice of the elements to select
+        :return: sharing of the selected element, or a vector of the selected elements
+        """
+        if isinstance(index, slice):
+            return ShamirSharesVector(
+                self.scheme, {i: column[index] for i, column in self.shares.items()}
+            )
+        return ShamirShares(
+            self.scheme, {i: column[index] for i, column in self.shares.items()}
+        )
+
+    def __str__(self) -> str:
+        """
+        String formatted version of this ShamirSharesVector object.
+
+        :return: Pretty string.
+        """
+        return (
+            f"vector of {len(self)} sharings, parties: {list(self.shares.keys())}, "
+            f"degree: {self.degree}"
+        )
+
+    def reconstruct_secrets(self) -> list[int]:
+        """
+        Function that uses the shares from other parties to reconstruct all secrets in this vector.
+
+        :return: original secrets
+        """
+        return self.scheme.reconstruct_many(self.shares)
+
+    def _check_compatibility(self, other: ShamirSharesVector) -> None:
+        """
+        Check whether the other vector can be combined element-wise with this vector.
+
+        :param other: Vector to be combined with this vector.
+        :raise ValueError: In case a different secret sharing scheme was used or the lengths of
+            the vectors differ.
+        """
+        if self.scheme != other.scheme:
+            raise ValueError(
+                "Different secret sharing schemes have been used, i.e. shares are incompatible."
+            )
+        if len(self) != len(other):
+            raise ValueError("Vectors of different lengths are incompatible.")
+
+    def _combine(
+        self, other: Operand, operator: Callable[[int, int], int]
+    ) -> dict[int, list[int]]:
+        """
+        Combine the shares of this vector element-wise with the shares of another vector, or
+        with a public integer.
+
+        :param other: Vector or public integer to be combined with this vector.
+        :param operator: Element-wise operation to apply.
+        :return: Combined shares, reduced modulo the modulus of the scheme.
+        """
+        backend = self.scheme.backend
+        modulus = self.scheme.backend_modulus
+        if isinstance(other, int):
+            return {
+                i: backend.elementwise_mod(column, other, operator, modulus)
+                for i, column in self.shares.items()
+            }
+        self._check_compatibility(other)
+        return {
+            i: backend.elementwise_mod(column, other.shares[i], operator, modulus)
+            for i, column in self.shares.items()
+        }
+
+    def _product_scheme(self, other: Operand) -> ShamirSecretSharingScheme:
+        """
+        Scheme of the product of this vector with another vector or a public integer.
+
+        :param other: Vector or public integer to be multiplied with this vector.
+        :return: Scheme with the appropriate polynomial degree.
+        """
+        if isinstance(other, int):
+            return self.scheme
+        return self.scheme.with_degree(
+            self.scheme.polynomial_degree + other.scheme.polynomial_degree
+        )
+
+    def _mul_integer_shares(self, other: IntegerSharesVector) -> ShamirSharesVector:
+        """
+        Multiply this vector element-wise with a vector of integer shares, which is converted
+        with from_integer_shares. The degree of the result is the sum of both degrees.
+        NB: This operation returns Shamir sharings which inherit the statistical security of the
+        integer sharings and should therefore only be used with caution.
+
+        :param other: Vector of integer shares to be multiplied with these shares.
+        :raise ValueError: In case the vectors are incompatible.
+        :return: New ShamirSharesVector object where the shares have been multiplied together.
+        """
+        converted = self.from_integer_shares(self.scheme, other)
+        if len(self) != len(converted):
+            raise ValueError("Vectors of different lengths are incompatible.")
+        backend = self.scheme.backend
+        return ShamirSharesVector(
+            self.scheme.with_degree(self.scheme.polynomial_degree + other.degree),
+            {
+                i: backend.elementwise_mod(
+                    column, converted.shares[i], mul, self.scheme.backend_modulus
+                )
+                for i, column in self.shares.items()
+            },
+        )
+
+    def __add__(self, other: Operand) -> ShamirSharesVector:
+        """
+        Add another vector or a public integer element-wise to this vector.
+
+        :param other: Vector or public integer to be added to these shares.
+        :return: New ShamirSharesVector object where the shares have been added together.
+        """
+        return ShamirSharesVector(self.scheme, self._combine(other, add))
+
+    def __radd__(self, other: int) -> ShamirSharesVector:
+        """
+        Add this vector element-wise to a public integer.
+
+        :param other: Public integer to be added to these shares.
+        :return: New ShamirSharesVector object where the integer has been added to every element.
+        """
+        return self + other
+
+    def __sub__(self, other: Operand) -> ShamirSharesVector:
+        """
+        Subtract another vector or a public integer element-wise from this vector.
+
+        :param other: Vector or public integer to be subtracted from these shares.
+        :return: New ShamirSharesVector object representing the difference.
+        """
+        return ShamirSharesVector(self.scheme, self._combine(other, sub))
+
+    def __mul__(self, other: Operand | IntegerSharesVector) -> ShamirSharesVector:
+        """
+        Multiply this vector element-wise with another vector or a public integer. When two
+        vectors are multiplied, the degree of the resulting sharing is the sum of both degrees.
+        Vectors of integer shares are converted with from_integer_shares.
+
+        :param other: Vector, vector of integer shares or public integer to be multiplied with
+            these shares.
+        :return: New ShamirSharesVector object where the shares have been multiplied together.
+        """
+        if isinstance(other, IntegerSharesVector):
+            return self._mul_integer_shares(other)
+        return ShamirSharesVector(
+            self._product_scheme(other), self._combine(other, mul)
+        )
+
+    def __rmul__(self, other: Any) -> ShamirSharesVector:
+        """
+        Multiply this vector with a public integer or, element-wise, with a vector of integer
+        shares from the left. The integer shares are converted with from_integer_shares, and
+        the degree of the result is the sum of both degrees.
+
+        :param other: Public integer or vector of integer shares to be multiplied with these
+            shares.
+        :raise ValueError: raised when other is not an integer or a compatible vector of
+            integer shares.
+        :return: New ShamirSharesVector object where every element has been multiplied.
+        """
+        if isinstance(other, int):
+            return self * other
+        if isinstance(other, IntegerSharesVector):
+            return self._mul_integer_shares(other)
+        raise ValueError(
+            "A vector of shares can only be multiplied by an integer or a vector of integer "
+            "shares."
+        )
+
+    def __iadd__(self, other: Operand) -> ShamirSharesVector:
+        """
+        Add another vector or a public integer element-wise to this vector, in place.
+
+        :param other: Vector or public integer to be added to these shares.
+        :return: This vector.
+        """
+        self._update(self._combine(other, add))
+        return self
+
+    def __isub__(self, other: Operand) -> ShamirSharesVector:
+        """
+        Subtract another vector or a public integer element-wise from this vector, in place.
+
+        :param other: Vector or public integer to be subtracted from these shares.
+        :return: This vector.
+        """
+        self._update(self._combine(other, sub))
+        return self
+
+    def __imul__(self, other: Operand | IntegerSharesVector) -> ShamirSharesVector:
+        """
+        Multiply this vector element-wise with another vector, a vector of integer shares or a
+        public integer, in place.
+
+        :param other: Vector, vector of integer shares or public integer to be multiplied with
+            these shares.
+        :return: This vector.
+        """
+        if isinstance(other, IntegerSharesVector):
+            product = self._mul_integer_shares(other)
+            scheme, shares = product.scheme, product.shares
+        else:
+            scheme, shares = self._product_scheme(other), self._combine(other, mul)
+        self._update(shares)
+        self.scheme = scheme
+        self.degree = scheme.polynomial_degree
+        return self
+
+    @classmethod
+    def linear_combination(
+        cls, coefficients: Sequence[int], vectors: Sequence[ShamirSharesVector]
+    ) -> ShamirSharesVector:
+        """
+        Compute the linear combination of vectors with public coefficients. The products are
+        accumulated per element and reduced once, instead of reducing after every scalar
+        multiplication and addition.
+
+        :param coefficients: public coefficient of every vector
+        :param vectors: vectors of the same scheme and length
+        :raise ValueError: In case no vectors are given, the number of coefficients differs from
+            the number of vectors, or the vectors are incompatible.
+        :return: vector with the linear combination of the vectors
+        """
+        if not vectors:
+            raise ValueError("Cannot determine the scheme of an empty list of vectors.")
+        if len(coefficients) != len(vectors):
+            raise ValueError("Every vector should have exactly one coefficient.")
+        for vector in vectors[1:]:
+            vectors[0]._check_compatibility(vector)
+        scheme = vectors[0].scheme
+        rows = [[scheme.backend.convert(coefficient) for coefficient in coefficients]]
+        return cls(
+            scheme,
+            {
+                i: scheme.backend.matrix_mod(
+                    rows,
+                    zip(*(vector.shares[i] for vector in vectors)),
+                    scheme.backend_modulus,
+                )[0]
+                for i in vectors[0].shares.keys()
+            },
+        )
+
+    def sum(self) -> ShamirShares:
+        """
+        Sum all elements of this vector, with a single modular reduction per party.
+
+        :return: sharing of the sum of the elements
+        """
+        return ShamirShares(
+            self.scheme,
+            {i: sum(column) % self.scheme.modulus for i, column in self.shares.items()},
+        )
+
+    def dot(self, other: ShamirSharesVector) -> ShamirShares:
+        """
+        Compute the inner product of this vector with another vector, with a single modular
+        reduction per party. The degree of the resulting sharing is the sum of both degrees.
+
+        :param other: Vector of the same scheme and length.
+        :return: sharing of the inner product of the vectors
+        """
+        self._check_compatibility(other)
+        backend = self.scheme.backend
+        return ShamirShares(
+            self._product_scheme(other),
+            {
+                i: backend.dot_mod(column, other.shares[i], self.scheme.backend_modulus)
+                for i, column in self.shares.items()
+            },
+        )
+
+    def _update(self, shares: dict[int, list[int]]) -> None:
+        """
+        Overwrite the shares of this vector with the given (newly computed) lists, such that
+        lists that are shared with the caller or with other vectors are left untouched.
+
+        :param shares: New shares for every party of this vector.
+        """
+        self.shares.update(shares)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare equality between this ShamirSharesVector and the other object.
+
+        :param other: Object to compare with.
+        :return: Boolean stating (in)equality
+        """
+        if not isinstance(other, ShamirSharesVector):
+            return False
+        return self.scheme == other.scheme and self.shares == other.shares
+
+    class SerializedShamirSharesVector(TypedDict):
+        """
+        Class which contains the information of the vector of shares from which deserialization
+        is possible.
+        """
+
+        scheme: ShamirSecretSharingScheme.SerializedShamirSecretSharingScheme
+        party_ids: list[int]
+        shares: list[list[int]]
+
+    def serialize(
+        self, **_kwargs: Any
+    ) -> ShamirSharesVector.SerializedShamirSharesVector:
+        r"""
+        Serialization function for the vector of shares and corresponding scheme, which will be
+        passed to the communication module. The scheme is included once and the shares are kept
+        in their columnar layout, i.e. one list per party.
+
+        :param \**_kwargs: optional extra keyword arguments
+        :return: json object containing the necessary information to deserialize
+        """
+        return {
+            "scheme": self.scheme.serialize(),
+            "party_ids": list(self.shares.keys()),
+            "shares": list(self.shares.values()),
+        }
+
+    @staticmethod
+    def deserialize(
+        obj: ShamirSharesVector.SerializedShamirSharesVector, **_kwargs: Any
+    ) -> ShamirSharesVector:
+        r"""
+        Deserialization function for the vector of shares and corresponding scheme, which will be
+        passed to the communication module. The received lists of shares are used as is.
+
+        :param obj: serialization of the vector of shares
+        :param \**_kwargs: optional extra keyword arguments
+        :return: Deserialized ShamirSharesVector object.
+        """
+        return ShamirSharesVector(
+            ShamirSecretSharingScheme.deserialize(obj["scheme"]),
+            dict(zip(obj["party_ids"], obj["shares"])),
+        )
+
+
+if COMMUNICATION_INSTALLED:
+    try:
+        Serialization.register_class(ShamirSharesVector)
+    except RepetitionError:
+        pass
@@ -0,0 +1,232 @@
+"""
+Memory-mapped on-disk store of the shares of a single party.
+
+Every party has its own file, which starts with a header containing the scheme parameters,
+the id of the party and the number of stored shares, followed by the shares as fixed-width
+little-endian integers. Shares can only be appended. The file is memory-mapped, such that
+(slices of) the shares are decoded directly from the mapped file without loading it in full,
+e.g. to create vectors of shares or to reconstruct secrets from the stores of several parties.
+"""
+
+from __future__ import annotations
+
+import mmap
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import overload
+
+from tno.mpc.encryption_schemes.shamir.shamir import (
+    DEFAULT_EVALUATION_POINTS,
+    ShamirSecretSharingScheme,
+)
+from tno.mpc.encryption_schemes.shamir.shamir_shares_vector import ShamirSharesVector
+from tno.mpc.encryption_schemes.shamir.utils import (
+    MemoryMappedStore,
+    StrPath,
+    decode_fixed_width,
+    encode_fixed_width,
+)
+
+
+class ShareStore(MemoryMappedStore):
+    """
+    Memory-mapped, append-only on-disk store of the shares of a single party.
+
+    The counter in the header is the number of stored shares. It is only updated after the
+    appended shares have been written, such that an interrupted append does not corrupt the
+    store.
+    """
+
+    MAGIC = b"SSSS"
+    DESCRIPTION = "share store"
+
+    def _set_up(
+        self, modulus: int, number_of_parties: int, polynomial_degree: int
+    ) -> None:
+        """
+        Set up the scheme of the shares from the parameters in the header.
+
+        :param modulus: modulus of the scheme of the shares
+        :param number_of_parties: number of parties of the scheme of the shares
+        :param polynomial_degree: degree of the shares
+        """
+        self.scheme = ShamirSecretSharingScheme.get_instance(
+            modulus, number_of_parties, polynomial_degree
+        )
+
+    @classmethod
+    def create(
+        cls, path: StrPath, scheme: ShamirSecretSharingScheme, party_id: int
+    ) -> ShareStore:
+        """
+        Create an empty share store. Existing files are never overwritten.
+
+        :param path: location of the file of the store
+        :param scheme: scheme of the shares, including the degree of the shares
+        :param party_id: id of the party whose shares are stored
+        :raise ValueError: In case the scheme does not use the default evaluation points.
+        :return: the opened share store
+        """
+        if scheme.evaluation_points != DEFAULT_EVALUATION_POINTS:
+            raise ValueError(
+                "Only schemes with the default evaluation points can be stored."
+            )
+        with open(path, "xb") as file:
+            file.write(
+                cls._encode_header(
+                    scheme.modulus,
+                    scheme.number_of_parties,
+                    scheme.polynomial_degree,
+                    party_id,
+                )
+            )
+        return cls(path)
+
+    @classmethod
+    def write_all(
+        cls, directory: StrPath, vector: ShamirSharesVector
+    ) -> dict[int, ShareStore]:
+        """
+        Create a share store for every party of a vector of shares.
+
+        :param directory: directory in which the files of the stores are created
+        :param vector: vector of shares to be stored
+        :return: mapping from every party id to its opened share store
+        """
+        stores = {}
+        for party_id, shares in vector.shares.items():
+            store = cls.create(
+                Path(directory) / f"shares_party_{party_id}.bin",
+                vector.scheme,
+                party_id,
+            )
+            store.append(shares)
+            stores[party_id] = store
+        return stores
+
+    def __len__(self) -> int:
+        """
+        Number of shares in this store.
+
+        :return: number of stored shares
+        """
+        return self._counter
+
+    def append(self, shares: Iterable[int]) -> None:
+        """
+        Append shares to the end of this store. The shares are stored in their reduced form.
+
+        :param shares: shares of the party of this store
+        """
+        modulus = self.scheme.modulus
+        data = encode_fixed_width((share % modulus for share in shares), self.limb_size)
+        if not data:
+            return
+        count = len(self)
+        self._file.seek(self._data_offset + count * self.limb_size)
+        self._file.write(data)
+        self._file.flush()
+        self._mmap.close()
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._counter = count + len(data) // self.limb_size
+        self._mmap.flush()
+
+    def read(self, start: int = 0, stop: int | None = None) -> list[int]:
+        """
+        Decode a range of shares directly from the mapped file.
+
+        :param start: index of the first share
+        :param stop: index after the last share, the end of the store if None
+        :return: the shares in the range
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return []
+        offset = self._data_offset + start * self.limb_size
+        with memoryview(self._mmap) as view:
+            return decode_fixed_width(
+                view[offset : offset + (stop - start) * self.limb_size],
+                self.limb_size,
+            )
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        """
+        Select a single share or a slice of the shares of this store. Only the selected range
+        is decoded for slices without a step.
+
+        :param index: index or slice of the shares to select
+        :raise IndexError: In case the index is out of range.
+        :return: the selected share or shares
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.read(start, stop)
+            return self.read()[index]
+        if not -len(self) <= index < len(self):
+            raise IndexError("Share index out of range.")
+        index %= len(self)
+        return self.read(index, index + 1)[0]
+
+
+def _check_stores(stores: Mapping[int, ShareStore]) -> ShamirSecretSharingScheme:
+    """
+    Check that share stores can be combined.
+
+    :param stores: mapping from party id to the share store of that party
+    :raise ValueError: In case no stores are given, or the stores have different schemes or
+        lengths.
+    :return: the scheme of the stores
+    """
+    if not stores:
+        raise ValueError("Cannot determine the scheme of an empty list of stores.")
+    scheme = next(iter(stores.values())).scheme
+    if any(store.scheme != scheme for store in stores.values()):
+        raise ValueError(
+            "Different secret sharing schemes have been used, i.e. shares are incompatible."
+        )
+    if len({len(store) for store in stores.values()}) > 1:
+        raise ValueError("All stores should hold the same number of shares.")
+    return scheme
+
+
+def load_vector(
+    stores: Mapping[int, ShareStore], start: int = 0, stop: int | None = None
+) -> ShamirSharesVector:
+    """
+    Create a vector of shares from a range of the shares in the stores of several parties.
+
+    :param stores: mapping from party id to the share store of that party
+    :param start: index of the first element
+    :param stop: index after the last element, the end of the stores if None
+    :return: vector with the shares of all parties in the range
+    """
+    scheme = _check_stores(stores)
+    return ShamirSharesVector(
+        scheme, {i: store.read(start, stop) for i, store in stores.items()}
+    )
+
+
+def reconstruct_from_stores(
+    stores: Mapping[int, ShareStore], start: int = 0, stop: int | None = None
+) -> list[int]:
+    """
+    Reconstruct a range of secrets directly from the mapped stores of several parties. Only the
+    stores of the first polynomial_degree + 1 parties are read.
+
+    :param stores: mapping from party id to the share store of that party
+    :param start: index of the first secret
+    :param stop: index after the last secret, the end of the stores if None
+    :return: the reconstructed secrets in the range
+    """
+    scheme = _check_stores(stores)
+    reconstruction_set: Sequence[int] = list(stores)[: scheme.polynomial_degree + 1]
+    return scheme.reconstruct_many(
+        {i: stores[i].read(start, stop) for i in reconstruction_set}
+    )
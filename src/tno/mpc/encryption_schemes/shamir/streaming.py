@@ -0,0 +1,247 @@
+"""
+Streaming sharing and reconstruction of unbounded sequences of secrets.
+
+The secrets are consumed in chunks of a fixed size, which are shared or reconstructed with the
+batched operations of a scheme, such that only a single chunk is kept in memory at a time. The
+sharing results in a chunk of shares per party, which can be written to a file or socket of
+that party with write_share_stream and read back, lazily, with read_share_stream. Both
+synchronous iterables and asynchronous iterables are supported.
+"""
+
+from __future__ import annotations
+
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from itertools import islice
+from typing import BinaryIO, Protocol
+
+from tno.mpc.encryption_schemes.shamir.utils import (
+    decode_fixed_width,
+    encode_fixed_width,
+    limb_size,
+)
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+class BatchSharing(Protocol):
+    """
+    Batched sharing functionality that is required for streaming, e.g. a
+    ShamirSecretSharingScheme or a ParallelShamirEngine.
+    """
+
+    def share_secrets(self, values: Sequence[int]) -> dict[int, list[int]]:
+        """
+        Share many values at once.
+
+        :param values: secrets to be shared
+        :return: columnar sharing of the secrets
+        """
+
+    def reconstruct_many(
+        self, shares_by_party: Mapping[int, Sequence[int]]
+    ) -> list[int]:
+        """
+        Reconstruct many secrets at once from a columnar sharing.
+
+        :param shares_by_party: mapping from party id to the shares of that party for every secret
+        :return: reconstructed secrets
+        """
+
+
+def _chunks(values: Iterable[int], chunk_size: int) -> Iterator[list[int]]:
+    """
+    Split an iterable into consecutive chunks, of which only the last one can be shorter.
+
+    :param values: values to be split
+    :param chunk_size: number of values per chunk
+    :return: iterator over the chunks
+    """
+    iterator = iter(values)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+async def _achunks(
+    values: AsyncIterable[int], chunk_size: int
+) -> AsyncIterator[list[int]]:
+    """
+    Split an asynchronous iterable into consecutive chunks, of which only the last one can be
+    shorter.
+
+    :param values: values to be split
+    :param chunk_size: number of values per chunk
+    :return: asynchronous iterator over the chunks
+    """
+    chunk: list[int] = []
+    async for value in values:
+        chunk.append(value)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _next_chunk(iterator: AsyncIterator[list[int]]) -> list[int]:
+    """
+    Next chunk of an asynchronous iterator over chunks.
+
+    :param iterator: asynchronous iterator over chunks
+    :return: the next chunk, or an empty chunk if the iterator is exhausted
+    """
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return []
+
+
+def _reconstruct_chunk(
+    scheme: BatchSharing, chunks: Mapping[int, list[int]]
+) -> list[int]:
+    """
+    Reconstruct a chunk of secrets from the chunks of the shares of every party.
+
+    :param scheme: scheme with which the secrets are shared
+    :param chunks: chunk of the shares of every party
+    :raise ValueError: In case the streams of the parties have different lengths.
+    :return: the reconstructed secrets
+    """
+    if len({len(chunk) for chunk in chunks.values()}) > 1:
+        raise ValueError("The streams of all parties should have the same length.")
+    return scheme.reconstruct_many(chunks)
+
+
+def share_stream(
+    scheme: BatchSharing,
+    values: Iterable[int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict[int, list[int]]]:
+    """
+    Share a stream of secrets in chunks.
+
+    :param scheme: scheme with which the secrets are shared
+    :param values: secrets to be shared, e.g. a generator
+    :param chunk_size: number of secrets that are shared at once
+    :return: iterator over the columnar sharings of the chunks, mapping every party id to its
+        shares of the secrets in the chunk
+    """
+    for chunk in _chunks(values, chunk_size):
+        yield scheme.share_secrets(chunk)
+
+
+def reconstruct_stream(
+    scheme: BatchSharing,
+    per_party_streams: Mapping[int, Iterable[int]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[list[int]]:
+    """
+    Reconstruct a stream of secrets in chunks from the streams of shares of the parties. All
+    given streams are consumed, so only the streams of a reconstruction set should be given.
+
+    :param scheme: scheme with which the secrets are shared
+    :param per_party_streams: mapping from party id to the stream of shares of that party
+    :param chunk_size: number of secrets that are reconstructed at once
+    :raise ValueError: In case the streams of the parties have different lengths.
+    :return: iterator over the chunks of reconstructed secrets
+    """
+    iterators = {
+        i: _chunks(stream, chunk_size) for i, stream in per_party_streams.items()
+    }
+    while True:
+        chunks = {i: next(iterator, []) for i, iterator in iterators.items()}
+        if not any(chunks.values()):
+            return
+        yield _reconstruct_chunk(scheme, chunks)
+
+
+async def share_stream_async(
+    scheme: BatchSharing,
+    values: AsyncIterable[int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[dict[int, list[int]]]:
+    """
+    Share an asynchronous stream of secrets in chunks.
+
+    :param scheme: scheme with which the secrets are shared
+    :param values: secrets to be shared, e.g. an asynchronous generator
+    :param chunk_size: number of secrets that are shared at once
+    :return: asynchronous iterator over the columnar sharings of the chunks, mapping every
+        party id to its shares of the secrets in the chunk
+    """
+    async for chunk in _achunks(values, chunk_size):
+        yield scheme.share_secrets(chunk)
+
+
+async def reconstruct_stream_async(
+    scheme: BatchSharing,
+    per_party_streams: Mapping[int, AsyncIterable[int]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[list[int]]:
+    """
+    Reconstruct an asynchronous stream of secrets in chunks from the asynchronous streams of
+    shares of the parties. All given streams are consumed, so only the streams of a
+    reconstruction set should be given.
+
+    :param scheme: scheme with which the secrets are shared
+    :param per_party_streams: mapping from party id to the stream of shares of that party
+    :param chunk_size: number of secrets that are reconstructed at once
+    :raise ValueError: In case the streams of the parties have different lengths.
+    :return: asynchronous iterator over the chunks of reconstructed secrets
+    """
+    iterators = {
+        i: _achunks(stream, chunk_size) for i, stream in per_party_streams.items()
+    }
+    while True:
+        chunks = {i: await _next_chunk(iterator) for i, iterator in iterators.items()}
+        if not any(chunks.values()):
+            return
+        yield _reconstruct_chunk(scheme, chunks)
+
+
+def write_share_stream(
+    chunks: Iterable[Mapping[int, Sequence[int]]],
+    files: Mapping[int, BinaryIO],
+    modulus: int,
+) -> int:
+    """
+    Write the chunks of a streamed sharing to a binary file (or socket file) per party. The
+    shares are written as consecutive fixed-width integers of limb_size(modulus) bytes.
+
+    :param chunks: columnar sharings of the chunks, e.g. as produced by share_stream
+    :param files: mapping from party id to the binary file of that party
+    :param modulus: modulus of the scheme with which the secrets are shared
+    :return: the number of shares written per party
+    """
+    width = limb_size(modulus)
+    count = 0
+    for chunk in chunks:
+        for i, file in files.items():
+            file.write(encode_fixed_width(chunk[i], width))
+        count += len(next(iter(chunk.values()), []))
+    return count
+
+
+def read_share_stream(
+    file: BinaryIO, modulus: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[int]:
+    """
+    Lazily read the shares of a party that were written with write_share_stream.
+
+    :param file: binary file of the party
+    :param modulus: modulus of the scheme with which the secrets are shared
+    :param chunk_size: number of shares that are read at once
+    :raise ValueError: In case the file ends with an incomplete share.
+    :return: iterator over the shares of the party
+    """
+    width = limb_size(modulus)
+    while data := file.read(chunk_size * width):
+        if len(data) % width:
+            raise ValueError("The stream ends with an incomplete share.")
+        yield from decode_fixed_width(data, width)
@@ -0,0 +1,84 @@
+"""
+In-process stand-in for a group of communication pools, for testing the distributed protocols.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+
+class LocalPool:
+    """
+    Communication pool stand-in that delivers messages between pools in the same process. The
+    handler names follow the tno.mpc.communication test pools, i.e. the pool with index j is
+    known to the other pools as f"local{j}".
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mailboxes: dict[tuple[str, str, str | None], asyncio.Future[Any]],
+    ) -> None:
+        """
+        Initialize a pool that shares its mailboxes with the other pools in the group.
+
+        :param name: handler name of this pool in the other pools
+        :param mailboxes: mailboxes of the group, keyed by sender, receiver and message id
+        """
+        self.name = name
+        self._mailboxes = mailboxes
+        self.messages_sent = 0
+
+    @classmethod
+    def create_group(cls, number_of_pools: int) -> tuple[LocalPool, ...]:
+        """
+        Create a group of pools that can communicate with each other.
+
+        :param number_of_pools: number of pools in the group
+        :return: the pools of the group
+        """
+        mailboxes: dict[tuple[str, str, str | None], asyncio.Future[Any]] = {}
+        return tuple(cls(f"local{j}", mailboxes) for j in range(number_of_pools))
+
+    def _mailbox(
+        self, sender: str, receiver: str, msg_id: str | None
+    ) -> asyncio.Future[Any]:
+        """
+        Get (or create) the mailbox of a message.
+
+        :param sender: handler name of the sending pool
+        :param receiver: handler name of the receiving pool
+        :param msg_id: identifier of the message
+        :return: future that is resolved with the message
+        """
+        key = (sender, receiver, msg_id)
+        if key not in self._mailboxes:
+            self._mailboxes[key] = asyncio.get_running_loop().create_future()
+        return self._mailboxes[key]
+
+    async def send(
+        self, handler_name: str, message: Any, msg_id: str | None = None
+    ) -> None:
+        """
+        Send a message to a peer.
+
+        :param handler_name: the name of the pool handler to send a message to
+        :param message: the message to send
+        :param msg_id: an optional string identifying the message to send
+        """
+        self.messages_sent += 1
+        self._mailbox(self.name, handler_name, msg_id).set_result(message)
+
+    async def recv(self, handler_name: str, msg_id: str | None = None) -> Any:
+        """
+        Receive a message from a peer.
+
+        :param handler_name: the name of the pool handler to receive a message from
+        :param msg_id: an optional string identifying the message to collect
+        :return: the message from peer
+        """
+        key = (handler_name, self.name, msg_id)
+        message = await self._mailbox(*key)
+        del self._mailboxes[key]
+        return message
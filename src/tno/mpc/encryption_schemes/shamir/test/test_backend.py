@@ -0,0 +1,221 @@
+"""
+Tests for the backends of the modular arithmetic.
+"""
+
+from __future__ import annotations
+
+from operator import add, mul, sub
+
+import pytest
+import sympy
+
+from tno.mpc.encryption_schemes.shamir import (
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+)
+from tno.mpc.encryption_schemes.shamir import backend as backend_module
+from tno.mpc.encryption_schemes.shamir.backend import (
+    BARRETT_MIN_BITS,
+    GMPY2_BACKEND,
+    GMPY2_MIN_BITS,
+    NUMPY_BACKEND,
+    NUMPY_MAX_MODULUS,
+    NUMPY_MIN_SIZE,
+    PYTHON_BACKEND,
+    BarrettBackend,
+    PythonBackend,
+    select_backend,
+)
+from tno.mpc.encryption_schemes.shamir.shamir_secret_sharing_integers import (
+    ShamirSecretSharingIntegers,
+)
+
+backends = [
+    PYTHON_BACKEND,
+    pytest.param(
+        GMPY2_BACKEND,
+        marks=pytest.mark.skipif(
+            GMPY2_BACKEND is None, reason="gmpy2 is not installed"
+        ),
+    ),
+]
+numpy_backend = pytest.param(
+    NUMPY_BACKEND,
+    marks=pytest.mark.skipif(NUMPY_BACKEND is None, reason="numpy is not installed"),
+)
+moduli = [10657, sympy.nextprime(2**255), sympy.nextprime(2**2047)]
+small_moduli = [10657, sympy.prevprime(NUMPY_MAX_MODULUS)]
+values = list(range(0, 100, 10))
+
+
+@pytest.mark.parametrize("backend", backends)
+def test_backend_operations(backend: PythonBackend) -> None:
+    """
+    Test the modular operations of a backend, and that the results are Python integers.
+
+    :param backend: backend to be tested
+    """
+    modulus = moduli[-1]
+    converted = backend.convert(modulus)
+    results = [
+        backend.dot_mod([2, 3], [modulus - 1, 4], converted),
+        backend.mul_mod(modulus - 1, modulus - 1, converted),
+        backend.powmod(3, modulus - 1, modulus),
+        backend.invert(2, modulus),
+    ]
+    assert results == [10, 1, 1, (modulus + 1) // 2]
+    assert all(type(result) is int for result in results)
+
+
+def test_select_backend() -> None:
+    """
+    Test that NumPy is selected for small moduli and gmpy2 for large moduli, when available.
+    """
+    assert select_backend(2**256) is PYTHON_BACKEND
+    assert select_backend(10657) is (
+        PYTHON_BACKEND if NUMPY_BACKEND is None else NUMPY_BACKEND
+    )
+    assert select_backend(NUMPY_MAX_MODULUS + 1) is not NUMPY_BACKEND
+    expected = PYTHON_BACKEND if GMPY2_BACKEND is None else GMPY2_BACKEND
+    assert select_backend(2**GMPY2_MIN_BITS + 1) is expected
+
+
+@pytest.mark.parametrize("backend", backends)
+@pytest.mark.parametrize("modulus", moduli)
+def test_sharing_with_backend(backend: PythonBackend, modulus: int) -> None:
+    """
+    Test sharing, arithmetic and reconstruction with every backend, and that the shares remain
+    Python integers.
+
+    :param backend: backend to be tested
+    :param modulus: prime modulus of the scheme
+    """
+    scheme = ShamirSecretSharingScheme(modulus, 5, 2, backend=backend)
+    sharing_1 = scheme.share_secret(modulus - 3)
+    sharing_2 = scheme.share_secret(7)
+    assert all(type(share) is int for share in sharing_1.shares.values())
+    assert (sharing_1 + sharing_2).reconstruct_secret() == 4
+    assert (sharing_1 * sharing_2).reconstruct_secret() == modulus - 21
+    assert (3 * sharing_2).reconstruct_secret() == 21
+    assert scheme.reconstruct_many(scheme.share_secrets(values)) == values
+
+    integer_sharing = ShamirSecretSharingIntegers(
+        number_of_parties=5, polynomial_degree=2
+    ).share_secret(6)
+    with pytest.warns(UserWarning):
+        assert (integer_sharing * sharing_2).reconstruct_secret() == 42
+
+
+@pytest.mark.parametrize("backend", [PYTHON_BACKEND, numpy_backend])
+@pytest.mark.parametrize("modulus", small_moduli)
+@pytest.mark.parametrize("size", [NUMPY_MIN_SIZE - 1, 1000])
+def test_small_field_operations(
+    backend: PythonBackend, modulus: int, size: int
+) -> None:
+    """
+    Test the batched operations for small moduli against Python arithmetic, including operands
+    that are negative or not reduced.
+
+    :param backend: backend to be tested
+    :param modulus: modulus below NUMPY_MAX_MODULUS
+    :param size: number of elements in the batch
+    """
+    left = [(modulus - 1 - i) * (-1) ** i for i in range(size)]
+    right = [modulus + 2**64 * i for i in range(size)]
+    for operator in (add, sub, mul):
+        assert backend.elementwise_mod(left, right, operator, modulus) == [
+            operator(a, b) % modulus for a, b in zip(left, right)
+        ]
+        assert backend.elementwise_mod(left, -3, operator, modulus) == [
+            operator(a, -3) % modulus for a in left
+        ]
+    rows = [[1, modulus - 1, modulus - 2], [modulus - 5, 2, 3]]
+    columns = [(a, b, a + b) for a, b in zip(left, right)]
+    assert backend.matrix_mod(rows, columns, modulus) == [
+        [sum(map(mul, row, column)) % modulus for column in columns] for row in rows
+    ]
+
+
+@pytest.mark.parametrize("backend", [PYTHON_BACKEND, numpy_backend])
+@pytest.mark.parametrize("modulus", small_moduli)
+def test_small_field_vectors(backend: PythonBackend, modulus: int) -> None:
+    """
+    Test sharing, element-wise arithmetic and reconstruction of large vectors for small moduli.
+
+    :param backend: backend to be tested
+    :param modulus: modulus below NUMPY_MAX_MODULUS
+    """
+    scheme = ShamirSecretSharingScheme(modulus, 7, 3, backend=backend)
+    secrets_1 = list(range(1000))
+    secrets_2 = list(range(modulus - 1, modulus - 1001, -1))
+    vector_1 = ShamirSharesVector(scheme, scheme.share_secrets(secrets_1))
+    vector_2 = ShamirSharesVector(scheme, scheme.share_secrets(secrets_2))
+    assert all(
+        type(share) is int for column in vector_1.shares.values() for share in column
+    )
+    assert (vector_1 + vector_2).reconstruct_secrets() == [
+        (a + b) % modulus for a, b in zip(secrets_1, secrets_2)
+    ]
+    assert (vector_1 - 5).reconstruct_secrets() == [
+        (a - 5) % modulus for a in secrets_1
+    ]
+    assert (vector_1 * vector_2).reconstruct_secrets() == [
+        a * b % modulus for a, b in zip(secrets_1, secrets_2)
+    ]
+
+
+@pytest.mark.parametrize("backend", backends)
+def test_large_field_vectors(backend: PythonBackend) -> None:
+    """
+    Test that the element-wise arithmetic of vectors with a modulus of at least GMPY2_MIN_BITS
+    bits returns Python integers.
+
+    :param backend: backend to be tested
+    """
+    modulus = sympy.nextprime(2**1100)
+    scheme = ShamirSecretSharingScheme(modulus, 5, 2, backend=backend)
+    vector = ShamirSharesVector(scheme, scheme.share_secrets(values))
+    for result in (vector + vector, vector - 3, vector * 5, 5 * vector):
+        assert all(
+            type(share) is int for column in result.shares.values() for share in column
+        )
+    assert (vector + vector).reconstruct_secrets() == [2 * value for value in values]
+
+
+@pytest.mark.parametrize("modulus", moduli)
+def test_barrett_reduction(modulus: int) -> None:
+    """
+    Test the Barrett backend against the built-in reduction, including values that are
+    negative, accumulated over many products, or reduced modulo another modulus.
+
+    :param modulus: modulus of the Barrett backend
+    """
+    backend = BarrettBackend(modulus)
+    products = [(modulus - 1 - i) * (modulus - 1 - 2 * i) for i in range(10)]
+    for value in [0, modulus, *products, sum(products), -products[0], modulus**3]:
+        assert backend.reduce(value, modulus) == value % modulus
+    assert backend.reduce(products[1], 10657) == products[1] % 10657
+    assert backend.mul_mod(modulus - 1, modulus - 1, modulus) == 1
+    assert backend.dot_mod([2, 3], [modulus - 1, 4], modulus) == 10
+    left = [modulus - 1 - i for i in range(10)]
+    for operator in (add, sub, mul):
+        assert backend.elementwise_mod(left, left[::-1], operator, modulus) == [
+            operator(a, b) % modulus for a, b in zip(left, left[::-1])
+        ]
+    scheme = ShamirSecretSharingScheme(modulus, 5, 2, backend=backend)
+    assert scheme.reconstruct_many(scheme.share_secrets(values)) == values
+    with pytest.raises(ValueError):
+        BarrettBackend(1)
+
+
+def test_select_barrett_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that a Barrett backend is selected for very large moduli in absence of gmpy2.
+
+    :param monkeypatch: pytest fixture to replace the gmpy2 backend
+    """
+    monkeypatch.setattr(backend_module, "GMPY2_BACKEND", None)
+    selected = select_backend(2**BARRETT_MIN_BITS + 1)
+    assert isinstance(selected, BarrettBackend)
+    assert selected.modulus == 2**BARRETT_MIN_BITS + 1
+    assert select_backend(2**GMPY2_MIN_BITS + 1) is PYTHON_BACKEND
@@ -0,0 +1,110 @@
+"""
+Tests for the Beaver-triple preprocessing and online multiplication.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO, Any
+
+import pytest
+
+from tno.mpc.encryption_schemes.shamir import (
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+    utils,
+)
+from tno.mpc.encryption_schemes.shamir.beaver_triples import (
+    TripleStore,
+    generate_triples,
+    multiply_with_triple,
+    take_triples,
+)
+from tno.mpc.encryption_schemes.shamir.test.test_shamir_secret_sharing import (
+    fixture_shamir_scheme as fixture_shamir_scheme,  # pylint: disable=unused-import
+)
+
+values_1 = list(range(0, 100, 10))
+values_2 = list(range(5, 105, 10))
+
+
+def test_generate_triples(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test that generated triples satisfy c = ab.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    a_vector, b_vector, c_vector = generate_triples(shamir_scheme, 20)
+    assert [
+        a * b % shamir_scheme.modulus
+        for a, b in zip(a_vector.reconstruct_secrets(), b_vector.reconstruct_secrets())
+    ] == c_vector.reconstruct_secrets()
+
+
+def test_multiply_with_triple(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the online multiplication with triples, which keeps the degree of the inputs.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    x = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    y = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_2))
+    product = multiply_with_triple(x, y, generate_triples(shamir_scheme, len(x)))
+    assert product.degree == shamir_scheme.polynomial_degree
+    assert product.reconstruct_secrets() == [a * b for a, b in zip(values_1, values_2)]
+
+
+def test_triple_store(shamir_scheme: ShamirSecretSharingScheme, tmp_path: Path) -> None:
+    """
+    Test writing triples to per-party stores and consuming them streaming-wise, also across
+    reopening of the stores.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    :param tmp_path: Temporary directory for the stores.
+    """
+    triples = generate_triples(shamir_scheme, 25)
+    stores = TripleStore.write_all(tmp_path, triples)
+    assert set(stores) == set(range(1, shamir_scheme.number_of_parties + 1))
+    assert all(store.scheme is stores[1].scheme for store in stores.values())
+    assert stores[1].scheme == shamir_scheme
+
+    x = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    y = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_2))
+    first_batch = take_triples(stores, len(x))
+    assert first_batch[0].reconstruct_secrets() == triples[0][:10].reconstruct_secrets()
+    product = multiply_with_triple(x, y, first_batch)
+    assert product.reconstruct_secrets() == [a * b for a, b in zip(values_1, values_2)]
+    for store in stores.values():
+        store.close()
+
+    with TripleStore(tmp_path / "triples_party_1.bin") as store:
+        assert store.consumed == 10
+        assert len(store) == 15
+        a_shares, _, c_shares = store.take(15)
+        assert a_shares == triples[0].shares[1][10:]
+        assert c_shares == triples[2].shares[1][10:]
+        with pytest.raises(ValueError):
+            store.take(1)
+
+
+def test_invalid_triple_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that opening a file that is not a triple store fails and closes the file.
+
+    :param tmp_path: Temporary directory for the store.
+    :param monkeypatch: pytest fixture to keep track of the opened files
+    """
+    opened: list[IO[Any]] = []
+
+    def tracking_open(*args: Any, **kwargs: Any) -> IO[Any]:
+        opened.append(open(*args, **kwargs))  # pylint: disable=consider-using-with
+        return opened[-1]
+
+    monkeypatch.setattr(utils, "open", tracking_open, raising=False)
+    for content in (b"\x00" * 64, b"SSTS", b""):
+        path = tmp_path / "invalid.bin"
+        path.write_bytes(content)
+        with pytest.raises(ValueError, match="not a valid triple store"):
+            TripleStore(path)
+    assert len(opened) == 3
+    assert all(file.closed for file in opened)
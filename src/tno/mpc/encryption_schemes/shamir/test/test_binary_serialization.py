@@ -0,0 +1,167 @@
+"""
+Tests for the compact binary wire format of Shamir schemes and shares.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pytest
+
+from tno.mpc.encryption_schemes.shamir import (
+    IntegerShares,
+    ShamirSecretSharingIntegers,
+    ShamirSecretSharingScheme,
+    ShamirShares,
+    ShamirSharesVector,
+    binary_serialization,
+)
+from tno.mpc.encryption_schemes.shamir.binary_serialization import (
+    KIND_SHAMIR_SHARES,
+    SCHEME_REGISTRY_SIZE,
+    decode,
+    encode,
+    scheme_id,
+)
+from tno.mpc.encryption_schemes.shamir.test.test_shamir_secret_sharing import (
+    fixture_shamir_scheme as fixture_shamir_scheme,  # pylint: disable=unused-import
+)
+from tno.mpc.encryption_schemes.shamir.utils import limb_size
+
+values = list(range(0, 100, 10))
+
+
+def test_scheme_round_trip(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test that a decoded scheme is the interned scheme with the same parameters.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    decoded = decode(encode(shamir_scheme))
+    assert decoded == shamir_scheme
+    assert decoded is ShamirSecretSharingScheme.get_instance(
+        shamir_scheme.modulus,
+        shamir_scheme.number_of_parties,
+        shamir_scheme.polynomial_degree,
+    )
+
+
+def test_shamir_shares_round_trip(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the encoding and decoding of Shamir shares, also of a product with a derived scheme.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    decode(encode(shamir_scheme))
+    sharing = shamir_scheme.share_secret(42)
+    product = sharing * sharing
+    for shares in (sharing, product):
+        decoded = decode(memoryview(encode(shares)))
+        assert isinstance(decoded, ShamirShares)
+        assert decoded.scheme == shares.scheme
+        assert decoded.degree == shares.degree
+        assert decoded.shares == {
+            i: share % shamir_scheme.modulus for i, share in shares.shares.items()
+        }
+    assert decode(encode(product)).reconstruct_secret() == 42 * 42  # type: ignore[union-attr]
+
+
+def test_shamir_shares_vector_round_trip(
+    shamir_scheme: ShamirSecretSharingScheme,
+) -> None:
+    """
+    Test the columnar encoding and decoding of a vector of Shamir shares.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    vector = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values))
+    encoding = encode(vector)
+    assert decode(encoding) == vector
+    assert decode(bytearray(encoding)) == vector
+    # the shares of every party are stored as fixed-width limbs, preceded by a fixed header and
+    # the party ids
+    limbs = len(vector) * shamir_scheme.number_of_parties
+    assert len(
+        encoding
+    ) == 4 + 20 + 4 * shamir_scheme.number_of_parties + limbs * limb_size(
+        shamir_scheme.modulus
+    )
+
+
+@pytest.mark.parametrize("secret", values)
+def test_integer_shares_round_trip(secret: int) -> None:
+    """
+    Test the encoding and decoding of (signed) integer shares and their scheme.
+
+    :param secret: Secret to be shared.
+    """
+    scheme = ShamirSecretSharingIntegers(max_int=1000, number_of_parties=9)
+    assert decode(encode(scheme)) == scheme
+    sharing = scheme.share_secret(secret) * scheme.share_secret(3)
+    # negating the shares ensures that negative shares are encoded
+    for shares, expected in ((sharing, 3 * secret), (-1 * sharing, -3 * secret)):
+        decoded = decode(encode(shares))
+        assert isinstance(decoded, IntegerShares)
+        assert decoded == shares
+        assert decoded.reconstruct_secret() == expected
+
+
+def test_unknown_scheme(
+    shamir_scheme: ShamirSecretSharingScheme, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that shares can only be decoded when their scheme is known, and that the scheme only
+    needs to be decoded once.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    :param monkeypatch: Fixture to replace the scheme registry by an empty one.
+    """
+    encoding = encode(shamir_scheme.share_secret(42))
+    monkeypatch.setattr(binary_serialization, "_schemes", OrderedDict())
+    with pytest.raises(ValueError):
+        decode(encoding)
+    decode(encode(shamir_scheme))
+    assert decode(encoding).reconstruct_secret() == 42  # type: ignore[union-attr]
+
+
+def test_scheme_registry_bound(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the scheme registry drops the least recently used scheme when it is full.
+
+    :param monkeypatch: Fixture to replace the scheme registry by an empty one.
+    """
+    registry: OrderedDict[bytes, ShamirSecretSharingScheme] = OrderedDict()
+    monkeypatch.setattr(binary_serialization, "_schemes", registry)
+    schemes = [
+        ShamirSecretSharingScheme(10657, n, 1)
+        for n in range(2, SCHEME_REGISTRY_SIZE + 3)
+    ]
+    encodings = [encode(scheme.share_secret(42)) for scheme in schemes[:-1]]
+    assert len(registry) == SCHEME_REGISTRY_SIZE
+    # Using the first scheme makes the second scheme the least recently used one
+    assert decode(encodings[0]).reconstruct_secret() == 42  # type: ignore[union-attr]
+    scheme_id(schemes[-1])
+    assert len(registry) == SCHEME_REGISTRY_SIZE
+    assert decode(encodings[0]).reconstruct_secret() == 42  # type: ignore[union-attr]
+    with pytest.raises(ValueError):
+        decode(encodings[1])
+
+
+def test_wrong_scheme_kind() -> None:
+    """
+    Test that shares that refer to a scheme of another kind are rejected.
+    """
+    encoding = bytearray(encode(ShamirSecretSharingIntegers().share_secret(42)))
+    encoding[3] = KIND_SHAMIR_SHARES
+    with pytest.raises(ValueError):
+        decode(encoding)
+
+
+def test_invalid_encoding() -> None:
+    """
+    Test that buffers in another format are rejected.
+    """
+    with pytest.raises(ValueError):
+        decode(b"\x00" * 32)
+    with pytest.raises(TypeError):
+        encode(42)  # type: ignore[arg-type]
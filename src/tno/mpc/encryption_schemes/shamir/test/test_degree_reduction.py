@@ -0,0 +1,123 @@
+"""
+Tests for the degree reduction of Shamir sharings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+import pytest
+
+from tno.mpc.communication import Pool
+
+from tno.mpc.encryption_schemes.shamir import (
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+)
+from tno.mpc.encryption_schemes.shamir.degree_reduction import (
+    reduce_degree,
+    reduce_degree_distributed,
+    reduce_degree_many,
+)
+from tno.mpc.encryption_schemes.shamir.test.test_shamir_secret_sharing import (
+    fixture_shamir_scheme as fixture_shamir_scheme,  # pylint: disable=unused-import
+)
+
+values_1 = list(range(0, 100, 10))
+values_2 = list(range(5, 105, 10))
+
+
+def test_reduce_degree(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test that the degree of a product is reduced to the original degree, allowing for
+    reconstruction from polynomial_degree + 1 shares and for further multiplications.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    sharing = shamir_scheme.share_secret(7)
+    product = sharing * sharing
+    if product.degree >= shamir_scheme.number_of_parties:
+        pytest.skip("Too little parties to reduce the degree of a product.")
+    reduced = reduce_degree(product, shamir_scheme)
+    assert reduced.scheme is shamir_scheme
+    reconstructor = type(reduced)(
+        shamir_scheme,
+        {i: reduced.shares[i] for i in range(1, shamir_scheme.polynomial_degree + 2)},
+    )
+    assert reconstructor.reconstruct_secret() == 49
+
+    # a long multiplication chain remains reconstructable
+    for _ in range(5):
+        reduced = reduce_degree(reduced * sharing, shamir_scheme)
+    assert reduced.reconstruct_secret() == pow(7, 7, shamir_scheme.modulus)
+
+
+def test_reduce_degree_many(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the batched degree reduction of a vector of products.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    vector_1 = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    vector_2 = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_2))
+    product = vector_1 * vector_2
+    if product.degree >= shamir_scheme.number_of_parties:
+        pytest.skip("Too little parties to reduce the degree of a product.")
+    reduced = reduce_degree_many(product, shamir_scheme)
+    assert reduced.degree == shamir_scheme.polynomial_degree
+    assert reduced.reconstruct_secrets() == [a * b for a, b in zip(values_1, values_2)]
+
+
+def test_incompatible_target_scheme(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test that the target scheme should have the same modulus and number of parties.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    sharing = shamir_scheme.share_secret(7)
+    with pytest.raises(ValueError):
+        reduce_degree(
+            sharing * sharing,
+            ShamirSecretSharingScheme(
+                shamir_scheme.modulus,
+                shamir_scheme.number_of_parties + 1,
+                shamir_scheme.polynomial_degree,
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_reduce_degree_distributed(
+    http_pool_group_factory: Callable[[int], tuple[Pool, ...]],
+) -> None:
+    """
+    Test the degree reduction of a batch of products over communication pools.
+
+    :param http_pool_group_factory: Factory for creating a group of communication pools.
+    """
+    scheme = ShamirSecretSharingScheme(10657, 5, 2)
+    pools = http_pool_group_factory(scheme.number_of_parties)
+    # the pool of party i (ids start at 1) has handler name f"local{j - 1}" for party j
+    party_names = {
+        i: {j: f"local{j - 1}" for j in range(1, 6) if j != i} for i in range(1, 6)
+    }
+    vector_1 = ShamirSharesVector(scheme, scheme.share_secrets(values_1))
+    vector_2 = ShamirSharesVector(scheme, scheme.share_secrets(values_2))
+    product = vector_1 * vector_2
+
+    results = await asyncio.gather(
+        *(
+            reduce_degree_distributed(
+                pools[i - 1],
+                i,
+                party_names[i],
+                product.shares[i],
+                product.scheme,
+                scheme,
+            )
+            for i in range(1, 6)
+        )
+    )
+    reduced = ShamirSharesVector(scheme, dict(zip(range(1, 6), results)))
+    assert reduced.reconstruct_secrets() == [a * b for a, b in zip(values_1, values_2)]
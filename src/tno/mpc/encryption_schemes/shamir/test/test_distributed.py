@@ -0,0 +1,124 @@
+"""
+Tests for the asynchronous distribution and reconstruction of Shamir sharings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+import pytest
+
+from tno.mpc.communication import Pool
+
+from tno.mpc.encryption_schemes.shamir import (
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+)
+from tno.mpc.encryption_schemes.shamir.distributed import (
+    MessagePool,
+    distribute_shares,
+    open_shares,
+    receive_shares,
+)
+from tno.mpc.encryption_schemes.shamir.test.local_pool import LocalPool
+
+values = list(range(2500))
+scheme = ShamirSecretSharingScheme(10657, 5, 2)
+
+
+def party_names(party_id: int, number_of_parties: int) -> dict[int, str]:
+    """
+    Handler names of the other parties, where party i uses the pool with index i - 1.
+
+    :param party_id: id of the party
+    :param number_of_parties: number of parties in the network
+    :return: mapping from the id of every other party to its handler name
+    """
+    return {
+        j: f"local{j - 1}" for j in range(1, number_of_parties + 1) if j != party_id
+    }
+
+
+async def share_and_open(pools: tuple[MessagePool, ...], batch_size: int) -> None:
+    """
+    Let party 1 deal a sharing of all values to the other parties, after which all parties
+    open the values together.
+
+    :param pools: communication pools of the parties, in the order of the party ids
+    :param batch_size: maximum number of shares per message
+    """
+    sharings = ShamirSharesVector(scheme, scheme.share_secrets(values))
+    n = scheme.number_of_parties
+    dealt = await asyncio.gather(
+        distribute_shares(pools[0], party_names(1, n), sharings, batch_size=batch_size),
+        *(receive_shares(pools[i - 1], "local0") for i in range(2, n + 1)),
+    )
+    assert dealt == [sharings.shares[i] for i in range(1, n + 1)]
+
+    opened = await asyncio.gather(
+        *(
+            open_shares(
+                pools[i - 1],
+                i,
+                party_names(i, n),
+                dealt[i - 1],  # type: ignore[arg-type]
+                scheme,
+                batch_size=batch_size,
+                max_concurrency=2,
+            )
+            for i in range(1, n + 1)
+        )
+    )
+    assert all(result == values for result in opened)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [1000, 10_000])
+async def test_share_and_open_local(batch_size: int) -> None:
+    """
+    Test the distribution and opening of many values with in-process pools and check that
+    the shares are coalesced into one message per batch.
+
+    :param batch_size: maximum number of shares per message
+    """
+    pools = LocalPool.create_group(scheme.number_of_parties)
+    await share_and_open(pools, batch_size)
+    batches = -(-len(values) // batch_size)
+    n = scheme.number_of_parties
+    assert pools[0].messages_sent == 2 * (n - 1) * batches
+    assert pools[1].messages_sent == (n - 1) * batches
+
+
+@pytest.mark.asyncio
+async def test_share_and_open_http(
+    http_pool_group_factory: Callable[[int], tuple[Pool, ...]],
+) -> None:
+    """
+    Test the distribution and opening of many values over communication pools.
+
+    :param http_pool_group_factory: Factory for creating a group of communication pools.
+    """
+    await share_and_open(http_pool_group_factory(scheme.number_of_parties), 1000)
+
+
+@pytest.mark.asyncio
+async def test_distribute_to_other_parties() -> None:
+    """
+    Test the distribution of shares by a dealer that is not one of the parties.
+    """
+    pools = LocalPool.create_group(scheme.number_of_parties + 1)
+    sharings = ShamirSharesVector(scheme, scheme.share_secrets(values))
+    # the dealer uses the last pool, party i uses the pool with index i - 1
+    dealer_name = f"local{scheme.number_of_parties}"
+    dealt = await asyncio.gather(
+        distribute_shares(
+            pools[-1], party_names(0, scheme.number_of_parties), sharings
+        ),
+        *(
+            receive_shares(pools[i - 1], dealer_name)
+            for i in range(1, scheme.number_of_parties + 1)
+        ),
+    )
+    assert dealt[0] is None
+    assert scheme.reconstruct_many(dict(enumerate(dealt[1:], start=1))) == values  # type: ignore[arg-type]
@@ -0,0 +1,146 @@
+"""
+Tests for the tracking of the size of shares over the integers and the tight randomness interval.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tno.mpc.communication import Serialization
+
+from tno.mpc.encryption_schemes.shamir import (
+    IntegerShares,
+    IntegerSharesVector,
+    ShamirSecretSharingIntegers,
+)
+from tno.mpc.encryption_schemes.shamir.binary_serialization import encode
+from tno.mpc.encryption_schemes.shamir.parallel import _create_scheme
+from tno.mpc.encryption_schemes.shamir.randomness import SecretsRandomness
+from tno.mpc.encryption_schemes.shamir.shamir_secret_sharing_integers import (
+    tight_randomness_interval,
+)
+from tno.mpc.encryption_schemes.shamir.test.test_shamir_secret_sharing_integers import (
+    fixture_shamir_scheme as fixture_shamir_scheme,  # pylint: disable=unused-import
+)
+
+secrets = [-1000, -999, -1, 0, 1, 17, 999, 1000]
+
+
+def test_tight_randomness_interval(shamir_scheme: ShamirSecretSharingIntegers) -> None:
+    """
+    Test that the tight randomness interval is smaller than the default interval by a factor
+    n! / t, and that sharings with a tight interval reconstruct correctly.
+
+    :param shamir_scheme: Shamir sharing scheme over the integers to be used.
+    """
+    tight_scheme = ShamirSecretSharingIntegers(
+        max_int=shamir_scheme.max_int,
+        number_of_parties=shamir_scheme.number_of_parties,
+        polynomial_degree=shamir_scheme.polynomial_degree,
+        tight_interval=True,
+    )
+    assert tight_scheme != shamir_scheme
+    assert tight_scheme.randomness_interval == tight_randomness_interval(
+        shamir_scheme.kappa,
+        shamir_scheme.max_int,
+        shamir_scheme.n_fac,
+        shamir_scheme.polynomial_degree,
+    )
+    assert (
+        tight_scheme.randomness_interval * shamir_scheme.n_fac
+        == shamir_scheme.randomness_interval * shamir_scheme.polynomial_degree
+    )
+    assert tight_scheme.share_bound < shamir_scheme.share_bound
+    vector = IntegerSharesVector(tight_scheme, tight_scheme.share_secrets(secrets))
+    assert vector.reconstruct_secrets() == secrets
+    assert [
+        tight_scheme.share_secret(secret).reconstruct_secret() for secret in secrets
+    ] == secrets
+    if 2 * tight_scheme.polynomial_degree < tight_scheme.number_of_parties:
+        assert (vector * vector).reconstruct_secrets() == [
+            secret**2 for secret in secrets
+        ]
+    zero_degree = ShamirSecretSharingIntegers(
+        max_int=1000, number_of_parties=3, polynomial_degree=0, tight_interval=True
+    )
+    assert zero_degree.randomness_interval == 0
+    assert zero_degree.share_secret(17).shares == {i: 6 * 17 for i in range(1, 4)}
+
+
+def test_share_bounds(shamir_scheme: ShamirSecretSharingIntegers) -> None:
+    """
+    Test that the tracked bounds hold for fresh shares and after arithmetic, and the reported
+    bit lengths.
+
+    :param shamir_scheme: Shamir sharing scheme over the integers to be used.
+    """
+    sharing = shamir_scheme.share_secret(shamir_scheme.max_int)
+    other = shamir_scheme.share_secret(-shamir_scheme.max_int)
+    assert sharing.bound == shamir_scheme.share_bound
+    assert sharing.scaling_bit_length == shamir_scheme.n_fac.bit_length()
+    derived = [sharing, sharing + other, -3 * sharing, 5 * sharing + other]
+    if 2 * shamir_scheme.polynomial_degree < shamir_scheme.number_of_parties:
+        product = sharing * other
+        assert product.bound == shamir_scheme.share_bound**2
+        assert product.scaling_bit_length == (shamir_scheme.n_fac**2).bit_length()
+        derived.append(product)
+    for shares in derived:
+        assert max(map(abs, shares.shares.values())) <= shares.bound
+        assert shares.bit_length <= shares.worst_case_bit_length
+    assert (sharing + other).bound == 2 * shamir_scheme.share_bound
+    assert (-3 * sharing).bound == 3 * shamir_scheme.share_bound
+    untracked = IntegerShares(shamir_scheme, {1: -12, 2: 7}, 1, shamir_scheme.n_fac)
+    assert untracked.bound == 12
+    assert untracked.bit_length == untracked.worst_case_bit_length == 5
+
+
+def test_vector_bounds(shamir_scheme: ShamirSecretSharingIntegers) -> None:
+    """
+    Test the tracking of the bounds of vectors of integer shares.
+
+    :param shamir_scheme: Shamir sharing scheme over the integers to be used.
+    """
+    vector = IntegerSharesVector(shamir_scheme, shamir_scheme.share_secrets(secrets))
+    assert vector.bound == shamir_scheme.share_bound
+    assert vector.bit_length <= vector.worst_case_bit_length
+    assert vector[2].bound == vector.bound
+    assert IntegerSharesVector.from_shares(vector.to_shares()).bound == vector.bound
+    assert (vector + 2 * vector).bound == 3 * vector.bound
+    product = vector * vector
+    assert product.bound == vector.bound**2
+    assert product.scaling_bit_length == (shamir_scheme.n_fac**2).bit_length()
+    assert product.bit_length <= product.worst_case_bit_length
+    observed = IntegerSharesVector(
+        shamir_scheme, product.shares, product.degree, product.scaling
+    )
+    assert observed.bound == max(
+        abs(share) for column in product.shares.values() for share in column
+    )
+
+
+def test_serialization_of_tight_schemes() -> None:
+    """
+    Test that the randomness interval and the bounds are part of the serialization, and that
+    schemes with a tight interval cannot be encoded in the binary format.
+    """
+    scheme = ShamirSecretSharingIntegers(
+        max_int=1000, number_of_parties=7, polynomial_degree=3, tight_interval=True
+    )
+    assert "tight_interval" not in ShamirSecretSharingIntegers().serialize()
+    deserialized = ShamirSecretSharingIntegers.deserialize(scheme.serialize())
+    assert deserialized == scheme
+    assert deserialized.randomness_interval == scheme.randomness_interval
+    sharing = scheme.share_secret(5)
+    received = Serialization.deserialize(Serialization.serialize(sharing, False))
+    assert received == sharing
+    assert received.bound == sharing.bound
+    vector = IntegerSharesVector(scheme, scheme.share_secrets(secrets))
+    assert IntegerSharesVector.deserialize(vector.serialize()).bound == vector.bound
+    worker_scheme = _create_scheme(
+        ShamirSecretSharingIntegers, scheme.serialize(), SecretsRandomness, None
+    )
+    assert worker_scheme == scheme
+    with pytest.raises(ValueError):
+        encode(scheme)
+    with pytest.raises(ValueError):
+        encode(sharing)
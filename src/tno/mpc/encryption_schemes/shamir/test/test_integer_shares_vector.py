@@ -0,0 +1,150 @@
+"""
+Tests for the batched sharing over the integers and the vectors of integer shares.
+"""
+
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+
+import pytest
+
+from tno.mpc.communication import Serialization
+
+from tno.mpc.encryption_schemes.shamir import (
+    IntegerSharesVector,
+    ShamirSecretSharingIntegers,
+)
+from tno.mpc.encryption_schemes.shamir.test.test_shamir_secret_sharing_integers import (
+    fixture_shamir_scheme as fixture_shamir_scheme,  # pylint: disable=unused-import
+)
+from tno.mpc.encryption_schemes.shamir.utils import integral_lagrange_weights
+
+values_1 = list(range(-50, 50, 10))
+values_2 = list(range(5, 105, 10))
+
+
+def test_share_and_reconstruct_vector(
+    shamir_scheme: ShamirSecretSharingIntegers,
+) -> None:
+    """
+    Test the batched sharing and reconstructing of a vector of secrets, and the reuse of the
+    precomputed n! of the scheme.
+
+    :param shamir_scheme: Shamir sharing scheme over the integers to be used.
+    """
+    assert shamir_scheme.n_fac == math.factorial(shamir_scheme.number_of_parties)
+    shares = shamir_scheme.share_secrets(values_1)
+    assert list(shares) == list(range(1, shamir_scheme.number_of_parties + 1))
+    vector = IntegerSharesVector(shamir_scheme, shares)
+    assert len(vector) == len(values_1)
+    assert vector.scaling == shamir_scheme.n_fac
+    assert vector.degree == shamir_scheme.polynomial_degree
+    assert vector.reconstruct_secrets() == values_1
+    assert vector.reconstruct_secrets(modulus=97) == [value % 97 for value in values_1]
+    assert vector[3].n_fac is shamir_scheme.n_fac
+    assert vector[3].reconstruct_secret() == values_1[3]
+    assert vector[2:5].reconstruct_secrets() == values_1[2:5]
+    assert shamir_scheme.share_secrets([]) == {
+        i: [] for i in range(1, shamir_scheme.number_of_parties + 1)
+    }
+
+
+def test_conversion_to_and_from_shares(
+    shamir_scheme: ShamirSecretSharingIntegers,
+) -> None:
+    """
+    Test the conversion of a vector into a list of IntegerShares and back.
+
+    :param shamir_scheme: Shamir sharing scheme over the integers to be used.
+    """
+    vector = IntegerSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    sharings = vector.to_shares()
+    assert [sharing.reconstruct_secret() for sharing in sharings] == values_1
+    assert IntegerSharesVector.from_shares(sharings) == vector
+    product = sharings[0] * sharings[1]
+    with pytest.raises(ValueError):
+        IntegerSharesVector.from_shares([sharings[0], product])
+    with pytest.raises(ValueError):
+        IntegerSharesVector.from_shares([])
+
+
+def test_elementwise_arithmetic(shamir_scheme: ShamirSecretSharingIntegers) -> None:
+    """
+    Test the element-wise arithmetic of vectors and integers.
+
+    :param shamir_scheme: Shamir sharing scheme over the integers to be used.
+    """
+    vector_1 = IntegerSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    vector_2 = IntegerSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_2))
+    assert (vector_1 + vector_2).reconstruct_secrets() == [
+        a + b for a, b in zip(values_1, values_2)
+    ]
+    assert (3 * vector_1).reconstruct_secrets() == [3 * a for a in values_1]
+    if 2 * shamir_scheme.polynomial_degree < shamir_scheme.number_of_parties:
+        product = vector_1 * vector_2
+        assert product.degree == 2 * shamir_scheme.polynomial_degree
+        assert product.scaling == shamir_scheme.n_fac**2
+        assert product.reconstruct_secrets() == [
+            a * b for a, b in zip(values_1, values_2)
+        ]
+        with pytest.raises(ValueError):
+            _ = product + vector_1
+    with pytest.raises(ValueError):
+        _ = vector_1 + vector_2[1:]
+    other_scheme = ShamirSecretSharingIntegers(
+        max_int=1001, number_of_parties=shamir_scheme.number_of_parties
+    )
+    with pytest.raises(ValueError):
+        _ = vector_1 * IntegerSharesVector(
+            other_scheme, other_scheme.share_secrets(values_2)
+        )
+
+
+def test_serialization(shamir_scheme: ShamirSecretSharingIntegers) -> None:
+    """
+    Test the serialization of a vector of integer shares.
+
+    :param shamir_scheme: Shamir sharing scheme over the integers to be used.
+    """
+    vector = IntegerSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    assert IntegerSharesVector.deserialize(vector.serialize()) == vector
+    assert Serialization.deserialize(Serialization.serialize(vector, False)) == vector
+
+
+def test_reconstruct_many(shamir_scheme: ShamirSecretSharingIntegers) -> None:
+    """
+    Test the batched reconstruction over the integers and modulo a modulus, with the cached
+    integral Lagrange weights.
+
+    :param shamir_scheme: Shamir sharing scheme over the integers to be used.
+    """
+    shares = shamir_scheme.share_secrets(values_1)
+    party_ids = list(shares)[::-1]
+    assert shamir_scheme.reconstruct_many(shares) == values_1
+    assert shamir_scheme.reconstruct_many({i: shares[i] for i in party_ids}) == values_1
+    modulus = 2**127 - 1
+    assert shamir_scheme.reconstruct_many(shares, modulus=modulus) == [
+        value % modulus for value in values_1
+    ]
+    weights = shamir_scheme.lagrange_weights(
+        party_ids[: shamir_scheme.polynomial_degree + 1]
+    )
+    for i, weight in weights.items():
+        coefficient = Fraction(shamir_scheme.n_fac)
+        for j in weights:
+            if j != i:
+                coefficient *= Fraction(j, j - i)
+        assert coefficient == weight
+    hits = integral_lagrange_weights.cache_info().hits
+    vector = IntegerSharesVector(shamir_scheme, shares)
+    assert (vector * 2).reconstruct_secrets(modulus) == [
+        2 * value % modulus for value in values_1
+    ]
+    assert integral_lagrange_weights.cache_info().hits > hits
+    with pytest.raises(ValueError):
+        shamir_scheme.reconstruct_many(
+            {i: shares[i] for i in party_ids[: shamir_scheme.polynomial_degree]}
+        )
+    with pytest.raises(ValueError):
+        shamir_scheme.reconstruct_many(shares, scaling=7 * 11, modulus=7)
@@ -0,0 +1,172 @@
+"""
+Tests for the secret sharing schemes with roots of unity as evaluation points.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tno.mpc.encryption_schemes.shamir import (
+    NTTShamirSecretSharingScheme,
+    ShamirSecretSharingScheme,
+    ShamirShares,
+    ShamirSharesVector,
+)
+from tno.mpc.encryption_schemes.shamir.binary_serialization import encode
+from tno.mpc.encryption_schemes.shamir.ntt import (
+    consecutive_weights,
+    inverse_ntt,
+    ntt,
+    ntt_prime,
+    root_of_unity,
+    transform_size,
+)
+from tno.mpc.encryption_schemes.shamir.utils import lagrange_coefficients
+
+MODULUS = ntt_prime(64, 64)
+values = list(range(0, 200, 10))
+
+
+@pytest.fixture(
+    name="ntt_scheme",
+    params=[(1, 0), (5, 2), (16, 7), (16, 15), (50, 24), (64, 3), (64, 31), (64, 40)],
+)
+def fixture_ntt_scheme(request: pytest.FixtureRequest) -> NTTShamirSecretSharingScheme:
+    """
+    Create schemes with roots of unity as evaluation points, both with and without the use of
+    transforms for sharing.
+
+    :param request: Request for a scheme.
+    :return: scheme using one of the parameter sets.
+    """
+    return NTTShamirSecretSharingScheme(MODULUS, *request.param)
+
+
+@pytest.mark.parametrize("size", [1, 2, 8, 64])
+def test_ntt(size: int) -> None:
+    """
+    Test that the transform evaluates a polynomial in the powers of the root of unity, and that
+    the inverse transform recovers the coefficients.
+
+    :param size: Size of the transform.
+    """
+    root = root_of_unity(MODULUS, size)
+    coefficients = [(3 * j + 1) ** 5 % MODULUS for j in range(size)]
+    evaluations = ntt(coefficients, root, MODULUS)
+    assert evaluations == [
+        sum(c * pow(root, k * j, MODULUS) for j, c in enumerate(coefficients)) % MODULUS
+        for k in range(size)
+    ]
+    assert inverse_ntt(evaluations, root, MODULUS) == coefficients
+
+
+def test_roots_of_unity() -> None:
+    """
+    Test the selection of primes and primitive roots of unity.
+    """
+    assert [transform_size(n) for n in (1, 2, 3, 16, 17)] == [1, 2, 4, 16, 32]
+    prime = ntt_prime(32, 1024)
+    assert prime.bit_length() == 32 and prime % 1024 == 1
+    root = root_of_unity(prime, 1024)
+    assert pow(root, 1024, prime) == 1 and pow(root, 512, prime) != 1
+    largest_size = (prime - 1) & -(prime - 1)
+    with pytest.raises(ValueError):
+        root_of_unity(prime, 2 * largest_size)
+    with pytest.raises(ValueError):
+        root_of_unity(prime, 3)
+    with pytest.raises(ValueError):
+        NTTShamirSecretSharingScheme(2**61 - 1, 16, 5)
+
+
+def test_consecutive_weights() -> None:
+    """
+    Test that the Lagrange coefficients of consecutive points agree with the generic ones.
+    """
+    root = root_of_unity(MODULUS, 64)
+    for start, count in ((0, 1), (0, 7), (10, 20), (33, 31)):
+        points = tuple(pow(root, start + k, MODULUS) for k in range(count))
+        assert consecutive_weights(MODULUS, root, count) == lagrange_coefficients(
+            MODULUS, points
+        )
+
+
+def test_sharing(ntt_scheme: NTTShamirSecretSharingScheme) -> None:
+    """
+    Test sharing and reconstructing with consecutive and other reconstruction sets.
+
+    :param ntt_scheme: scheme to be used.
+    """
+    shares = ntt_scheme.share_secrets(values)
+    degree = ntt_scheme.polynomial_degree
+    party_ids = list(shares)
+    assert ntt_scheme.reconstruct_many(shares) == values
+    assert (
+        ntt_scheme.reconstruct_many({i: shares[i] for i in party_ids[::-1]}) == values
+    )
+    assert ntt_scheme.evaluation_point(1) == 1
+    assert len(set(ntt_scheme.points)) == ntt_scheme.number_of_parties
+    sharing = ntt_scheme.share_secret(values[3])
+    sharing.shares = {i: sharing.shares[i] for i in party_ids[-(degree + 1) :]}
+    assert sharing.reconstruct_secret() == values[3]
+
+
+def test_arithmetic(ntt_scheme: NTTShamirSecretSharingScheme) -> None:
+    """
+    Test that linear operations and multiplications keep the evaluation points.
+
+    :param ntt_scheme: scheme to be used.
+    """
+    sharing_1 = ntt_scheme.share_secret(values[1])
+    sharing_2 = ntt_scheme.share_secret(values[2])
+    assert (sharing_1 + 3 * sharing_2).reconstruct_secret() == values[1] + 3 * values[2]
+    vector = ShamirSharesVector(ntt_scheme, ntt_scheme.share_secrets(values))
+    if 2 * ntt_scheme.polynomial_degree < ntt_scheme.number_of_parties:
+        product = sharing_1 * sharing_2
+        assert isinstance(product.scheme, NTTShamirSecretSharingScheme)
+        assert product.degree == 2 * ntt_scheme.polynomial_degree
+        assert product.reconstruct_secret() == values[1] * values[2]
+        squares = vector * vector
+        assert isinstance(squares.scheme, NTTShamirSecretSharingScheme)
+        assert squares.reconstruct_secrets() == [value**2 for value in values]
+    assert vector.sum().reconstruct_secret() == sum(values)
+
+
+def test_interpolate() -> None:
+    """
+    Test the interpolation of the sharing polynomials with inverse transforms.
+    """
+    scheme = NTTShamirSecretSharingScheme(MODULUS, 16, 9)
+    assert not scheme.uses_transforms
+    assert NTTShamirSecretSharingScheme(MODULUS, 64, 31).uses_transforms
+    shares = scheme.share_secrets(values)
+    polynomials = scheme.interpolate(shares)
+    assert [polynomial[0] for polynomial in polynomials] == values
+    assert all(not any(polynomial[10:]) for polynomial in polynomials)
+    with pytest.raises(ValueError):
+        scheme.interpolate({i: shares[i] for i in range(1, 16)})
+
+
+def test_serialization(ntt_scheme: NTTShamirSecretSharingScheme) -> None:
+    """
+    Test that serialization keeps the evaluation points, and that formats assuming the default
+    evaluation points are refused.
+
+    :param ntt_scheme: scheme to be used.
+    """
+    serialized = ntt_scheme.serialize()
+    assert serialized["points"] == NTTShamirSecretSharingScheme.evaluation_points
+    assert ShamirSecretSharingScheme.deserialize(serialized) == ntt_scheme
+    assert NTTShamirSecretSharingScheme.deserialize(serialized) == ntt_scheme
+    sharing = ntt_scheme.share_secret(values[4])
+    deserialized = ShamirShares.deserialize(sharing.serialize())
+    assert deserialized.scheme == ntt_scheme and deserialized.shares == sharing.shares
+    assert isinstance(
+        ShamirSecretSharingScheme.deserialize(serialized), NTTShamirSecretSharingScheme
+    )
+    assert "points" not in ShamirSecretSharingScheme(MODULUS, 5, 2).serialize()
+    with pytest.raises(ValueError):
+        NTTShamirSecretSharingScheme.deserialize(
+            ShamirSecretSharingScheme(MODULUS, 5, 2).serialize()
+        )
+    with pytest.raises(ValueError):
+        encode(ShamirSharesVector(ntt_scheme, ntt_scheme.share_secrets(values)))
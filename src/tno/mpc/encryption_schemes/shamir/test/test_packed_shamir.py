@@ -0,0 +1,164 @@
+"""
+Tests for the packed Shamir Secret Sharing scheme functionality.
+"""
+
+from __future__ import annotations
+
+import pytest
+import sympy
+from _pytest.fixtures import SubRequest
+
+from tno.mpc.communication import Serialization
+
+from tno.mpc.encryption_schemes.shamir import (
+    PackedShamirSecretSharingScheme,
+    PackedShamirShares,
+)
+from tno.mpc.encryption_schemes.shamir.utils import lagrange_coefficients
+
+moduli = [sympy.prime(_) for _ in range(13000, 13005)]  # at least 10657
+polynomial_degrees = [1, 1, 2, 2, 3]
+pack_sizes = [1, 2, 2, 3, 4]
+n_parties = [5, 7, 9, 11, 15]
+packs = [[_ + offset for _ in range(0, 40, 10)] for offset in range(0, 5)]
+
+
+@pytest.fixture(
+    name="packed_scheme",
+    params=[
+        (moduli[_], n_parties[_], polynomial_degrees[_], pack_sizes[_])
+        for _ in range(5)
+    ],
+)
+def fixture_packed_scheme(request: SubRequest) -> PackedShamirSecretSharingScheme:
+    """
+    Create packed Shamir schemes using the parameters defined in the pre-amble. All parameter
+    sets allow for (at least) one multiplication.
+
+    :param request: Request for a scheme.
+    :return: PackedShamirSecretSharingScheme using one of the parameter sets.
+    """
+    return PackedShamirSecretSharingScheme(*request.param)
+
+
+@pytest.mark.parametrize("pack", packs)
+def test_share_and_reconstruct_secrets(
+    packed_scheme: PackedShamirSecretSharingScheme, pack: list[int]
+) -> None:
+    """
+    Test the sharing and reconstructing of a pack of secrets.
+
+    :param packed_scheme: Packed Shamir sharing scheme to be used.
+    :param pack: Secrets to be shared and reconstructed; only the first pack_size are used.
+    """
+    values = pack[: packed_scheme.pack_size]
+    sharing = packed_scheme.share_secret(values)
+    assert sharing.degree == packed_scheme.packed_degree
+    assert sharing.reconstruct_secrets() == values
+
+
+def test_reconstruct_from_subset(
+    packed_scheme: PackedShamirSecretSharingScheme,
+) -> None:
+    """
+    Test the reconstruction of a pack of secrets from the last degree+1 shares only.
+
+    :param packed_scheme: Packed Shamir sharing scheme to be used.
+    """
+    values = packs[0][: packed_scheme.pack_size]
+    sharing = packed_scheme.share_secret(values)
+    subset = list(sharing.shares.keys())[-(sharing.degree + 1) :]
+    reconstructor = PackedShamirShares(
+        packed_scheme, {i: sharing.shares[i] for i in subset}, sharing.degree
+    )
+    assert reconstructor.reconstruct_secrets() == values
+
+
+def test_padding(packed_scheme: PackedShamirSecretSharingScheme) -> None:
+    """
+    Test that incomplete packs are padded with zeros and overfull packs are rejected.
+
+    :param packed_scheme: Packed Shamir sharing scheme to be used.
+    """
+    sharing = packed_scheme.share_secret([42])
+    assert sharing.reconstruct_secrets() == [42] + [0] * (packed_scheme.pack_size - 1)
+    with pytest.raises(ValueError):
+        packed_scheme.share_secret(list(range(packed_scheme.pack_size + 1)))
+
+
+@pytest.mark.parametrize("pack_1, pack_2", [(packs[i], packs[-i]) for i in range(5)])
+def test_arithmetic(
+    packed_scheme: PackedShamirSecretSharingScheme,
+    pack_1: list[int],
+    pack_2: list[int],
+) -> None:
+    """
+    Test the element-wise addition, subtraction and multiplication of packed sharings and the
+    multiplication by a scalar.
+
+    :param packed_scheme: Packed Shamir sharing scheme to be used.
+    :param pack_1: First pack of secrets.
+    :param pack_2: Second pack of secrets.
+    """
+    modulus = packed_scheme.modulus
+    values_1 = pack_1[: packed_scheme.pack_size]
+    values_2 = pack_2[: packed_scheme.pack_size]
+    sharing_1 = packed_scheme.share_secret(values_1)
+    sharing_2 = packed_scheme.share_secret(values_2)
+
+    assert (sharing_1 + sharing_2).reconstruct_secrets() == [
+        (a + b) % modulus for a, b in zip(values_1, values_2)
+    ]
+    assert (sharing_1 - sharing_2).reconstruct_secrets() == [
+        (a - b) % modulus for a, b in zip(values_1, values_2)
+    ]
+    product = sharing_1 * sharing_2
+    assert product.degree == 2 * packed_scheme.packed_degree
+    assert product.reconstruct_secrets() == [
+        a * b % modulus for a, b in zip(values_1, values_2)
+    ]
+    assert (3 * sharing_1).reconstruct_secrets() == [3 * a for a in values_1]
+
+
+def test_incompatible_schemes() -> None:
+    """
+    Test that sharings of different schemes cannot be combined.
+    """
+    sharing_1 = PackedShamirSecretSharingScheme(moduli[0], 5, 1, 2).share_secret([1])
+    sharing_2 = PackedShamirSecretSharingScheme(moduli[0], 5, 1, 3).share_secret([1])
+    with pytest.raises(ValueError):
+        _ = sharing_1 + sharing_2
+
+
+def test_separate_lagrange_cache(
+    packed_scheme: PackedShamirSecretSharingScheme,
+) -> None:
+    """
+    Test that packed sharing and reconstruction do not fill the Lagrange coefficient cache of
+    the regular schemes.
+
+    :param packed_scheme: packed scheme to be used.
+    """
+    lagrange_coefficients.cache_clear()
+    sharing = packed_scheme.share_secret(packs[0][: packed_scheme.pack_size])
+    assert sharing.reconstruct_secrets() == packs[0][: packed_scheme.pack_size]
+    assert lagrange_coefficients.cache_info().currsize == 0
+
+
+def test_serialization(packed_scheme: PackedShamirSecretSharingScheme) -> None:
+    """
+    Test the round-trip serialization of packed schemes and shares.
+
+    :param packed_scheme: packed scheme to be used.
+    """
+    assert (
+        PackedShamirSecretSharingScheme.deserialize(packed_scheme.serialize())
+        == packed_scheme
+    )
+    sharing = packed_scheme.share_secret(packs[1][: packed_scheme.pack_size])
+    received = Serialization.deserialize(Serialization.serialize(sharing, False))
+    assert isinstance(received, PackedShamirShares)
+    assert received.scheme == packed_scheme
+    assert received.shares == sharing.shares
+    assert received.degree == sharing.degree
+    assert received.reconstruct_secrets() == packs[1][: packed_scheme.pack_size]
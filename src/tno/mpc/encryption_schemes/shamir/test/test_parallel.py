@@ -0,0 +1,130 @@
+"""
+Tests for the parallel sharing and reconstruction over worker processes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+import sympy
+
+from tno.mpc.encryption_schemes.shamir import (
+    ShamirSecretSharingIntegers,
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+)
+from tno.mpc.encryption_schemes.shamir.parallel import (
+    ParallelShamirEngine,
+    _share_chunk,
+)
+from tno.mpc.encryption_schemes.shamir.randomness import StreamRandomness
+
+CHUNK_SIZE = 10
+values = list(range(-20, 25))
+
+
+@pytest.fixture(
+    name="prime_engine",
+    scope="module",
+    params=[10657, sympy.nextprime(2**255)],
+    ids=["small", "large"],
+)
+def fixture_prime_engine(
+    request: pytest.FixtureRequest,
+) -> Iterator[ParallelShamirEngine]:
+    """
+    Parallel engine of a Shamir secret sharing scheme with two worker processes.
+
+    :param request: pytest request fixture with the modulus of the scheme
+    :return: the parallel engine
+    """
+    scheme = ShamirSecretSharingScheme(
+        request.param, 5, 2, randomness=StreamRandomness()
+    )
+    with ParallelShamirEngine(scheme, max_workers=2, chunk_size=CHUNK_SIZE) as engine:
+        yield engine
+
+
+@pytest.fixture(name="integer_engine", scope="module")
+def fixture_integer_engine() -> Iterator[ParallelShamirEngine]:
+    """
+    Parallel engine of a Shamir secret sharing scheme over the integers with two worker
+    processes.
+
+    :return: the parallel engine
+    """
+    scheme = ShamirSecretSharingIntegers(
+        kappa=40, max_int=2**64, number_of_parties=5, polynomial_degree=2
+    )
+    with ParallelShamirEngine(scheme, max_workers=2, chunk_size=CHUNK_SIZE) as engine:
+        yield engine
+
+
+def test_parallel_prime_field(prime_engine: ParallelShamirEngine) -> None:
+    """
+    Test that the parallel sharings are consistent and reconstruct to the secrets, both when
+    the batch is split over the workers and when it is processed in the calling process.
+
+    :param prime_engine: parallel engine to be tested
+    """
+    scheme = prime_engine.scheme
+    assert isinstance(scheme, ShamirSecretSharingScheme)
+    expected = [value % scheme.modulus for value in values]
+    shares = prime_engine.share_secrets(values)
+    assert list(shares) == [1, 2, 3, 4, 5]
+    assert scheme.reconstruct_many(shares) == expected
+    assert scheme.reconstruct_many({i: shares[i] for i in (3, 4, 5)}) == expected
+    assert prime_engine.reconstruct_many(shares) == expected
+    assert (
+        prime_engine.reconstruct_many(prime_engine.share_secrets(values[:CHUNK_SIZE]))
+        == expected[:CHUNK_SIZE]
+    )
+    # the workers sample independent coefficients
+    assert shares[1][:CHUNK_SIZE] != shares[1][CHUNK_SIZE : 2 * CHUNK_SIZE]
+
+    vector = ShamirSharesVector(scheme, shares)
+    product = vector * vector
+    assert prime_engine.reconstruct_many(product.shares, degree=4) == [
+        value * value % scheme.modulus for value in values
+    ]
+
+
+def test_parallel_integers(integer_engine: ParallelShamirEngine) -> None:
+    """
+    Test that the parallel sharings over the integers reconstruct to the secrets, with and
+    without a modulus.
+
+    :param integer_engine: parallel engine to be tested
+    """
+    shares = integer_engine.share_secrets(values)
+    assert integer_engine.reconstruct_many(shares) == values
+    assert integer_engine.reconstruct_many(shares, modulus=10657) == [
+        value % 10657 for value in values
+    ]
+    assert integer_engine.reconstruct_many({i: shares[i] for i in (5, 3, 1)}) == values
+
+
+def test_parallel_errors(prime_engine: ParallelShamirEngine) -> None:
+    """
+    Test the invalid uses of a parallel engine.
+
+    :param prime_engine: parallel engine to be tested
+    """
+    shares = prime_engine.share_secrets(values)
+    with pytest.raises(ValueError):
+        prime_engine.reconstruct_many({1: shares[1], 2: shares[2]})
+    with pytest.raises(ValueError):
+        prime_engine.reconstruct_many({1: shares[1], 2: shares[2], 3: shares[3][1:]})
+    with pytest.raises(ValueError):
+        prime_engine.reconstruct_many(shares, modulus=10657)
+    with pytest.raises(ValueError):
+        ParallelShamirEngine(prime_engine.scheme, chunk_size=0)
+
+
+def test_uninitialized_worker() -> None:
+    """
+    Test that the worker tasks fail with a clear error outside an initialized worker process.
+    """
+    with pytest.raises(RuntimeError):
+        _share_chunk(values, "unused", 0, len(values), 8, True)
@@ -0,0 +1,128 @@
+"""
+Tests for the seed-compressed and pseudo-random secret sharing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import combinations
+
+import pytest
+
+from tno.mpc.encryption_schemes.shamir import ShamirSecretSharingScheme
+from tno.mpc.encryption_schemes.shamir.prss import (
+    PseudoRandomSecretSharing,
+    distribute_shares_compressed,
+    expand_seed,
+    generate_prss_keys,
+    receive_shares_compressed,
+    seed_parties,
+    share_secrets_compressed,
+)
+from tno.mpc.encryption_schemes.shamir.test.local_pool import LocalPool
+from tno.mpc.encryption_schemes.shamir.test.test_shamir_secret_sharing import (
+    fixture_shamir_scheme as fixture_shamir_scheme,  # pylint: disable=unused-import
+)
+
+values = list(range(0, 100, 10))
+
+
+def assert_consistent(
+    scheme: ShamirSecretSharingScheme, shares: dict[int, list[int]]
+) -> list[int]:
+    """
+    Check that every reconstruction set of polynomial_degree + 1 parties reconstructs the same
+    values, i.e. that the shares lie on polynomials of the degree of the scheme.
+
+    :param scheme: scheme with which the values are shared
+    :param shares: columnar shares of all parties
+    :return: the reconstructed values
+    """
+    parties = range(1, scheme.number_of_parties + 1)
+    reconstructions = [
+        scheme.reconstruct_many({i: shares[i] for i in subset})
+        for subset in combinations(parties, scheme.polynomial_degree + 1)
+    ]
+    assert all(result == reconstructions[0] for result in reconstructions)
+    return reconstructions[0]
+
+
+def test_share_secrets_compressed(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test that the expanded seeds and explicit shares form a consistent sharing of the values.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    seeds, explicit_shares = share_secrets_compressed(shamir_scheme, values)
+    assert list(seeds) == list(seed_parties(shamir_scheme))
+    assert len(explicit_shares) == shamir_scheme.number_of_parties - len(seeds)
+    shares = {
+        **{
+            i: expand_seed(shamir_scheme, seed, len(values))
+            for i, seed in seeds.items()
+        },
+        **explicit_shares,
+    }
+    assert assert_consistent(shamir_scheme, shares) == values
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dealer_id", [1, 5])
+async def test_distribute_shares_compressed(dealer_id: int) -> None:
+    """
+    Test the distribution of a seed-compressed sharing by a dealer that is one of the parties,
+    both as a seed party and as a party that holds explicit shares.
+
+    :param dealer_id: id of the dealing party
+    """
+    scheme = ShamirSecretSharingScheme(10657, 5, 2)
+    pools = LocalPool.create_group(scheme.number_of_parties)
+    party_names = {j: f"local{j - 1}" for j in range(1, scheme.number_of_parties + 1)}
+    dealer_name = party_names.pop(dealer_id)
+    dealt = await asyncio.gather(
+        distribute_shares_compressed(pools[dealer_id - 1], party_names, scheme, values),
+        *(
+            receive_shares_compressed(pools[i - 1], dealer_name, i, scheme)
+            for i in party_names
+        ),
+    )
+    shares = dict(zip([dealer_id, *party_names], dealt))
+    assert assert_consistent(scheme, shares) == values  # type: ignore[arg-type]
+    # the seed parties only received a single small message
+    assert pools[dealer_id - 1].messages_sent == scheme.number_of_parties - 1
+
+
+def test_prss(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test that the PRSS of all parties results in consistent sharings of random values of
+    degree t, and of zero of degree 2t.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    if shamir_scheme.number_of_parties > 10:
+        pytest.skip("The number of PRSS keys is too large.")
+    keys = generate_prss_keys(shamir_scheme)
+    parties = {
+        i: PseudoRandomSecretSharing(shamir_scheme, i, party_keys)
+        for i, party_keys in keys.items()
+    }
+    random_values = assert_consistent(
+        shamir_scheme, {i: prss.random_shares(10) for i, prss in parties.items()}
+    )
+    assert len(set(random_values)) > 1
+    # every call results in fresh random values
+    assert (
+        assert_consistent(
+            shamir_scheme, {i: prss.random_shares(10) for i, prss in parties.items()}
+        )
+        != random_values
+    )
+
+    zero_shares = {i: prss.zero_shares(10) for i, prss in parties.items()}
+    double_scheme = ShamirSecretSharingScheme.get_instance(
+        shamir_scheme.modulus,
+        shamir_scheme.number_of_parties,
+        2 * shamir_scheme.polynomial_degree,
+    )
+    assert double_scheme.reconstruct_many(zero_shares) == [0] * 10
+    assert any(share != 0 for share in zero_shares[1])
@@ -0,0 +1,106 @@
+"""
+Tests for the sources of randomness of the sharing polynomials.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from tno.mpc.encryption_schemes.shamir import (
+    PackedShamirSecretSharingScheme,
+    ShamirSecretSharingIntegers,
+    ShamirSecretSharingScheme,
+)
+from tno.mpc.encryption_schemes.shamir.randomness import (
+    DEFAULT_RANDOMNESS,
+    RandomnessSource,
+    SecretsRandomness,
+    StreamRandomness,
+)
+
+bounds = [1, 2, 3, 255, 256, 257, 10657, 2**127 - 1, 2**521 - 1]
+values = list(range(0, 100, 10))
+
+
+@pytest.mark.parametrize("source", [SecretsRandomness(), StreamRandomness()])
+@pytest.mark.parametrize("bound", bounds)
+def test_sample_in_range(source: RandomnessSource, bound: int) -> None:
+    """
+    Test that the sampled integers lie in the requested range.
+
+    :param source: randomness source to be tested
+    :param bound: exclusive upper bound of the integers
+    """
+    samples = source.sample(bound, 1000)
+    assert len(samples) == 1000
+    assert all(0 <= sample < bound for sample in samples)
+    assert 0 <= source.randbelow(bound) < bound
+
+
+def test_stream_uniformity() -> None:
+    """
+    Test that rejection sampling hits every value of a range that is not a power of two about
+    equally often.
+    """
+    counts = Counter(StreamRandomness().sample(5, 50_000))
+    assert sorted(counts) == [0, 1, 2, 3, 4]
+    assert all(9000 < count < 11000 for count in counts.values())
+
+
+def test_stream_reproducible() -> None:
+    """
+    Test that the stream is determined by its seed, and that consecutive samples differ.
+    """
+    source_1 = StreamRandomness(b"seed")
+    source_2 = StreamRandomness(b"seed")
+    first = source_1.sample(10657, 100)
+    assert first == source_2.sample(10657, 100)
+    assert first != source_1.sample(10657, 100)
+    assert first != StreamRandomness(b"other seed").sample(10657, 100)
+
+
+def test_sample_matrix() -> None:
+    """
+    Test the shape of sampled matrices.
+    """
+    matrix = StreamRandomness().sample_matrix(10657, 3, 7)
+    assert len(matrix) == 3
+    assert all(len(row) == 7 for row in matrix)
+    assert StreamRandomness().sample_matrix(10657, 0, 7) == []
+
+
+def test_invalid_bound() -> None:
+    """
+    Test that an empty range is rejected.
+    """
+    with pytest.raises(ValueError):
+        StreamRandomness().sample(0, 1)
+
+
+def test_schemes_with_stream_randomness() -> None:
+    """
+    Test that all schemes share and reconstruct correctly with a stream randomness source, and
+    that secrets.randbelow is used by default.
+    """
+    assert ShamirSecretSharingScheme(10657, 5, 2).randomness is DEFAULT_RANDOMNESS
+
+    scheme = ShamirSecretSharingScheme(10657, 5, 2, StreamRandomness(b"seed"))
+    assert scheme.reconstruct_many(scheme.share_secrets(values)) == values
+    assert scheme.share_secret(42).reconstruct_secret() == 42
+    # the same seed results in the same shares
+    other_scheme = ShamirSecretSharingScheme(10657, 5, 2, StreamRandomness(b"seed"))
+    assert other_scheme.share_secrets(values) == ShamirSecretSharingScheme(
+        10657, 5, 2, StreamRandomness(b"seed")
+    ).share_secrets(values)
+
+    integer_scheme = ShamirSecretSharingIntegers(
+        number_of_parties=5, polynomial_degree=2, randomness=StreamRandomness()
+    )
+    assert integer_scheme.share_secret(-42).reconstruct_secret() == -42
+
+    packed_scheme = PackedShamirSecretSharingScheme(
+        10657, 7, 2, 3, randomness=StreamRandomness()
+    )
+    assert packed_scheme.share_secret([1, 2, 3]).reconstruct_secrets() == [1, 2, 3]
@@ -4,14 +4,22 @@ Tests for the regular Shamir Secret Sharing scheme functionality.
 
 from __future__ import annotations
 
+import ormsgpack
 import pytest
 import sympy
 from _pytest.fixtures import SubRequest
 
+from tno.mpc.communication import Serialization
+
 from tno.mpc.encryption_schemes.shamir import (
     ShamirSecretSharingIntegers,
     ShamirSecretSharingScheme,
+    ShamirShares,
 )
+from tno.mpc.encryption_schemes.shamir.backend import PYTHON_BACKEND
+from tno.mpc.encryption_schemes.shamir.randomness import SEED_SIZE, StreamRandomness
+from tno.mpc.encryption_schemes.shamir.shamir import INSTANCE_CACHE_SIZE
+from tno.mpc.encryption_schemes.shamir.utils import LAGRANGE_CACHE_SIZE
 
 moduli = [sympy.prime(_) for _ in range(13000, 13010)]  # at least 10657
 polynomial_degrees = [2, 2, 2, 3, 3, 3, 4, 4, 5, 5]
@@ -179,3 +187,181 @@ def test_rmul_integer_shares(
     ).share_secret(secret_2)
     mul = sharing_2 * sharing_1
     assert secret_1 * secret_2 == mul.reconstruct_secret()
+
+
+def test_share_secrets(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the batched sharing of many secrets and the reconstruction of every secret from the
+    columnar sharing.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    sharing = shamir_scheme.share_secrets(secrets)
+    assert set(sharing.keys()) == set(range(1, shamir_scheme.number_of_parties + 1))
+    assert all(len(column) == len(secrets) for column in sharing.values())
+    for index, secret in enumerate(secrets):
+        shares = ShamirShares(
+            shamir_scheme, {party: column[index] for party, column in sharing.items()}
+        )
+        assert shares.reconstruct_secret() == secret
+
+
+def test_lagrange_coefficients_cached(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test that the Lagrange coefficients of a reconstruction set are computed once and taken from
+    the cache for subsequent reconstructions with the same set, in whatever order.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    party_ids = list(range(shamir_scheme.polynomial_degree + 1, 0, -1))
+    coefficients = shamir_scheme.lagrange_coefficients(party_ids)
+    info_before = ShamirSecretSharingScheme.lagrange_cache_info()
+    assert shamir_scheme.lagrange_coefficients(reversed(party_ids)) == coefficients
+    info_after = ShamirSecretSharingScheme.lagrange_cache_info()
+    assert info_after.hits == info_before.hits + 1
+    assert info_after.misses == info_before.misses
+    assert info_after.maxsize == LAGRANGE_CACHE_SIZE
+    # the coefficients interpolate the constant polynomial 1
+    assert sum(coefficients.values()) % shamir_scheme.modulus == 1
+
+
+def test_reconstruct_many(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the batched reconstruction of many secrets from a columnar sharing, using only a minimal
+    reconstruction set.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    sharing = shamir_scheme.share_secrets(secrets)
+    reconstruction_set = list(sharing.keys())[-(shamir_scheme.polynomial_degree + 1) :]
+    assert (
+        shamir_scheme.reconstruct_many({i: sharing[i] for i in reconstruction_set})
+        == secrets
+    )
+
+
+def test_reconstruct_many_too_little_shares(
+    shamir_scheme: ShamirSecretSharingScheme,
+) -> None:
+    """
+    Test that the batched reconstruction fails when too little parties are present.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    sharing = shamir_scheme.share_secrets(secrets)
+    with pytest.raises(ValueError):
+        shamir_scheme.reconstruct_many(
+            {i: sharing[i] for i in range(1, shamir_scheme.polynomial_degree + 1)}
+        )
+
+
+def test_scheme_registry(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test that interned schemes are reused, also as the degree-raised scheme of products.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    parameters = (
+        shamir_scheme.modulus,
+        shamir_scheme.number_of_parties,
+        shamir_scheme.polynomial_degree,
+    )
+    scheme = ShamirSecretSharingScheme.get_instance(*parameters)
+    assert scheme is ShamirSecretSharingScheme.get_instance(*parameters)
+    assert scheme == shamir_scheme
+
+    sharing = shamir_scheme.share_secret(secrets[1])
+    product_1 = sharing * sharing
+    product_2 = sharing * sharing
+    assert product_1.scheme is product_2.scheme
+    assert product_1.scheme is ShamirSecretSharingScheme.get_instance(
+        shamir_scheme.modulus,
+        shamir_scheme.number_of_parties,
+        2 * shamir_scheme.polynomial_degree,
+    )
+
+
+def test_derived_scheme_randomness_and_backend() -> None:
+    """
+    Test that derived schemes keep the randomness source and backend of their scheme, and that
+    the registry of interned schemes is bounded.
+    """
+    randomness = StreamRandomness(bytes(SEED_SIZE))
+    scheme = ShamirSecretSharingScheme(
+        moduli[0], 5, 2, randomness=randomness, backend=PYTHON_BACKEND
+    )
+    sharing = scheme.share_secret(secrets[1])
+    product = sharing * sharing
+    assert product.scheme.randomness is randomness
+    assert product.scheme.backend is PYTHON_BACKEND
+    assert product.scheme is scheme.with_degree(4)
+    assert product.scheme is not ShamirSecretSharingScheme.get_instance(moduli[0], 5, 4)
+    assert product.reconstruct_secret() == secrets[1] ** 2 % moduli[0]
+    for degree in range(INSTANCE_CACHE_SIZE + 1):
+        ShamirSecretSharingScheme.get_instance(moduli[1], 500, degree)
+    # pylint: disable-next=protected-access
+    assert len(ShamirSecretSharingScheme._instances) == INSTANCE_CACHE_SIZE
+
+
+def test_scheme_serialize_and_deserialize(
+    shamir_scheme: ShamirSecretSharingScheme,
+) -> None:
+    """
+    Test that deserializing a scheme yields the interned scheme.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    scheme = ShamirSecretSharingScheme.deserialize(shamir_scheme.serialize())
+    assert scheme == shamir_scheme
+    assert scheme is ShamirSecretSharingScheme.get_instance(
+        shamir_scheme.modulus,
+        shamir_scheme.number_of_parties,
+        shamir_scheme.polynomial_degree,
+    )
+
+
+@pytest.mark.parametrize("secret", secrets)
+def test_shamir_shares_serialize_and_deserialize(
+    shamir_scheme: ShamirSecretSharingScheme, secret: int
+) -> None:
+    """
+    Test the serializing of Shamir shares, also of products with a derived scheme.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    :param secret: Secret to be shared and reconstructed.
+    """
+    sharing = shamir_scheme.share_secret(secret)
+    product = sharing * sharing
+    for shares in (sharing, product):
+        deserialized = ShamirShares.deserialize(shares.serialize())
+        assert deserialized.scheme == shares.scheme
+        assert deserialized.scheme is ShamirSecretSharingScheme.get_instance(
+            shamir_scheme.modulus, shamir_scheme.number_of_parties, shares.degree
+        )
+        assert deserialized.degree == shares.degree
+        assert deserialized.shares == shares.shares
+    assert (
+        ShamirShares.deserialize(product.serialize()).reconstruct_secret()
+        == secret**2 % shamir_scheme.modulus
+    )
+
+
+def test_shamir_shares_packing(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test that Shamir shares can be sent with the communication module.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    sharing = shamir_scheme.share_secret(secrets[1])
+    packed = Serialization.pack(
+        sharing,
+        "shares",
+        use_pickle=False,
+        # the shares are keyed by party id
+        option=ormsgpack.OPT_PASSTHROUGH_BIG_INT | ormsgpack.OPT_NON_STR_KEYS,
+    )
+    msg_id, unpacked = Serialization.unpack(packed, option=ormsgpack.OPT_NON_STR_KEYS)
+    assert msg_id == "shares"
+    assert isinstance(unpacked, ShamirShares)
+    assert unpacked.scheme == sharing.scheme
+    assert unpacked.shares == sharing.shares
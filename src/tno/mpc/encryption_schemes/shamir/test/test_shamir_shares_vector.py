@@ -0,0 +1,249 @@
+"""
+Tests for the vectors of Shamir secret shares.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tno.mpc.communication import Serialization
+
+from tno.mpc.encryption_schemes.shamir import (
+    IntegerSharesVector,
+    ShamirSecretSharingIntegers,
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+)
+from tno.mpc.encryption_schemes.shamir.test.test_shamir_secret_sharing import (
+    fixture_shamir_scheme as fixture_shamir_scheme,  # pylint: disable=unused-import
+)
+
+values_1 = list(range(0, 100, 10))
+values_2 = list(range(5, 105, 10))
+
+
+def test_share_and_reconstruct_vector(
+    shamir_scheme: ShamirSecretSharingScheme,
+) -> None:
+    """
+    Test the sharing and reconstructing of a vector of secrets.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    vector = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    assert len(vector) == len(values_1)
+    assert vector.reconstruct_secrets() == values_1
+
+
+def test_conversion_to_and_from_shares(
+    shamir_scheme: ShamirSecretSharingScheme,
+) -> None:
+    """
+    Test the conversion of a vector into a list of ShamirShares and back.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    vector = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    sharings = vector.to_shares()
+    assert [sharing.reconstruct_secret() for sharing in sharings] == values_1
+    assert ShamirSharesVector.from_shares(sharings) == vector
+    sharing = shamir_scheme.share_secret(42)
+    assert ShamirSharesVector.from_shares([sharing]).reconstruct_secrets() == [42]
+
+
+def test_elementwise_arithmetic(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the out-of-place element-wise arithmetic of vectors and integers.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    vector_1 = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    vector_2 = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_2))
+    modulus = shamir_scheme.modulus
+
+    assert (vector_1 + vector_2).reconstruct_secrets() == [
+        a + b for a, b in zip(values_1, values_2)
+    ]
+    assert (vector_1 - vector_2).reconstruct_secrets() == [
+        (a - b) % modulus for a, b in zip(values_1, values_2)
+    ]
+    product = vector_1 * vector_2
+    assert product.degree == 2 * shamir_scheme.polynomial_degree
+    assert product.reconstruct_secrets() == [a * b for a, b in zip(values_1, values_2)]
+    assert (vector_1 + 3).reconstruct_secrets() == [a + 3 for a in values_1]
+    assert (3 + vector_1).reconstruct_secrets() == [a + 3 for a in values_1]
+    assert (vector_1 - 3).reconstruct_secrets() == [(a - 3) % modulus for a in values_1]
+    assert (3 * vector_1).reconstruct_secrets() == [3 * a for a in values_1]
+    assert (vector_1 * 3).degree == shamir_scheme.polynomial_degree
+    # the operands are left untouched
+    assert vector_1.reconstruct_secrets() == values_1
+
+
+def test_inplace_arithmetic(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the in-place element-wise arithmetic of vectors and integers, and that it leaves the
+    shares that the vector was created from unchanged.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    source = shamir_scheme.share_secrets(values_1)
+    original = {i: list(column) for i, column in source.items()}
+    vector_1 = ShamirSharesVector(shamir_scheme, source)
+    vector_2 = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_2))
+
+    vector_1 += vector_2
+    vector_1 -= 5
+    assert source == original
+    assert vector_1.reconstruct_secrets() == [
+        a + b - 5 for a, b in zip(values_1, values_2)
+    ]
+    vector_1 *= 2
+    assert vector_1.reconstruct_secrets() == [
+        2 * (a + b - 5) for a, b in zip(values_1, values_2)
+    ]
+    vector_2 *= vector_2
+    assert vector_2.degree == 2 * shamir_scheme.polynomial_degree
+    assert vector_2.reconstruct_secrets() == [b * b for b in values_2]
+
+
+def test_lazy_reduction(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the linear combinations, sums and inner products of vectors, which reduce once per
+    element instead of once per operation.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    vector_1 = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    vector_2 = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_2))
+    modulus = shamir_scheme.modulus
+
+    combination = ShamirSharesVector.linear_combination(
+        [3, -1, modulus + 2], [vector_1, vector_2, vector_1]
+    )
+    assert combination == 3 * vector_1 - vector_2 + 2 * vector_1
+    assert combination.reconstruct_secrets() == [
+        (5 * a - b) % modulus for a, b in zip(values_1, values_2)
+    ]
+    assert vector_1.sum().reconstruct_secret() == sum(values_1) % modulus
+    inner_product = vector_1.dot(vector_2)
+    assert inner_product.degree == 2 * shamir_scheme.polynomial_degree
+    assert inner_product.shares == (vector_1 * vector_2).sum().shares
+    assert inner_product.reconstruct_secret() == (
+        sum(a * b for a, b in zip(values_1, values_2)) % modulus
+    )
+    with pytest.raises(ValueError):
+        ShamirSharesVector.linear_combination([1], [vector_1, vector_2])
+    with pytest.raises(ValueError):
+        ShamirSharesVector.linear_combination([], [])
+    with pytest.raises(ValueError):
+        vector_1.dot(vector_2[1:])
+
+
+def test_slicing_and_concatenation(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the selection of elements and slices and the concatenation of vectors.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    vector_1 = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    vector_2 = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_2))
+
+    assert vector_1[3].reconstruct_secret() == values_1[3]
+    assert vector_1[2:5].reconstruct_secrets() == values_1[2:5]
+    assert vector_1[::-1].reconstruct_secrets() == values_1[::-1]
+    assert (
+        ShamirSharesVector.concatenate([vector_1, vector_2[:2]]).reconstruct_secrets()
+        == values_1 + values_2[:2]
+    )
+
+
+def test_incompatible_vectors(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test that vectors of different schemes or lengths cannot be combined.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    vector = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    other_scheme = ShamirSecretSharingScheme(
+        shamir_scheme.modulus,
+        shamir_scheme.number_of_parties,
+        shamir_scheme.polynomial_degree + 1,
+    )
+    other_vector = ShamirSharesVector(
+        other_scheme, other_scheme.share_secrets(values_1)
+    )
+    with pytest.raises(ValueError):
+        _ = vector + other_vector
+    with pytest.raises(ValueError):
+        _ = vector + vector[1:]
+    with pytest.raises(ValueError):
+        ShamirSharesVector.concatenate([vector, other_vector])
+
+
+def test_vector_serialize_and_deserialize(
+    shamir_scheme: ShamirSecretSharingScheme,
+) -> None:
+    """
+    Test that a vector of shares can be sent with the communication module in its columnar
+    layout.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    vector = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    deserialized = ShamirSharesVector.deserialize(vector.serialize())
+    assert deserialized == vector
+    assert deserialized.scheme is ShamirSecretSharingScheme.get_instance(
+        shamir_scheme.modulus,
+        shamir_scheme.number_of_parties,
+        shamir_scheme.polynomial_degree,
+    )
+
+    _, unpacked = Serialization.unpack(
+        Serialization.pack(vector, "vector", use_pickle=False)
+    )
+    assert unpacked == vector
+    assert unpacked.reconstruct_secrets() == values_1
+
+
+def test_integer_shares_conversion(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the conversion of a vector of integer shares into Shamir shares, and the element-wise
+    multiplication of vectors of both kinds of shares.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    integer_scheme = ShamirSecretSharingIntegers(
+        max_int=1000,
+        number_of_parties=shamir_scheme.number_of_parties,
+        polynomial_degree=shamir_scheme.polynomial_degree,
+    )
+    integer_vector = IntegerSharesVector(
+        integer_scheme, integer_scheme.share_secrets(values_2)
+    )
+    vector = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    products = [a * b for a, b in zip(values_1, values_2)]
+    degree = 2 * shamir_scheme.polynomial_degree
+    with pytest.warns(UserWarning):
+        converted = ShamirSharesVector.from_integer_shares(
+            shamir_scheme, integer_vector
+        )
+    assert converted.scheme is shamir_scheme.with_degree(integer_vector.degree)
+    assert converted.reconstruct_secrets() == values_2
+    with pytest.warns(UserWarning):
+        for product in (integer_vector * vector, vector * integer_vector):
+            assert product.scheme is shamir_scheme.with_degree(degree)
+            assert product.reconstruct_secrets() == products
+    with pytest.warns(UserWarning):
+        vector *= integer_vector
+    assert vector.degree == degree
+    assert vector.reconstruct_secrets() == products
+    with pytest.raises(ValueError):
+        ShamirSharesVector.from_integer_shares(
+            shamir_scheme,
+            IntegerSharesVector(
+                ShamirSecretSharingIntegers(
+                    number_of_parties=shamir_scheme.number_of_parties + 1
+                ),
+                {},
+            ),
+        )
@@ -0,0 +1,127 @@
+"""
+Tests for the memory-mapped on-disk share stores.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO, Any
+
+import pytest
+
+from tno.mpc.encryption_schemes.shamir import (
+    ShamirSecretSharingScheme,
+    ShamirSharesVector,
+    utils,
+)
+from tno.mpc.encryption_schemes.shamir.share_store import (
+    ShareStore,
+    load_vector,
+    reconstruct_from_stores,
+)
+from tno.mpc.encryption_schemes.shamir.test.test_shamir_secret_sharing import (
+    fixture_shamir_scheme as fixture_shamir_scheme,  # pylint: disable=unused-import
+)
+
+values_1 = list(range(0, 100, 10))
+values_2 = list(range(5, 105, 10))
+
+
+def test_share_store(shamir_scheme: ShamirSecretSharingScheme, tmp_path: Path) -> None:
+    """
+    Test writing a vector of shares to per-party stores, appending to them, and reading and
+    reconstructing (slices of) the shares, also after reopening the stores.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    :param tmp_path: Temporary directory for the stores.
+    """
+    vector = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_1))
+    stores = ShareStore.write_all(tmp_path, vector)
+    assert set(stores) == set(range(1, shamir_scheme.number_of_parties + 1))
+    assert stores[2].party_id == 2
+    assert stores[1].scheme == shamir_scheme
+    assert len(stores[1]) == len(values_1)
+    assert stores[1][3] == vector.shares[1][3]
+    assert stores[1][-1] == vector.shares[1][-1]
+    assert stores[1][2:5] == vector.shares[1][2:5]
+    assert stores[1][::-2] == vector.shares[1][::-2]
+    with pytest.raises(IndexError):
+        _ = stores[1][len(values_1)]
+
+    extra = ShamirSharesVector(shamir_scheme, shamir_scheme.share_secrets(values_2))
+    for i, store in stores.items():
+        store.append(extra.shares[i])
+        store.close()
+
+    reopened = {i: ShareStore(tmp_path / f"shares_party_{i}.bin") for i in stores}
+    assert reconstruct_from_stores(reopened) == values_1 + values_2
+    assert reconstruct_from_stores(reopened, 8, 12) == (values_1 + values_2)[8:12]
+    assert load_vector(reopened, len(values_1)) == extra
+    for store in reopened.values():
+        store.close()
+
+
+def test_share_store_of_product(tmp_path: Path) -> None:
+    """
+    Test that the degree of stored shares is kept, and that stores are never overwritten.
+
+    :param tmp_path: Temporary directory for the stores.
+    """
+    scheme = ShamirSecretSharingScheme(10657, 5, 2)
+    vector = ShamirSharesVector(scheme, scheme.share_secrets(values_1))
+    product = vector * vector
+    stores = ShareStore.write_all(tmp_path, product)
+    assert stores[1].scheme.polynomial_degree == 4
+    assert reconstruct_from_stores(stores) == [a * a for a in values_1]
+    with pytest.raises(FileExistsError):
+        ShareStore.create(tmp_path / "shares_party_1.bin", scheme, 1)
+    for store in stores.values():
+        store.close()
+
+
+def test_incompatible_share_stores(tmp_path: Path) -> None:
+    """
+    Test that stores of different lengths cannot be combined, and that opening a file that is
+    not a share store fails.
+
+    :param tmp_path: Temporary directory for the stores.
+    """
+    scheme = ShamirSecretSharingScheme(10657, 3, 1)
+    with ShareStore.create(tmp_path / "1.bin", scheme, 1) as store_1, ShareStore.create(
+        tmp_path / "2.bin", scheme, 2
+    ) as store_2:
+        store_1.append([1, 2, 3])
+        store_2.append([1, 2])
+        with pytest.raises(ValueError):
+            load_vector({1: store_1, 2: store_2})
+        with pytest.raises(ValueError):
+            reconstruct_from_stores({})
+
+    path = tmp_path / "invalid.bin"
+    path.write_bytes(b"\x00" * 64)
+    with pytest.raises(ValueError):
+        ShareStore(path)
+
+
+def test_invalid_share_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that opening a file that is not a share store, such as a truncated or an empty file,
+    fails and closes the file.
+
+    :param tmp_path: Temporary directory for the store.
+    :param monkeypatch: pytest fixture to keep track of the opened files
+    """
+    opened: list[IO[Any]] = []
+
+    def tracking_open(*args: Any, **kwargs: Any) -> IO[Any]:
+        opened.append(open(*args, **kwargs))  # pylint: disable=consider-using-with
+        return opened[-1]
+
+    monkeypatch.setattr(utils, "open", tracking_open, raising=False)
+    for content in (b"\x00" * 64, b"SSSS", b""):
+        path = tmp_path / "invalid.bin"
+        path.write_bytes(content)
+        with pytest.raises(ValueError, match="not a valid share store"):
+            ShareStore(path)
+    assert len(opened) == 3
+    assert all(file.closed for file in opened)
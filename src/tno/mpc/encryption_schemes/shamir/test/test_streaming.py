@@ -0,0 +1,124 @@
+"""
+Tests for the streaming sharing and reconstruction.
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from tno.mpc.encryption_schemes.shamir import ShamirSecretSharingScheme
+from tno.mpc.encryption_schemes.shamir.parallel import ParallelShamirEngine
+from tno.mpc.encryption_schemes.shamir.streaming import (
+    read_share_stream,
+    reconstruct_stream,
+    reconstruct_stream_async,
+    share_stream,
+    share_stream_async,
+    write_share_stream,
+)
+from tno.mpc.encryption_schemes.shamir.test.test_shamir_secret_sharing import (
+    fixture_shamir_scheme as fixture_shamir_scheme,  # pylint: disable=unused-import
+)
+
+CHUNK_SIZE = 7
+NUMBER_OF_VALUES = 30
+
+
+def generate_values() -> Iterator[int]:
+    """
+    Generator of the values to be shared.
+
+    :return: iterator over the values
+    """
+    yield from range(NUMBER_OF_VALUES)
+
+
+async def generate_values_async(values: list[int]) -> AsyncIterator[int]:
+    """
+    Asynchronous generator of values.
+
+    :param values: values to be generated
+    :return: asynchronous iterator over the values
+    """
+    for value in values:
+        yield value
+
+
+def test_stream_to_files(shamir_scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Test the streaming of a sharing to a file per party, and the reconstruction from the
+    streams of a reconstruction set.
+
+    :param shamir_scheme: Shamir sharing scheme to be used.
+    """
+    modulus = shamir_scheme.modulus
+    chunks = share_stream(shamir_scheme, generate_values(), CHUNK_SIZE)
+    first_chunk = next(chunks)
+    assert len(first_chunk) == shamir_scheme.number_of_parties
+    assert all(len(shares) == CHUNK_SIZE for shares in first_chunk.values())
+
+    files = {i: io.BytesIO() for i in range(1, shamir_scheme.number_of_parties + 1)}
+    assert (
+        write_share_stream([first_chunk, *chunks], files, modulus) == NUMBER_OF_VALUES
+    )
+    for file in files.values():
+        file.seek(0)
+    reconstruction_set = list(files)[-shamir_scheme.polynomial_degree - 1 :]
+    streams = {i: read_share_stream(files[i], modulus, 5) for i in reconstruction_set}
+    reconstructed = list(reconstruct_stream(shamir_scheme, streams, CHUNK_SIZE))
+    assert [len(chunk) for chunk in reconstructed] == [7, 7, 7, 7, 2]
+    assert [value for chunk in reconstructed for value in chunk] == [
+        value % modulus for value in generate_values()
+    ]
+
+
+def test_stream_errors() -> None:
+    """
+    Test that streams of different lengths and incomplete shares are detected.
+    """
+    scheme = ShamirSecretSharingScheme(10657, 3, 1)
+    shares = scheme.share_secrets(list(range(10)))
+    with pytest.raises(ValueError):
+        list(reconstruct_stream(scheme, {1: shares[1], 2: shares[2][:-1]}, 4))
+    with pytest.raises(ValueError):
+        list(read_share_stream(io.BytesIO(b"\x01\x02\x03"), 10657))
+
+
+@pytest.mark.asyncio
+async def test_stream_async() -> None:
+    """
+    Test the sharing and reconstruction of asynchronous streams.
+    """
+    scheme = ShamirSecretSharingScheme(10657, 5, 2)
+    values = list(range(NUMBER_OF_VALUES))
+    shares: dict[int, list[int]] = {i: [] for i in range(1, 6)}
+    async for chunk in share_stream_async(
+        scheme, generate_values_async(values), CHUNK_SIZE
+    ):
+        for i, column in chunk.items():
+            shares[i].extend(column)
+    streams = {i: generate_values_async(shares[i]) for i in (2, 4, 5)}
+    reconstructed = [
+        value
+        async for chunk in reconstruct_stream_async(scheme, streams, CHUNK_SIZE)
+        for value in chunk
+    ]
+    assert reconstructed == values
+
+
+def test_stream_with_parallel_engine() -> None:
+    """
+    Test that a parallel engine can be used for streaming.
+    """
+    scheme = ShamirSecretSharingScheme(10657, 5, 2)
+    with ParallelShamirEngine(scheme, max_workers=1, chunk_size=CHUNK_SIZE) as engine:
+        chunks = list(share_stream(engine, generate_values(), 2 * CHUNK_SIZE))
+        streams = {
+            i: [share for chunk in chunks for share in chunk[i]] for i in (1, 2, 3)
+        }
+        assert [
+            value for chunk in reconstruct_stream(engine, streams) for value in chunk
+        ] == list(generate_values())
@@ -0,0 +1,219 @@
+"""
+Tests for the verifiable secret sharing with Feldman and Pedersen commitments.
+"""
+
+from __future__ import annotations
+
+import secrets
+
+import pytest
+import sympy
+
+from tno.mpc.communication import Serialization
+
+from tno.mpc.encryption_schemes.shamir import (
+    NTTShamirSecretSharingScheme,
+    ShamirSecretSharingScheme,
+)
+from tno.mpc.encryption_schemes.shamir.ntt import ntt_prime
+from tno.mpc.encryption_schemes.shamir.vss import (
+    CommitmentGroup,
+    PolynomialCommitments,
+    VerifiableSecretSharing,
+    multi_exponentiation,
+)
+
+GROUP_BITS = 512
+values = [0, 1, 42, 2**61 - 1, 7, 123456789]
+
+
+@pytest.fixture(
+    name="vss",
+    params=[
+        (2**127 - 1, 5, 2, False),
+        (2**127 - 1, 5, 2, True),
+        (sympy.prime(13000), 7, 3, False),
+        (sympy.prime(13000), 7, 3, True),
+        (2**61 - 1, 3, 0, True),
+    ],
+)
+def fixture_vss(request: pytest.FixtureRequest) -> VerifiableSecretSharing:
+    """
+    Create verifiable secret sharings with Feldman and Pedersen commitments.
+
+    :param request: Request for a verifiable secret sharing.
+    :return: verifiable secret sharing using one of the parameter sets.
+    """
+    modulus, number_of_parties, polynomial_degree, pedersen = request.param
+    scheme = ShamirSecretSharingScheme(modulus, number_of_parties, polynomial_degree)
+    return VerifiableSecretSharing(
+        scheme, pedersen, group=CommitmentGroup.for_order(modulus, GROUP_BITS)
+    )
+
+
+def test_multi_exponentiation() -> None:
+    """
+    Test the multi-exponentiation against separate exponentiations.
+    """
+    modulus = sympy.nextprime(2**300)
+    for count, bits in ((1, 1), (3, 100), (50, 40), (20, 300), (500, 60)):
+        bases = [secrets.randbelow(modulus) for _ in range(count)]
+        exponents = [secrets.randbits(bits) for _ in range(count)]
+        exponents[0] = 0
+        expected = 1
+        for base, exponent in zip(bases, exponents):
+            expected = expected * pow(base, exponent, modulus) % modulus
+        assert multi_exponentiation(bases, exponents, modulus) == expected
+    assert multi_exponentiation([], [], modulus) == 1
+
+
+def test_commitment_group() -> None:
+    """
+    Test the derivation of commitment groups.
+    """
+    order = 2**127 - 1
+    group = CommitmentGroup.for_order(order, GROUP_BITS)
+    assert group is CommitmentGroup.for_order(order, GROUP_BITS)
+    assert group.modulus.bit_length() == GROUP_BITS
+    assert sympy.isprime(group.modulus)
+    assert group.modulus == group.cofactor * order + 1
+    assert group.generator != group.blinding_generator
+    for generator in (group.generator, group.blinding_generator):
+        assert generator != 1
+        assert pow(generator, order, group.modulus) == 1
+
+
+def test_verifiable_sharing(vss: VerifiableSecretSharing) -> None:
+    """
+    Test that honest sharings, shares and secrets are accepted.
+
+    :param vss: verifiable secret sharing to be used.
+    """
+    shares, blinding_shares, commitments = vss.share_secrets(values)
+    assert vss.scheme.reconstruct_many(shares) == [
+        value % vss.scheme.modulus for value in values
+    ]
+    assert all(
+        commitment.degree == vss.scheme.polynomial_degree
+        and commitment.pedersen == vss.pedersen
+        for commitment in commitments
+    )
+    assert vss.verify_sharings(shares, commitments, blinding_shares)
+    for i, column in shares.items():
+        blinding_column = None if blinding_shares is None else blinding_shares[i]
+        assert vss.verify_shares(i, column, commitments, blinding_column)
+        assert vss.verify_share(
+            i,
+            column[2],
+            commitments[2],
+            None if blinding_column is None else blinding_column[2],
+        )
+    blindings = (
+        None
+        if blinding_shares is None
+        else vss.scheme.reconstruct_many(blinding_shares)
+    )
+    assert vss.verify_secrets(values, commitments, blindings)
+    sharing, blinding_sharing, commitment = vss.share_secret(5)
+    assert sharing.reconstruct_secret() == 5
+    assert vss.verify_share(
+        1,
+        sharing.shares[1],
+        commitment,
+        None if blinding_sharing is None else blinding_sharing.shares[1],
+    )
+
+
+def test_invalid_sharing(vss: VerifiableSecretSharing) -> None:
+    """
+    Test that inconsistent shares, commitments and secrets are rejected.
+
+    :param vss: verifiable secret sharing to be used.
+    """
+    shares, blinding_shares, commitments = vss.share_secrets(values)
+    blinding_column = None if blinding_shares is None else blinding_shares[2]
+    tampered = list(shares[2])
+    tampered[3] += 1
+    assert not vss.verify_shares(2, tampered, commitments, blinding_column)
+    assert not vss.verify_sharings(
+        {**shares, 2: tampered}, commitments, blinding_shares
+    )
+    assert [
+        vss.verify_share(
+            2,
+            share,
+            commitment,
+            None if blinding_column is None else blinding_column[j],
+        )
+        for j, (share, commitment) in enumerate(zip(tampered, commitments))
+    ] == [j != 3 for j in range(len(values))]
+    group = vss.group
+    forged = PolynomialCommitments(
+        group,
+        [
+            commitments[1].commitments[0],
+            *(
+                element * group.generator % group.modulus
+                for element in commitments[1].commitments[1:]
+            ),
+        ],
+        vss.pedersen,
+    )
+    if vss.scheme.polynomial_degree:
+        assert not vss.verify_shares(
+            2, shares[2], [commitments[0], forged, *commitments[2:]], blinding_column
+        )
+    blindings = (
+        None
+        if blinding_shares is None
+        else vss.scheme.reconstruct_many(blinding_shares)
+    )
+    opened = list(values)
+    opened[4] += 1
+    assert not vss.verify_secrets(opened, commitments, blindings)
+
+
+def test_verifiable_sharing_errors() -> None:
+    """
+    Test the errors of verifiable secret sharings.
+    """
+    modulus = 2**127 - 1
+    group = CommitmentGroup.for_order(modulus, GROUP_BITS)
+    scheme = ShamirSecretSharingScheme(modulus, 5, 2)
+    pedersen = VerifiableSecretSharing(scheme, pedersen=True, group=group)
+    feldman = VerifiableSecretSharing(scheme, group=group)
+    shares, blinding_shares, commitments = pedersen.share_secrets(values)
+    assert blinding_shares is not None
+    with pytest.raises(ValueError):
+        pedersen.verify_shares(1, shares[1], commitments)
+    with pytest.raises(ValueError):
+        feldman.verify_shares(1, shares[1], commitments, blinding_shares[1])
+    with pytest.raises(ValueError):
+        pedersen.verify_shares(1, shares[1][1:], commitments, blinding_shares[1][1:])
+    with pytest.raises(ValueError):
+        VerifiableSecretSharing(
+            scheme, group=CommitmentGroup.for_order(2**61 - 1, GROUP_BITS)
+        )
+    ntt_modulus = ntt_prime(64, 8)
+    with pytest.raises(ValueError):
+        VerifiableSecretSharing(
+            NTTShamirSecretSharingScheme(ntt_modulus, 5, 2),
+            group=CommitmentGroup.for_order(ntt_modulus, GROUP_BITS),
+        )
+
+
+def test_serialization() -> None:
+    """
+    Test the serialization of polynomial commitments.
+    """
+    modulus = 2**127 - 1
+    vss = VerifiableSecretSharing(
+        ShamirSecretSharingScheme(modulus, 5, 2),
+        pedersen=True,
+        group=CommitmentGroup.for_order(modulus, GROUP_BITS),
+    )
+    _, _, commitments = vss.share_secret(3)
+    assert PolynomialCommitments.deserialize(commitments.serialize()) == commitments
+    received = Serialization.deserialize(Serialization.serialize(commitments, False))
+    assert received == commitments
+    assert received.group is vss.group
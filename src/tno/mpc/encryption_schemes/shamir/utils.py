@@ -4,7 +4,27 @@ Useful functions for the shamir module.
 
 from __future__ import annotations
 
-from functools import reduce
+import mmap
+import os
+import struct
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from functools import lru_cache, reduce
+from pathlib import Path
+from typing import ClassVar, TypeVar, Union
+
+from tno.mpc.encryption_schemes.utils import is_prime, mod_inv
+
+LAGRANGE_CACHE_SIZE = 1024
+PRIMALITY_CACHE_SIZE = 128
+INVERSE_CACHE_SIZE = 128
+
+# Type of the locations of on-disk stores
+StrPath = Union[str, "os.PathLike[str]"]
+# magic, version, limb size, number of parties, polynomial degree, party id, counter
+STORE_HEADER = struct.Struct("<4sHHIIIQ")
+
+StoreT = TypeVar("StoreT", bound="MemoryMappedStore")
 
 
 def mult_list(list_: list[int], modulus: int = 0) -> int:
@@ -18,3 +38,282 @@ def mult_list(list_: list[int], modulus: int = 0) -> int:
     if modulus:
         return reduce(lambda a, b: (a * b) % modulus, list_, 1)
     return reduce(lambda a, b: a * b, list_, 1)
+
+
+def compute_lagrange_coefficients(
+    modulus: int, party_ids: tuple[int, ...], evaluation_point: int = 0
+) -> tuple[int, ...]:
+    """
+    Utility function to compute the Lagrange coefficients for interpolation of the value in
+    evaluation_point of a polynomial from its evaluations in the given points, modulo a prime
+    modulus, without caching.
+
+    :param modulus: prime modulus of the field in which to interpolate
+    :param party_ids: evaluation points of the polynomial, i.e. the ids of the parties
+    :param evaluation_point: point in which the polynomial is interpolated, zero by default
+    :return: Lagrange coefficient of every party id, in the order of party_ids
+    """
+    return tuple(
+        mult_list([evaluation_point - j for j in party_ids if i != j], modulus)
+        * int(
+            mod_inv(mult_list([i - j for j in party_ids if i != j], modulus), modulus)
+        )
+        % modulus
+        for i in party_ids
+    )
+
+
+@lru_cache(maxsize=LAGRANGE_CACHE_SIZE)
+def lagrange_coefficients(
+    modulus: int, party_ids: tuple[int, ...], evaluation_point: int = 0
+) -> tuple[int, ...]:
+    """
+    Utility function to compute the Lagrange coefficients for interpolation of the value in
+    evaluation_point of a polynomial from its evaluations in the given points, modulo a prime
+    modulus, see compute_lagrange_coefficients.
+
+    The results are kept in a bounded LRU cache keyed by the modulus and the tuple of party ids
+    (and the evaluation point), as the coefficients only depend on the reconstruction set. Callers
+    should pass the party ids in a canonical (sorted) order to maximise the number of cache hits.
+
+    :param modulus: prime modulus of the field in which to interpolate
+    :param party_ids: evaluation points of the polynomial, i.e. the ids of the parties
+    :param evaluation_point: point in which the polynomial is interpolated, zero by default
+    :return: Lagrange coefficient of every party id, in the order of party_ids
+    """
+    return compute_lagrange_coefficients(modulus, party_ids, evaluation_point)
+
+
+@lru_cache(maxsize=LAGRANGE_CACHE_SIZE)
+def integral_lagrange_weights(
+    n_fac: int, party_ids: tuple[int, ...]
+) -> tuple[int, ...]:
+    """
+    Utility function to compute the integral Lagrange weights n! * lambda_i for the interpolation
+    in zero of a polynomial over the integers from its evaluations in the given points. For
+    party ids in 1, ..., n the weights are integers, as the denominator of every Lagrange
+    coefficient divides n!.
+
+    The results are kept in a bounded LRU cache keyed by n! and the tuple of party ids, which
+    should be passed in a canonical (sorted) order to maximise the number of cache hits.
+
+    :param n_fac: factorial of the number of parties
+    :param party_ids: evaluation points of the polynomial, i.e. the ids of the parties
+    :return: integral Lagrange weight of every party id, in the order of party_ids
+    """
+    return tuple(
+        mult_list([j for j in party_ids if i != j])
+        * n_fac
+        // mult_list([j - i for j in party_ids if i != j])
+        for i in party_ids
+    )
+
+
+@lru_cache(maxsize=INVERSE_CACHE_SIZE)
+def mod_inv_cached(value: int, modulus: int) -> int:
+    """
+    Utility function to compute a modular inverse, memoizing the result such that, e.g., the
+    inverse of the scaling of integer sharings is computed once per scaling and modulus.
+
+    :param value: value to be inverted
+    :param modulus: modulus of the inversion
+    :return: the inverse of value modulo modulus
+    """
+    return int(mod_inv(value, modulus))
+
+
+@lru_cache(maxsize=PRIMALITY_CACHE_SIZE)
+def is_prime_cached(modulus: int) -> bool:
+    """
+    Utility function to test the primality of a modulus, memoizing the result such that schemes
+    with the same modulus do not repeat the (expensive) primality test.
+
+    :param modulus: number to be tested for primality
+    :return: whether the modulus is (probably) prime
+    """
+    return bool(is_prime(modulus))
+
+
+def limb_size(modulus: int) -> int:
+    """
+    Utility function to determine the number of bytes needed to store any residue modulo the
+    given modulus in a fixed-width encoding.
+
+    :param modulus: modulus of the values to be stored
+    :return: number of bytes per value
+    """
+    return max(1, ((modulus - 1).bit_length() + 7) // 8)
+
+
+def encode_fixed_width(
+    values: Iterable[int], width: int, signed: bool = False
+) -> bytes:
+    """
+    Utility function to encode integers as consecutive fixed-width little-endian byte strings.
+
+    :param values: integers to be encoded, each fitting in width bytes
+    :param width: number of bytes per integer
+    :param signed: whether to use a two's complement encoding, required for negative values
+    :return: concatenation of the encodings of all values
+    """
+    return b"".join(value.to_bytes(width, "little", signed=signed) for value in values)
+
+
+def decode_fixed_width(
+    buffer: bytes | bytearray | memoryview, width: int, signed: bool = False
+) -> list[int]:
+    """
+    Utility function to decode consecutive fixed-width little-endian integers, without copying
+    the underlying buffer.
+
+    :param buffer: buffer containing the encoded integers; its length should be a multiple of
+        width
+    :param width: number of bytes per integer
+    :param signed: whether the integers have a two's complement encoding
+    :return: decoded integers
+    """
+    view = memoryview(buffer)
+    return [
+        int.from_bytes(view[offset : offset + width], "little", signed=signed)
+        for offset in range(0, len(view), width)
+    ]
+
+
+class MemoryMappedStore(ABC):
+    """
+    Base class of the memory-mapped on-disk stores of a single party.
+
+    The file of a store starts with a header (STORE_HEADER) containing a magic, a version, the
+    limb size, the scheme parameters, the id of the party and a counter, followed by the modulus
+    in a single limb and the fixed-width records of the store.
+    """
+
+    MAGIC: ClassVar[bytes]
+    VERSION: ClassVar[int] = 1
+    HEADER: ClassVar[struct.Struct] = STORE_HEADER
+    # Name of the kind of store, used in error messages
+    DESCRIPTION: ClassVar[str]
+
+    def __init__(self, path: StrPath) -> None:
+        """
+        Open an existing store. The file is closed again if it is not a valid store.
+
+        :param path: location of the file of the store
+        :raise ValueError: In case the file is not a valid store of this kind.
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "r+b")  # pylint: disable=consider-using-with
+        try:
+            # Files that are too short (including empty files, which cannot be mapped) are no
+            # valid stores
+            if os.fstat(self._file.fileno()).st_size < self.HEADER.size:
+                raise ValueError(f"{self.path} is not a valid {self.DESCRIPTION}.")
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+        except Exception:
+            self._file.close()
+            raise
+        try:
+            (
+                magic,
+                version,
+                width,
+                number_of_parties,
+                polynomial_degree,
+                party_id,
+                _,
+            ) = self.HEADER.unpack_from(self._mmap)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(f"{self.path} is not a valid {self.DESCRIPTION}.")
+            self.limb_size: int = width
+            self.party_id: int = party_id
+            self._data_offset: int = self.HEADER.size + self.limb_size
+            modulus = int.from_bytes(
+                self._mmap[self.HEADER.size : self._data_offset], "little"
+            )
+            self._set_up(modulus, number_of_parties, polynomial_degree)
+        except Exception:
+            self._mmap.close()
+            self._file.close()
+            raise
+
+    @abstractmethod
+    def _set_up(
+        self, modulus: int, number_of_parties: int, polynomial_degree: int
+    ) -> None:
+        """
+        Set up the store from the scheme parameters in its header.
+
+        :param modulus: modulus of the scheme of the store
+        :param number_of_parties: number of parties of the scheme of the store
+        :param polynomial_degree: polynomial degree of the scheme of the store
+        """
+
+    @classmethod
+    def _encode_header(
+        cls,
+        modulus: int,
+        number_of_parties: int,
+        polynomial_degree: int,
+        party_id: int,
+    ) -> bytes:
+        """
+        Encode the header and the modulus of a new store, with a counter of zero.
+
+        :param modulus: modulus of the scheme of the store
+        :param number_of_parties: number of parties of the scheme of the store
+        :param polynomial_degree: polynomial degree of the scheme of the store
+        :param party_id: id of the party whose store is created
+        :return: encoding of the start of the file of the store
+        """
+        width = limb_size(modulus)
+        return cls.HEADER.pack(
+            cls.MAGIC,
+            cls.VERSION,
+            width,
+            number_of_parties,
+            polynomial_degree,
+            party_id,
+            0,
+        ) + modulus.to_bytes(width, "little")
+
+    @property
+    def _counter(self) -> int:
+        """
+        Counter in the header of the store.
+
+        :return: value of the counter
+        """
+        return int(self.HEADER.unpack_from(self._mmap)[-1])
+
+    @_counter.setter
+    def _counter(self, value: int) -> None:
+        """
+        Update the counter in the header of the store.
+
+        :param value: new value of the counter
+        """
+        struct.pack_into("<Q", self._mmap, self.HEADER.size - 8, value)
+
+    def close(self) -> None:
+        """
+        Flush the store to disk and close it.
+        """
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self: StoreT) -> StoreT:
+        """
+        Use the store as a context manager that closes it on exit.
+
+        :return: this store
+        """
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        """
+        Close the store.
+
+        :param _args: exception information, ignored
+        """
+        self.close()
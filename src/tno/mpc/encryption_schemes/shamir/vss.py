@@ -0,0 +1,719 @@
+r"""
+Verifiable secret sharing with Feldman and Pedersen commitments.
+
+The dealer commits to every coefficient $a_k$ of a sharing polynomial $f$ in a group of prime
+order $q$, the modulus of the Shamir scheme: Feldman commitments are $C_k = g^{a_k}$, Pedersen
+commitments $C_k = g^{a_k} h^{b_k}$ for the coefficients $b_k$ of a random blinding polynomial
+$b$. Party $i$ then checks its share $s_i = f(i)$ (and blinding share $r_i = b(i)$) by verifying
+that $g^{s_i} h^{r_i} = \prod_k C_k^{i^k}$, and an opened secret is checked in the same way in the
+point 0. Feldman commitments reveal $g^s$ and therefore only hide the secret computationally;
+Pedersen commitments hide it perfectly.
+
+The group is the subgroup of order $q$ of $\mathbb{Z}_p^*$ for the smallest prime
+$p = k \cdot q + 1$ of at least DEFAULT_GROUP_BITS bits. Both generators are derived from $p$
+with a hash function, such that nobody knows the discrete logarithm of $h$ with respect to $g$.
+
+Many checks are verified at once (Bellare, Garay and Rabin): every check is raised to a random
+exponent $\rho$ of kappa bits and all checks are multiplied together, which yields a single
+product of powers that is evaluated with one multi-exponentiation. If any check fails, the
+combination fails except with probability $2^{-\kappa}$. This also holds for commitments of a
+dishonest dealer outside of the subgroup of order $q$: the combination then holds in particular
+for the projections onto the subgroup, for which the argument applies. As the exponents of the
+commitments are small, this is considerably cheaper than checking every share separately.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import secrets
+from collections.abc import Mapping, Sequence
+from typing import Any, ClassVar, TypedDict
+
+from tno.mpc.communication import SupportsSerialization
+from tno.mpc.encryption_schemes.utils import is_prime
+
+from tno.mpc.encryption_schemes.shamir.backend import PythonBackend, select_backend
+from tno.mpc.encryption_schemes.shamir.shamir import (
+    DEFAULT_EVALUATION_POINTS,
+    ShamirSecretSharingScheme,
+    ShamirShares,
+)
+
+# Check to see if the communication module is available
+try:
+    from tno.mpc.communication import RepetitionError, Serialization
+
+    COMMUNICATION_INSTALLED = True
+except ModuleNotFoundError:
+    COMMUNICATION_INSTALLED = False
+
+DEFAULT_GROUP_BITS = 2048
+DEFAULT_KAPPA = 40
+# The window sizes of the multi-exponentiation methods are chosen from 1 up to these bit lengths
+MAX_WINDOW = 8
+MAX_BUCKET_WINDOW = 16
+
+
+def _straus(
+    pairs: Sequence[tuple[int, int]], bits: int, window: int, modulus: int
+) -> int:
+    """
+    Straus' interleaved window method: all exponentiations share a single sequence of
+    squarings, and every base contributes a table of its first powers and one multiplication
+    per (non-zero) window of its exponent.
+
+    :param pairs: bases and their positive exponents
+    :param bits: bit length of the longest exponent
+    :param window: window size in bits
+    :param modulus: modulus of the result
+    :return: the product of the powers modulo the modulus
+    """
+    mask = (1 << window) - 1
+    # Short exponents only need the powers up to the exponent itself
+    tables = []
+    for base, exponent in pairs:
+        table = [1, base]
+        for _ in range(min(mask, exponent) - 1):
+            table.append(table[-1] * base % modulus)
+        tables.append((table, exponent))
+    result = 1
+    for position in range((bits - 1) // window * window, -1, -window):
+        if result != 1:
+            for _ in range(window):
+                result = result * result % modulus
+        for table, exponent in tables:
+            digit = exponent >> position & mask
+            if digit:
+                result = result * table[digit] % modulus
+    return result
+
+
+def _pippenger(
+    pairs: Sequence[tuple[int, int]], bits: int, window: int, modulus: int
+) -> int:
+    """
+    Pippenger's bucket method: for every window, the bases are multiplied into a bucket per
+    digit, after which the buckets are combined with two running products. Every base costs a
+    single multiplication per window, independent of the window size, which pays off for many
+    bases.
+
+    :param pairs: bases and their positive exponents
+    :param bits: bit length of the longest exponent
+    :param window: window size in bits
+    :param modulus: modulus of the result
+    :return: the product of the powers modulo the modulus
+    """
+    mask = (1 << window) - 1
+    result = 1
+    for position in range((bits - 1) // window * window, -1, -window):
+        if result != 1:
+            for _ in range(window):
+                result = result * result % modulus
+        buckets: list[int | None] = [None] * (mask + 1)
+        for base, exponent in pairs:
+            digit = exponent >> position & mask
+            if digit:
+                bucket = buckets[digit]
+                buckets[digit] = base if bucket is None else bucket * base % modulus
+        # prod_d bucket_d^d as the product of the running products of the buckets d, ..., mask
+        running = 1
+        window_product = 1
+        for bucket in reversed(buckets[1:]):
+            if bucket is not None:
+                running = running * bucket % modulus
+            if running != 1:
+                window_product = window_product * running % modulus
+        result = result * window_product % modulus
+    return result
+
+
+def multi_exponentiation(
+    bases: Sequence[int],
+    exponents: Sequence[int],
+    modulus: int,
+    backend: PythonBackend | None = None,
+) -> int:
+    """
+    Compute the product of base ** exponent over all bases and (non-negative) exponents modulo
+    the modulus.
+
+    All exponentiations share a single sequence of squarings. Depending on the number of bases
+    and the length of the exponents, either Straus' interleaved window method or Pippenger's
+    bucket method is used, with the window size that minimizes the estimated number of
+    multiplications.
+
+    :param bases: bases of the exponentiations
+    :param exponents: non-negative exponents, one per base
+    :param modulus: modulus of the result
+    :param backend: backend for the modular arithmetic, selected based on the size of the
+        modulus if None
+    :return: the product of the powers modulo the modulus
+    """
+    backend = select_backend(modulus) if backend is None else backend
+    pairs = [
+        (backend.convert(base), exponent)
+        for base, exponent in zip(bases, exponents)
+        if exponent
+    ]
+    bits = max((exponent.bit_length() for _, exponent in pairs), default=0)
+    if not bits:
+        return 1 % modulus
+    count = len(pairs)
+    total_bits = sum(exponent.bit_length() for _, exponent in pairs)
+    straus_costs = {
+        window: count * (1 << window) + total_bits // window
+        for window in range(1, MAX_WINDOW + 1)
+    }
+    pippenger_costs = {
+        window: -(-bits // window) * (count + (2 << window))
+        for window in range(1, MAX_BUCKET_WINDOW + 1)
+    }
+    straus_window = min(straus_costs, key=straus_costs.__getitem__)
+    pippenger_window = min(pippenger_costs, key=pippenger_costs.__getitem__)
+    modulus_ = backend.convert(modulus)
+    if pippenger_costs[pippenger_window] < straus_costs[straus_window]:
+        return int(_pippenger(pairs, bits, pippenger_window, modulus_))
+    return int(_straus(pairs, bits, straus_window, modulus_))
+
+
+def _check_evaluation_points(scheme: ShamirSecretSharingScheme) -> None:
+    """
+    Check that a scheme uses the default evaluation points, i.e. that party i evaluates in i.
+
+    :param scheme: scheme to be checked
+    :raise ValueError: In case the scheme uses other evaluation points.
+    """
+    if scheme.evaluation_points != DEFAULT_EVALUATION_POINTS:
+        raise ValueError(
+            "Only schemes with the default evaluation points are supported."
+        )
+
+
+class CommitmentGroup:
+    """
+    Subgroup of prime order of the multiplicative group modulo a prime, with two independent
+    generators for Feldman and Pedersen commitments.
+    """
+
+    # Registry of interned groups, see for_order
+    _instances: ClassVar[dict[tuple[int, int], CommitmentGroup]] = {}
+
+    def __init__(self, order: int, min_bit_length: int = DEFAULT_GROUP_BITS) -> None:
+        """
+        Derive the commitment group of the given prime order, i.e. the subgroup of order q of
+        the multiplicative group modulo the smallest prime p = k * q + 1 of at least
+        min_bit_length bits (with k not divisible by q).
+
+        :param order: prime order q of the group, e.g. the modulus of a Shamir scheme
+        :param min_bit_length: minimal bit length of the prime modulus p
+        """
+        self.order = order
+        self.min_bit_length = min_bit_length
+        cofactor = max(-(-(1 << (min_bit_length - 1)) // order), 2)
+        cofactor += cofactor % 2
+        while cofactor % order == 0 or not is_prime(cofactor * order + 1):
+            cofactor += 2
+        self.cofactor = cofactor
+        self.modulus = cofactor * order + 1
+        self.backend = select_backend(self.modulus)
+        self.generator = self._hash_to_group(b"generator")
+        self.blinding_generator = self._hash_to_group(b"blinding generator")
+
+    @classmethod
+    def for_order(
+        cls, order: int, min_bit_length: int = DEFAULT_GROUP_BITS
+    ) -> CommitmentGroup:
+        """
+        Get the interned commitment group of the given order, deriving it on first use.
+
+        :param order: prime order q of the group, e.g. the modulus of a Shamir scheme
+        :param min_bit_length: minimal bit length of the prime modulus p
+        :return: the interned commitment group
+        """
+        key = (order, min_bit_length)
+        if key not in cls._instances:
+            cls._instances[key] = cls(order, min_bit_length)
+        return cls._instances[key]
+
+    def _hash_to_group(self, tag: bytes) -> int:
+        """
+        Derive an element of order q from a tag, by hashing the tag together with the modulus
+        and raising the result to the cofactor.
+
+        :param tag: domain separation tag of the element
+        :return: element of order q
+        """
+        size = (self.modulus.bit_length() + 7) // 8 + 16
+        counter = 0
+        while True:
+            digest = hashlib.shake_256(
+                tag
+                + counter.to_bytes(4, "little")
+                + self.modulus.to_bytes(size, "little")
+            ).digest(size)
+            element = self.backend.powmod(
+                int.from_bytes(digest, "little") % self.modulus,
+                self.cofactor,
+                self.modulus,
+            )
+            if element > 1:
+                return element
+            counter += 1
+
+    def commit(self, value: int, blinding: int | None = None) -> int:
+        """
+        Commit to a value, with a Feldman commitment g^value or, if a blinding value is given, a
+        Pedersen commitment g^value * h^blinding.
+
+        :param value: value modulo q to commit to
+        :param blinding: blinding value modulo q of a Pedersen commitment, None for a Feldman
+            commitment
+        :return: the commitment
+        """
+        commitment = self.backend.powmod(self.generator, value, self.modulus)
+        if blinding is None:
+            return commitment
+        return self.backend.mul_mod(
+            commitment,
+            self.backend.powmod(self.blinding_generator, blinding, self.modulus),
+            self.modulus,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare equality between this CommitmentGroup and the other object.
+
+        :param other: Object to compare with.
+        :return: Boolean stating (in)equality
+        """
+        if not isinstance(other, CommitmentGroup):
+            return False
+        return self.order == other.order and self.modulus == other.modulus
+
+
+class PolynomialCommitments(SupportsSerialization):
+    """
+    Class that keeps track of the commitments to the coefficients of a sharing polynomial.
+    """
+
+    def __init__(
+        self, group: CommitmentGroup, commitments: list[int], pedersen: bool = False
+    ) -> None:
+        """
+        Initialize the commitments to a sharing polynomial.
+
+        :param group: group in which the commitments are computed
+        :param commitments: commitment to every coefficient, starting with the constant
+            coefficient (the secret)
+        :param pedersen: whether these are Pedersen commitments, which require the shares of a
+            blinding polynomial for verification, instead of Feldman commitments
+        """
+        self.group = group
+        self.commitments = commitments
+        self.pedersen = pedersen
+        self.degree = len(commitments) - 1
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare equality between these PolynomialCommitments and the other object.
+
+        :param other: Object to compare with.
+        :return: Boolean stating (in)equality
+        """
+        if not isinstance(other, PolynomialCommitments):
+            return False
+        return (
+            self.group == other.group
+            and self.commitments == other.commitments
+            and self.pedersen == other.pedersen
+        )
+
+    class SerializedPolynomialCommitments(TypedDict):
+        """
+        Class which contains the information of the polynomial commitments from which
+        deserialization is possible.
+        """
+
+        order: int
+        group_bits: int
+        commitments: list[int]
+        pedersen: bool
+
+    def serialize(
+        self, **_kwargs: Any
+    ) -> PolynomialCommitments.SerializedPolynomialCommitments:
+        r"""
+        Serialization function for the polynomial commitments, which will be passed to the
+        communication module. Only the parameters of the group are included, such that the
+        receiver derives the group (and its generators) itself.
+
+        :param \**_kwargs: optional extra keyword arguments
+        :return: json object containing the necessary information to deserialize
+        """
+        return {
+            "order": self.group.order,
+            "group_bits": self.group.min_bit_length,
+            "commitments": self.commitments,
+            "pedersen": self.pedersen,
+        }
+
+    @staticmethod
+    def deserialize(
+        obj: PolynomialCommitments.SerializedPolynomialCommitments, **_kwargs: Any
+    ) -> PolynomialCommitments:
+        r"""
+        Deserialization function for the polynomial commitments, which will be passed to the
+        communication module.
+
+        :param obj: serialization of the polynomial commitments
+        :param \**_kwargs: optional extra keyword arguments
+        :return: Deserialized PolynomialCommitments object.
+        """
+        return PolynomialCommitments(
+            CommitmentGroup.for_order(obj["order"], obj["group_bits"]),
+            obj["commitments"],
+            obj["pedersen"],
+        )
+
+
+class VerifiableSecretSharing:
+    """
+    Class with verifiable Shamir secret sharing functionality: the dealer publishes commitments
+    to the sharing polynomials alongside the shares, against which the parties verify their
+    shares and opened secrets in batches.
+    """
+
+    def __init__(
+        self,
+        shamir_sss: ShamirSecretSharingScheme,
+        pedersen: bool = False,
+        kappa: int = DEFAULT_KAPPA,
+        group: CommitmentGroup | None = None,
+    ) -> None:
+        """
+        Initialize a verifiable secret sharing.
+
+        :param shamir_sss: scheme with which the secrets are shared
+        :param pedersen: whether to use Pedersen commitments, which hide the secrets perfectly,
+            instead of Feldman commitments
+        :param kappa: statistical security parameter of the batched verification, i.e. the bit
+            length of the random exponents
+        :param group: commitment group of the order of the modulus of the scheme, the interned
+            group with DEFAULT_GROUP_BITS bits if None
+        :raise ValueError: In case the scheme does not use the default evaluation points or the
+            order of the group differs from the modulus of the scheme.
+        """
+        _check_evaluation_points(shamir_sss)
+        self.scheme = shamir_sss
+        self.pedersen = pedersen
+        self.group = (
+            CommitmentGroup.for_order(shamir_sss.modulus) if group is None else group
+        )
+        if self.group.order != shamir_sss.modulus:
+            raise ValueError(
+                "The order of the commitment group should equal the modulus of the scheme."
+            )
+        # Random exponents are reduced modulo q, so they cannot be longer than q
+        self.kappa = min(kappa, shamir_sss.modulus.bit_length() - 1)
+
+    def share_secrets(
+        self, values: Sequence[int]
+    ) -> tuple[
+        dict[int, list[int]], dict[int, list[int]] | None, list[PolynomialCommitments]
+    ]:
+        """
+        Function that creates shares of many values at once for each party, together with the
+        commitments to the sharing polynomials.
+
+        :param values: secrets to be shared
+        :return: columnar sharing of the secrets (see ShamirSecretSharingScheme.share_secrets),
+            the columnar sharing of the blinding polynomials of Pedersen commitments (None for
+            Feldman commitments), and the commitments of every sharing
+        """
+        scheme = self.scheme
+        modulus = scheme.modulus
+        degree = scheme.polynomial_degree
+        polynomials = list(
+            zip(
+                (value % modulus for value in values),
+                *scheme.randomness.sample_matrix(modulus, degree, len(values)),
+            )
+        )
+        shares = self._evaluate(polynomials)
+        if not self.pedersen:
+            commitments = [
+                PolynomialCommitments(
+                    self.group,
+                    [self.group.commit(coefficient) for coefficient in polynomial],
+                )
+                for polynomial in polynomials
+            ]
+            return shares, None, commitments
+        blinding_polynomials = list(
+            zip(*scheme.randomness.sample_matrix(modulus, degree + 1, len(values)))
+        )
+        commitments = [
+            PolynomialCommitments(
+                self.group,
+                [
+                    self.group.commit(coefficient, blinding)
+                    for coefficient, blinding in zip(polynomial, blinding_polynomial)
+                ],
+                pedersen=True,
+            )
+            for polynomial, blinding_polynomial in zip(
+                polynomials, blinding_polynomials
+            )
+        ]
+        return shares, self._evaluate(blinding_polynomials), commitments
+
+    def share_secret(
+        self, secret: int
+    ) -> tuple[ShamirShares, ShamirShares | None, PolynomialCommitments]:
+        """
+        Function that creates shares of a value for each party, together with the commitments to
+        the sharing polynomial.
+
+        :param secret: secret to be shared
+        :return: sharing of the secret, the sharing of the blinding polynomial of Pedersen
+            commitments (None for Feldman commitments), and the commitments
+        """
+        shares, blinding_shares, (commitments,) = self.share_secrets([secret])
+        blinding_sharing = (
+            None
+            if blinding_shares is None
+            else ShamirShares(
+                self.scheme, {i: column[0] for i, column in blinding_shares.items()}
+            )
+        )
+        return (
+            ShamirShares(self.scheme, {i: column[0] for i, column in shares.items()}),
+            blinding_sharing,
+            commitments,
+        )
+
+    def _evaluate(self, polynomials: Sequence[Sequence[int]]) -> dict[int, list[int]]:
+        """
+        Evaluate polynomials in the points of all parties.
+
+        :param polynomials: coefficients of every polynomial, starting with the constant one
+        :return: columnar evaluations, mapping every party id to the evaluation of every polynomial
+        """
+        scheme = self.scheme
+        evaluations = scheme.backend.matrix_mod(
+            scheme.van_der_monde, polynomials, scheme.backend_modulus
+        )
+        return {ind + 1: column for ind, column in enumerate(evaluations)}
+
+    def _check_commitments(
+        self,
+        commitments: Sequence[PolynomialCommitments],
+        count: int,
+        blinding_shares: object,
+    ) -> None:
+        """
+        Check that the commitments match the group, the degree, the kind of commitments of this
+        verifiable secret sharing and the number of values to be verified.
+
+        :param commitments: commitments of every sharing
+        :param count: number of values to be verified per party
+        :param blinding_shares: blinding shares that are given for the verification, if any
+        :raise ValueError: In case the commitments do not match.
+        """
+        if len(commitments) != count:
+            raise ValueError(
+                "Every sharing should have exactly one set of commitments."
+            )
+        if any(
+            commitment.group != self.group
+            or commitment.pedersen != self.pedersen
+            or commitment.degree > self.scheme.polynomial_degree
+            for commitment in commitments
+        ):
+            raise ValueError(
+                "The commitments do not match the group, kind or degree of this sharing."
+            )
+        if self.pedersen == (blinding_shares is None):
+            raise ValueError(
+                "Blinding shares are required for, and only for, Pedersen commitments."
+            )
+
+    def _verify_points(
+        self,
+        points: Sequence[int],
+        shares: Sequence[Sequence[int]],
+        commitments: Sequence[PolynomialCommitments],
+        blinding_shares: Sequence[Sequence[int]] | None,
+    ) -> bool:
+        """
+        Verify evaluations of many committed polynomials in many points with a single random
+        linear combination and a single multi-exponentiation.
+
+        :param points: evaluation points
+        :param shares: for every evaluation point, the evaluation of every polynomial
+        :param commitments: commitments of every polynomial
+        :param blinding_shares: for every evaluation point, the evaluation of every blinding
+            polynomial, None for Feldman commitments
+        :raise ValueError: In case a party does not hold one share of every sharing.
+        :return: whether all evaluations are consistent with the commitments (except with
+            probability 2**-kappa)
+        """
+        group = self.group
+        order = group.order
+        count = len(commitments)
+        if any(len(column) != count for column in shares):
+            raise ValueError("Every party should hold one share of every sharing.")
+        # For every point x with random exponents rho, the check is
+        # g^(sum_j rho_j s_j) h^(sum_j rho_j r_j) = prod_{j,k} C_{j,k}^(rho_j x^k)
+        bases = []
+        exponents = []
+        share_sum = blinding_sum = 0
+        # Non-zero random exponents, such that a single failing check is always detected
+        weights = [
+            [secrets.randbelow((1 << self.kappa) - 1) + 1 for _ in range(count)]
+            for _ in points
+        ]
+        for column, rhos in zip(shares, weights):
+            share_sum += sum(rho * share for rho, share in zip(rhos, column))
+        if blinding_shares is not None:
+            for column, rhos in zip(blinding_shares, weights):
+                blinding_sum += sum(rho * share for rho, share in zip(rhos, column))
+        powers = [
+            [pow(point, k, order) for k in range(self.scheme.polynomial_degree + 1)]
+            for point in points
+        ]
+        for j, commitment in enumerate(commitments):
+            for k, element in enumerate(commitment.commitments):
+                bases.append(element)
+                exponents.append(
+                    sum(rhos[j] * power[k] for power, rhos in zip(powers, weights))
+                    % order
+                )
+        # The exponents of the commitments are short, whereas the combined share and blinding
+        # share are full-length, so the latter are committed to with the generators directly
+        combined = multi_exponentiation(bases, exponents, group.modulus, group.backend)
+        blinding = None if blinding_shares is None else blinding_sum % order
+        return combined == group.commit(share_sum % order, blinding)
+
+    def verify_shares(
+        self,
+        party_id: int,
+        shares: Sequence[int],
+        commitments: Sequence[PolynomialCommitments],
+        blinding_shares: Sequence[int] | None = None,
+    ) -> bool:
+        """
+        Verify the shares that a party received of many sharings at once.
+
+        :param party_id: id of the party
+        :param shares: share of the party of every sharing
+        :param commitments: commitments of every sharing
+        :param blinding_shares: blinding share of the party of every sharing, for Pedersen
+            commitments
+        :raise ValueError: In case the commitments or blinding shares do not match.
+        :return: whether all shares are consistent with the commitments
+        """
+        self._check_commitments(commitments, len(shares), blinding_shares)
+        if len(shares) == 1:
+            # A random linear combination does not pay off for a single share
+            return self.verify_share(
+                party_id,
+                shares[0],
+                commitments[0],
+                None if blinding_shares is None else blinding_shares[0],
+            )
+        return self._verify_points(
+            [party_id],
+            [shares],
+            commitments,
+            None if blinding_shares is None else [blinding_shares],
+        )
+
+    def verify_sharings(
+        self,
+        shares: Mapping[int, Sequence[int]],
+        commitments: Sequence[PolynomialCommitments],
+        blinding_shares: Mapping[int, Sequence[int]] | None = None,
+    ) -> bool:
+        """
+        Verify the shares of many parties of many sharings at once, e.g. a complete columnar
+        sharing as returned by share_secrets.
+
+        :param shares: mapping from party id to the share of that party of every sharing
+        :param commitments: commitments of every sharing
+        :param blinding_shares: mapping from party id to the blinding share of that party of
+            every sharing, for Pedersen commitments
+        :raise ValueError: In case the commitments or blinding shares do not match.
+        :return: whether all shares are consistent with the commitments
+        """
+        self._check_commitments(
+            commitments, len(next(iter(shares.values()), [])), blinding_shares
+        )
+        return self._verify_points(
+            list(shares),
+            list(shares.values()),
+            commitments,
+            (None if blinding_shares is None else [blinding_shares[i] for i in shares]),
+        )
+
+    def verify_secrets(
+        self,
+        values: Sequence[int],
+        commitments: Sequence[PolynomialCommitments],
+        blindings: Sequence[int] | None = None,
+    ) -> bool:
+        """
+        Verify opened secrets against the commitments to their sharings at once, i.e. verify the
+        evaluations in zero.
+
+        :param values: opened secret of every sharing
+        :param commitments: commitments of every sharing
+        :param blindings: opened constant coefficient of every blinding polynomial, for Pedersen
+            commitments
+        :raise ValueError: In case the commitments or blindings do not match.
+        :return: whether all secrets are consistent with the commitments
+        """
+        self._check_commitments(commitments, len(values), blindings)
+        return self._verify_points(
+            [0], [values], commitments, None if blindings is None else [blindings]
+        )
+
+    def verify_share(
+        self,
+        party_id: int,
+        share: int,
+        commitments: PolynomialCommitments,
+        blinding_share: int | None = None,
+    ) -> bool:
+        """
+        Verify a single share without batching, by evaluating the committed polynomial in the
+        exponent with Horner's rule. This is useful to find the invalid shares after a batched
+        verification failed.
+
+        :param party_id: id of the party
+        :param share: share of the party
+        :param commitments: commitments of the sharing
+        :param blinding_share: blinding share of the party, for Pedersen commitments
+        :raise ValueError: In case the commitments or blinding share do not match.
+        :return: whether the share is consistent with the commitments
+        """
+        self._check_commitments([commitments], 1, blinding_share)
+        group = self.group
+        backend = group.backend
+        expected = 1
+        for element in reversed(commitments.commitments):
+            expected = backend.mul_mod(
+                backend.powmod(expected, party_id, group.modulus),
+                element,
+                group.modulus,
+            )
+        if blinding_share is not None:
+            blinding_share %= group.order
+        return group.commit(share % group.order, blinding_share) == expected
+
+
+if COMMUNICATION_INSTALLED:
+    try:
+        Serialization.register_class(PolynomialCommitments)
+    except RepetitionError:
+        pass
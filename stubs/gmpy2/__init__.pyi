@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+def mpz(n: int = ...) -> int: ...
+def powmod(x: int, y: int, m: int) -> int: ...
+def invert(x: int, m: int) -> int: ...